@@ -0,0 +1,101 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from datetime import datetime, timezone
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+from celerity.coordinates import (
+    convert_ecliptic_coordinates_to_equatorial,
+    convert_equatorial_coordinates_to_ecliptic,
+    convert_equatorial_coordinates_to_galactic,
+    convert_equatorial_to_galactic,
+    convert_galactic_coordinates_to_equatorial,
+)
+
+# **************************************************************************************
+
+# The number of rows in the benchmark catalog:
+N = 1_000_000
+
+# **************************************************************************************
+
+
+def benchmark(name: str, f: Callable[[], object]) -> None:
+    start = perf_counter()
+
+    f()
+
+    elapsed = perf_counter() - start
+
+    print(
+        f"{name:<40} {elapsed:>8.3f} s  {N / elapsed / 1e6:>6.2f} M rows/s  "
+        f"{elapsed / N * 1e9:>8.1f} ns/row"
+    )
+
+
+# **************************************************************************************
+
+
+def main() -> None:
+    date = datetime(2025, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    random = Random(42)
+
+    # Generate a catalog of sources, uniformly distributed in right ascension:
+    ra = array("d", (random.uniform(0, 360) for _ in range(N)))
+
+    dec = array("d", (random.uniform(-90, 90) for _ in range(N)))
+
+    # Preallocate the output buffers, such that they are reused by every benchmark:
+    longitude, latitude = array("d", bytes(8 * N)), array("d", bytes(8 * N))
+
+    benchmark(
+        "scalar equatorial → galactic",
+        lambda: [
+            convert_equatorial_to_galactic({"ra": α, "dec": δ}) for α, δ in zip(ra, dec)
+        ],
+    )
+
+    benchmark(
+        "batch equatorial → galactic",
+        lambda: convert_equatorial_coordinates_to_galactic(
+            ra, dec, longitude, latitude
+        ),
+    )
+
+    benchmark(
+        "batch galactic → equatorial",
+        lambda: convert_galactic_coordinates_to_equatorial(
+            longitude, latitude, ra, dec
+        ),
+    )
+
+    benchmark(
+        "batch equatorial → ecliptic",
+        lambda: convert_equatorial_coordinates_to_ecliptic(
+            date, ra, dec, longitude, latitude
+        ),
+    )
+
+    benchmark(
+        "batch ecliptic → equatorial",
+        lambda: convert_ecliptic_coordinates_to_equatorial(
+            date, longitude, latitude, ra, dec
+        ),
+    )
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    main()
+
+# **************************************************************************************
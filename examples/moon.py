@@ -0,0 +1,87 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timedelta, timezone
+from math import acos, cos, degrees, radians, sin
+from time import perf_counter
+from typing import Callable, List
+
+from celerity.common import EquatorialCoordinate
+from celerity.elp2000 import get_elp2000_equatorial_coordinate, get_elp2000_series
+from celerity.moon import get_equatorial_coordinate
+
+# **************************************************************************************
+
+
+def get_angular_separation(a: EquatorialCoordinate, b: EquatorialCoordinate) -> float:
+    """
+    Gets the angular separation (in arcseconds) between two equatorial coordinates.
+    """
+    cosθ = sin(radians(a["dec"])) * sin(radians(b["dec"])) + cos(
+        radians(a["dec"])
+    ) * cos(radians(b["dec"])) * cos(radians(a["ra"] - b["ra"]))
+
+    return degrees(acos(max(-1.0, min(1.0, cosθ)))) * 3600
+
+
+# **************************************************************************************
+
+
+def benchmark(
+    name: str,
+    f: Callable[[datetime], EquatorialCoordinate],
+    dates: List[datetime],
+    reference: List[EquatorialCoordinate],
+) -> None:
+    start = perf_counter()
+
+    coordinates = [f(date) for date in dates]
+
+    elapsed = (perf_counter() - start) / len(dates) * 1e6
+
+    errors = sorted(
+        get_angular_separation(a, b) for a, b in zip(coordinates, reference)
+    )
+
+    print(
+        f"{name:<24} {elapsed:>8.1f} µs/call  "
+        f"median {errors[len(errors) // 2]:>8.1f}″  max {errors[-1]:>8.1f}″"
+    )
+
+
+# **************************************************************************************
+
+
+def main() -> None:
+    start = datetime(2025, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    # Sample the Moon every ~7 hours over a year, such that no epoch is repeated:
+    dates = [start + timedelta(minutes=419 * i) for i in range(1250)]
+
+    # The full (60 + 60 term) ELP-2000/82 series is taken as the reference:
+    reference = [get_elp2000_equatorial_coordinate(date) for date in dates]
+
+    benchmark("celerity.moon", get_equatorial_coordinate, dates, reference)
+
+    for precision in (0.0, 0.0005, 0.001, 0.005, 0.01):
+        lr, b = get_elp2000_series(precision)
+
+        benchmark(
+            f"elp2000 ({len(lr.sines)}+{len(b.sines)} terms)",
+            lambda date: get_elp2000_equatorial_coordinate(date, precision),
+            dates,
+            reference,
+        )
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    main()
+
+# **************************************************************************************
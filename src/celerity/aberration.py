@@ -8,67 +8,70 @@
 
 from datetime import datetime
 from math import cos, pow, radians, sin, tan
+from typing import NamedTuple, Tuple
 
-from .astrometry import get_obliquity_of_the_ecliptic
 from .common import EquatorialCoordinate
 from .earth import get_eccentricity_of_orbit
-from .moon import (
-    get_mean_ecliptic_longitude_of_the_ascending_node as get_lunar_mean_ecliptic_longitude_of_the_ascending_node,
-)
-from .moon import get_mean_geometric_longitude as get_lunar_mean_geometric_longitude
-from .sun import get_mean_geometric_longitude as get_solar_mean_geometric_longitude
+from .fundamentals import get_fundamental_arguments
 from .sun import get_true_geometric_longitude as get_solar_true_geometric_longitude
-from .temporal import get_julian_date
 
 # **************************************************************************************
 
 
-def get_correction_to_equatorial_for_aberration(
-    date: datetime,
-    target: EquatorialCoordinate,
-) -> EquatorialCoordinate:
+class AberrationTerms(NamedTuple):
     """
-    Corrects the equatorial coordinates of a target for abberation in
-    longitude and obliquity due to the apparent motion of the Earth.
-
-    :param date: The datetime object to convert.
-    :param longitude: The longitude of the observer in degrees.
-    :param target: The equatorial coordinates of the target.
+    The epoch-dependent terms of the correction for aberration, which are shared by
+    every target at the same epoch.
+
+    :property κ: The constant of aberration (in degrees).
+    :property e: The eccentricity of the Earth's orbit (dimensionless).
+    :property cosε: The cosine of the true obliquity of the ecliptic.
+    :property tanε: The tangent of the true obliquity of the ecliptic.
+    :property cosS: The cosine of the true geometric longitude of the Sun.
+    :property sinS: The sine of the true geometric longitude of the Sun.
+    :property cosϖ: The cosine of the longitude of perihelion.
+    :property sinϖ: The sine of the longitude of perihelion.
     """
-    ra, dec = radians(target["ra"]), radians(target["dec"])
 
-    # Get the Julian date:
-    JD = get_julian_date(date)
+    κ: float
 
-    # Get the difference in fractional Julian centuries between the target
-    # date and J2000.0
-    T = (JD - 2451545.0) / 36525
+    e: float
 
-    # Get the ecliptic longitude of the ascending node of the mode (in degrees):
-    Ω = get_lunar_mean_ecliptic_longitude_of_the_ascending_node(date)
+    cosε: float
 
-    # Get the mean geometric longitude of the sun (in degrees):
-    L = get_solar_mean_geometric_longitude(date)
+    tanε: float
 
-    # Get the mean geometric longitude of the moon (in degrees):
-    longitude = get_lunar_mean_geometric_longitude(date)
+    cosS: float
 
-    # Get the nutation in obliquity (in degrees):
-    Δε = (
-        9.2 * cos(radians(Ω))
-        + 0.57 * cos(radians(2 * L))
-        + 0.1 * cos(radians(2 * longitude ))
-        - 0.09 * cos(radians(2 * Ω))
-    ) / 3600
+    sinS: float
 
-    # Get the true obliquity of the ecliptic (in degrees):
-    ε = radians(get_obliquity_of_the_ecliptic(date) + Δε)
+    cosϖ: float
+
+    sinϖ: float
 
-    # Get the constant of abberation (in degrees):
-    κ = 20.49552 / 3600
 
-    # Get the eccentricity of the Earth's orbit (dimensionless):
-    e = get_eccentricity_of_orbit(date)
+# **************************************************************************************
+
+
+def get_aberration_terms(date: datetime) -> AberrationTerms:
+    """
+    Gets the epoch-dependent terms of the correction for aberration.
+
+    :param date: The datetime object to convert.
+    :return: The terms of the correction for aberration at the epoch.
+    """
+    # Get the fundamental arguments at the epoch:
+    arguments = get_fundamental_arguments(date)
+
+    # Get the difference in fractional Julian centuries between the target
+    # date and J2000.0
+    T = arguments.T
+
+    # Get the nutation in obliquity (in degrees):
+    Δε = arguments.Δε / 3600
+
+    # Get the true obliquity of the ecliptic (in degrees):
+    ε = radians(arguments.ε + Δε)
 
     # Get the longitude of perihelion (in degrees):
     ϖ = radians(102.93735 + 1.71953 * T + 0.00046 * pow(T, 2))
@@ -76,18 +79,73 @@ def get_correction_to_equatorial_for_aberration(
     # Get the true geometric longitude of the sun (in degrees):
     S = radians(get_solar_true_geometric_longitude(date))
 
+    return AberrationTerms(
+        # Get the constant of abberation (in degrees):
+        κ=20.49552 / 3600,
+        # Get the eccentricity of the Earth's orbit (dimensionless):
+        e=get_eccentricity_of_orbit(date),
+        cosε=cos(ε),
+        tanε=tan(ε),
+        cosS=cos(S),
+        sinS=sin(S),
+        cosϖ=cos(ϖ),
+        sinϖ=sin(ϖ),
+    )
+
+
+# **************************************************************************************
+
+
+def get_correction_for_aberration(
+    ra: float, dec: float, terms: AberrationTerms
+) -> Tuple[float, float]:
+    """
+    Gets the correction for aberration to the equatorial coordinate of a single
+    target, from the precomputed terms at the epoch.
+
+    :param ra: The right ascension of the target (in degrees).
+    :param dec: The declination of the target (in degrees).
+    :param terms: The terms of the correction for aberration at the epoch.
+    :return: The corrections to the right ascension and declination (in degrees).
+    """
+    ra, dec = radians(ra), radians(dec)
+
+    κ, e, cosε, tanε, cosS, sinS, cosϖ, sinϖ = terms
+
     # Calculate the abberation correction in right ascension (in degrees):
-    Δra = -κ * (cos(ra) * cos(S) * cos(ε) + sin(ra) * sin(S) / cos(dec)) + e * κ * (
-        cos(ra) * cos(ϖ) * cos(ε) + sin(ra) * sin(ϖ) / cos(dec)
+    Δra = -κ * (cos(ra) * cosS * cosε + sin(ra) * sinS / cos(dec)) + e * κ * (
+        cos(ra) * cosϖ * cosε + sin(ra) * sinϖ / cos(dec)
     )
 
     # Calculate the abberation correction in declination (in degrees):
     Δdec = -κ * (
-        (cos(S) * cos(ε) * (tan(ε) * cos(dec) - sin(ra) * sin(dec)))
-        + (cos(ra) * sin(dec) * sin(S))
+        (cosS * cosε * (tanε * cos(dec) - sin(ra) * sin(dec)))
+        + (cos(ra) * sin(dec) * sinS)
     ) + e * κ * (
-        (cos(ϖ) * cos(ε) * (tan(ε) * cos(dec) - sin(ra) * sin(dec)))
-        + (cos(ra) * sin(dec) * sin(ϖ))
+        (cosϖ * cosε * (tanε * cos(dec) - sin(ra) * sin(dec)))
+        + (cos(ra) * sin(dec) * sinϖ)
+    )
+
+    return Δra, Δdec
+
+
+# **************************************************************************************
+
+
+def get_correction_to_equatorial_for_aberration(
+    date: datetime,
+    target: EquatorialCoordinate,
+) -> EquatorialCoordinate:
+    """
+    Corrects the equatorial coordinates of a target for abberation in
+    longitude and obliquity due to the apparent motion of the Earth.
+
+    :param date: The datetime object to convert.
+    :param longitude: The longitude of the observer in degrees.
+    :param target: The equatorial coordinates of the target.
+    """
+    Δra, Δdec = get_correction_for_aberration(
+        target["ra"], target["dec"], get_aberration_terms(date)
     )
 
     return {"ra": Δra, "dec": Δdec}
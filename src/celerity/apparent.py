@@ -0,0 +1,212 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from math import asin, atan2, cos, degrees, pow, radians, sin, sqrt
+from typing import Optional, Sequence
+
+from .buffers import get_writable_float64_view
+from .common import (
+    EquatorialArray,
+    EquatorialCatalog,
+    EquatorialCoordinate,
+    get_coordinate_columns,
+)
+from .earth import get_eccentricity_of_orbit
+from .fundamentals import get_fundamental_arguments
+from .matrix import (
+    Matrix3,
+    Vector3,
+    apply_matrix,
+    convert_spherical_to_unit_vector,
+    convert_vector_to_spherical,
+)
+from .memoise import memoise_by_epoch
+from .precession import get_precession_nutation_matrix
+from .sun import get_solar_state
+
+# **************************************************************************************
+
+# The constant of aberration (in radians):
+κ = radians(20.49552 / 3600)
+
+# **************************************************************************************
+
+
+@dataclass(frozen=True)
+class ApparentPlaceTransform:
+    """
+    The epoch-dependent quantities required to transform a J2000.0 (mean) equatorial
+    coordinate to the apparent equatorial coordinate of date.
+
+    :property matrix: The combined bias-precession-nutation matrix, N · P · B.
+    :property velocity: The Earth's velocity (in units of c), referred to the true
+        equator and equinox of date, for the correction for annual aberration.
+    """
+
+    matrix: Matrix3
+
+    velocity: Vector3
+
+    def apply(self, target: EquatorialCoordinate) -> EquatorialCoordinate:
+        """
+        Transforms a single J2000.0 equatorial coordinate to its apparent place.
+
+        :param target: The equatorial J2000.0 coordinate of the target.
+        :return: The apparent equatorial coordinate of the target.
+        """
+        x, y, z = apply_matrix(
+            self.matrix, convert_spherical_to_unit_vector(target["ra"], target["dec"])
+        )
+
+        vx, vy, vz = self.velocity
+
+        # Apply the correction for annual aberration, to first order in v/c:
+        ra, dec = convert_vector_to_spherical((x + vx, y + vy, z + vz))
+
+        return {"ra": ra, "dec": dec}
+
+
+# **************************************************************************************
+
+
+@memoise_by_epoch(enabled=False)
+@lru_cache(maxsize=32)
+def get_apparent_place_transform(date: datetime) -> ApparentPlaceTransform:
+    """
+    Gets the apparent place transform for a particular epoch, which is computed
+    once and then shared by every target transformed at that epoch.
+
+    :param date: The datetime object to convert.
+    :return: The apparent place transform at the given epoch.
+    """
+    arguments = get_fundamental_arguments(date)
+
+    T = arguments.T
+
+    # Get the true obliquity of the ecliptic (in radians):
+    ε = radians(arguments.ε + arguments.Δε / 3600)
+
+    # Get the eccentricity of the Earth's orbit (dimensionless):
+    e = get_eccentricity_of_orbit(date)
+
+    # Get the longitude of perihelion (in radians):
+    ϖ = radians(102.93735 + 1.71953 * T + 0.00046 * pow(T, 2))
+
+    # Get the true geometric longitude of the Sun (in radians):
+    S = radians(get_solar_state(date).true_geometric_longitude)
+
+    # Get the Earth's velocity (in units of c) in the ecliptic frame of date, which
+    # is perpendicular to the direction of the Sun:
+    vx = κ * (sin(S) - e * sin(ϖ))
+
+    vy = -κ * (cos(S) - e * cos(ϖ))
+
+    return ApparentPlaceTransform(
+        # Get the IAU 2006/2000B bias-precession-nutation matrix:
+        matrix=get_precession_nutation_matrix(date),
+        # Rotate the velocity from the ecliptic to the true equator of date:
+        velocity=(vx, vy * cos(ε), vy * sin(ε)),
+    )
+
+
+# **************************************************************************************
+
+
+def get_apparent_place(
+    date: datetime, target: EquatorialCoordinate
+) -> EquatorialCoordinate:
+    """
+    Gets the apparent place of a target, corrected for precession, nutation and
+    annual aberration, using a rotation matrix built once per epoch.
+
+    Unlike coordinates.get_correction_to_equatorial, the target is not mutated.
+
+    :param date: The datetime object to convert.
+    :param target: The equatorial J2000.0 coordinate of the target.
+    :return: The apparent equatorial coordinate of the target.
+    """
+    return get_apparent_place_transform(date).apply(target)
+
+
+# **************************************************************************************
+
+
+def get_apparent_places(
+    date: datetime,
+    ra: EquatorialCatalog,
+    dec: Optional[Sequence[float]] = None,
+    out: Optional[EquatorialArray] = None,
+) -> EquatorialArray:
+    """
+    Gets the apparent places of a catalog of targets, corrected for precession,
+    nutation and annual aberration.
+
+    The epoch-dependent work is performed once, such that each target costs a single
+    matrix-vector product, i.e., O(epoch + N) rather than O(N × epoch).
+
+    :param date: The datetime object to convert.
+    :param ra: The J2000.0 right ascensions of the targets (in degrees), or the
+        targets as an EquatorialArray or a sequence of equatorial coordinates.
+    :param dec: The J2000.0 declinations of the targets (in degrees), if ra is a
+        column of right ascensions.
+    :param out: Optional output buffers for the apparent right ascensions and
+        declinations, e.g., array('d') or NumPy arrays, of at least the same length
+        as ra, which may be the input columns themselves to transform them in place.
+    :return: The apparent right ascensions and declinations (in degrees).
+    """
+    α, δ = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+    if len(α) != len(δ):
+        raise ValueError("ra and dec must be of the same length")
+
+    if out is None:
+        out = EquatorialArray(
+            array("d", bytes(8 * len(α))), array("d", bytes(8 * len(δ)))
+        )
+
+    # Write through zero-copy views of the output buffers, e.g., NumPy arrays:
+    ras, decs = get_writable_float64_view(out.ra), get_writable_float64_view(out.dec)
+
+    if len(ras) < len(α) or len(decs) < len(δ):
+        raise ValueError("out must be at least as long as ra and dec")
+
+    transform = get_apparent_place_transform(date)
+
+    # Unpack the matrix and velocity into locals for the tight loop below:
+    (a, b, c), (d, e, f), (g, h, i) = transform.matrix
+
+    vx, vy, vz = transform.velocity
+
+    for n, (λ, φ) in enumerate(zip(α, δ)):
+        λ, φ = radians(λ), radians(φ)
+
+        cosφ = cos(φ)
+
+        u, v, w = cosφ * cos(λ), cosφ * sin(λ), sin(φ)
+
+        x = a * u + b * v + c * w + vx
+
+        y = d * u + e * v + f * w + vy
+
+        z = g * u + h * v + i * w + vz
+
+        λ = degrees(atan2(y, x)) % 360
+
+        # A tiny negative angle is rounded up to exactly 360 by the modulo:
+        ras[n] = λ if λ < 360 else 0.0
+
+        decs[n] = degrees(asin(max(-1.0, min(1.0, z / sqrt(x * x + y * y + z * z)))))
+
+    return out
+
+
+# **************************************************************************************
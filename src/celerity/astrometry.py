@@ -17,6 +17,7 @@ from .common import (
     is_equatorial_coordinate,
     is_horizontal_coordinate,
 )
+from .memoise import memoise_by_epoch
 from .temporal import get_julian_date, get_local_sidereal_time
 
 # **************************************************************************************
@@ -112,6 +113,7 @@ def get_hour_angle(date: datetime, ra: float, longitude: float) -> float:
 # **************************************************************************************
 
 
+@memoise_by_epoch(enabled=False)
 def get_obliquity_of_the_ecliptic(date: datetime) -> float:
     """
     Gets the obliquity of the ecliptic for a particular datetime
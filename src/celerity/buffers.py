@@ -0,0 +1,122 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from sys import byteorder
+from typing import Any, MutableSequence, Optional, Sequence, Tuple, cast
+
+# **************************************************************************************
+
+# The struct formats of a float64 in the native byte order, as reported by the buffer
+# protocol, e.g., "d" for an array('d') and "<d" for a NumPy float64 array:
+FLOAT64_FORMATS = frozenset(("d", "@d", "=d", "<d" if byteorder == "little" else ">d"))
+
+# **************************************************************************************
+
+
+def _get_float64_memoryview(x: Any, writable: bool) -> Optional[Sequence[float]]:
+    try:
+        view = memoryview(x)
+    except TypeError:
+        return None
+
+    if view.format not in FLOAT64_FORMATS or not view.c_contiguous:
+        return None
+
+    if writable and view.readonly:
+        return None
+
+    # A one-dimensional native float64 buffer can be indexed directly, otherwise
+    # cast via bytes to a flat native float64 view (which shares the same memory):
+    if view.ndim == 1 and view.format == "d":
+        return view
+
+    return view.cast("B").cast("d")
+
+
+# **************************************************************************************
+
+
+def get_float64_view(x: Sequence[float]) -> Sequence[float]:
+    """
+    Gets a zero-copy view of a column of floats, e.g., a NumPy float64 array or a
+    memoryview, which can be indexed as a flat sequence of Python floats.
+
+    Any C-contiguous object which supports the buffer protocol with a native float64
+    format is viewed without copying, where multidimensional buffers are flattened in
+    row-major order. Any other column, e.g., a list or an array('d'), is returned as is.
+
+    :param x: The column of floats.
+    :return: The zero-copy view of the column, or the column itself.
+    """
+    if isinstance(x, (array, list, tuple)):
+        return x
+
+    view = _get_float64_memoryview(x, writable=False)
+
+    return x if view is None else view
+
+
+# **************************************************************************************
+
+
+def get_writable_float64_view(x: MutableSequence[float]) -> MutableSequence[float]:
+    """
+    Gets a zero-copy writable view of an output buffer, e.g., a NumPy float64 array
+    or a memoryview, which can be assigned Python floats element by element.
+
+    Any writable C-contiguous object which supports the buffer protocol with a native
+    float64 format is viewed without copying, where multidimensional buffers are
+    flattened in row-major order. Any other buffer, e.g., a list or an array('d'), is
+    returned as is.
+
+    :param x: The output buffer.
+    :return: The zero-copy writable view of the output buffer, or the buffer itself.
+    """
+    if isinstance(x, (array, list)):
+        return x
+
+    view = _get_float64_memoryview(x, writable=True)
+
+    return x if view is None else cast(MutableSequence[float], view)
+
+
+# **************************************************************************************
+
+
+def get_float64_column_pair(
+    x: Any,
+) -> Optional[Tuple[Sequence[float], Sequence[float]]]:
+    """
+    Gets zero-copy views of the two columns of an N × 2 float64 buffer, e.g., a NumPy
+    array of shape (N, 2) where each row is a coordinate pair.
+
+    :param x: The N × 2 buffer.
+    :return: The zero-copy strided views of the first and second columns, or None if
+        x is not a C-contiguous N × 2 native float64 buffer.
+    """
+    if isinstance(x, (array, list, tuple)):
+        return None
+
+    try:
+        shape = memoryview(x).shape
+    except TypeError:
+        return None
+
+    if shape is None or len(shape) != 2 or shape[1] != 2:
+        return None
+
+    view = _get_float64_memoryview(x, writable=False)
+
+    if view is None:
+        return None
+
+    return view[0::2], view[1::2]
+
+
+# **************************************************************************************
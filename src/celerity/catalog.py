@@ -0,0 +1,145 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import MutableSequence, NamedTuple, Optional, Sequence, Tuple, Union, cast
+
+from .common import (
+    EquatorialArray,
+    EquatorialCatalog,
+    GeographicCoordinate,
+    get_coordinate_columns,
+)
+from .horizon import HorizonMask
+
+# **************************************************************************************
+
+
+class VisibilityBands(NamedTuple):
+    """
+    The positions of the targets of a DeclinationIndex by their visibility for an
+    observer, where each is a contiguous band of declination.
+
+    The circumpolar and never visible targets may each lie in a band at either end
+    of the index, i.e., toward the southern or northern celestial pole, and so are
+    given as a (southern, northern) pair of ranges, either of which may be empty.
+    """
+
+    circumpolar: Tuple[range, range]
+
+    never_visible: Tuple[range, range]
+
+    rises_and_sets: range
+
+
+# **************************************************************************************
+
+
+class DeclinationIndex:
+    """
+    A catalog of targets sorted by declination, such that the targets which are
+    circumpolar, never visible, or which rise and set, for an observer at any
+    latitude can be sliced out by bisection in O(log N), e.g., to prune a catalog
+    per site before any per-target computation.
+
+    :property ra: The right ascensions of the targets, in order of declination.
+    :property dec: The declinations of the targets, in ascending order.
+    :property indices: The position of each target in the original catalog.
+    """
+
+    __slots__ = ("ra", "dec", "indices")
+
+    def __init__(
+        self, ra: EquatorialCatalog, dec: Optional[Sequence[float]] = None
+    ) -> None:
+        ras, decs = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+        if len(ras) != len(decs):
+            raise ValueError("ra and dec must be of the same length")
+
+        order = sorted(range(len(decs)), key=decs.__getitem__)
+
+        self.ra = array("d", (ras[i] for i in order))
+
+        self.dec = array("d", (decs[i] for i in order))
+
+        self.indices = array("q", order)
+
+    def __len__(self) -> int:
+        return len(self.dec)
+
+    def get_visibility_bands(
+        self,
+        observer: GeographicCoordinate,
+        horizon: Union[float, HorizonMask] = 0,
+    ) -> VisibilityBands:
+        """
+        Gets the positions of the targets which are circumpolar (whose lower
+        culmination is above the horizon), never visible (whose upper culmination is
+        below the horizon), or which rise and set, for an observer.
+
+        For a horizon mask, the classification is conservative: targets are only
+        circumpolar if always above its highest point, and only never visible if
+        always below its lowest point, with all other targets rising and setting.
+
+        :param observer: The geographic coordinate of the observer.
+        :param horizon: The observer's horizon (in degrees), or a horizon mask.
+        :return: The positions of the targets by their visibility.
+        """
+        φ = observer["latitude"]
+
+        if isinstance(horizon, HorizonMask):
+            upper, lower = horizon.maximum, horizon.minimum
+        else:
+            upper, lower = horizon, horizon
+
+        n = len(self.dec)
+
+        # The altitude at lower culmination is |φ + δ| - 90, so targets are
+        # circumpolar beyond these declinations:
+        south = bisect_left(self.dec, -90 - φ - upper)
+
+        north = bisect_right(self.dec, 90 - φ + upper)
+
+        # The altitude at upper culmination is 90 - |φ - δ|, so targets are never
+        # visible beyond these declinations:
+        below = bisect_left(self.dec, φ - 90 + lower)
+
+        above = bisect_right(self.dec, φ + 90 - lower)
+
+        # A target cannot be both circumpolar and never visible, so at most one of
+        # the bands at each end of the index is non-empty:
+        start, stop = max(south, below), min(north, above)
+
+        return VisibilityBands(
+            circumpolar=(range(0, south), range(north, n)),
+            never_visible=(range(0, below), range(above, n)),
+            rises_and_sets=range(start, max(start, stop)),
+        )
+
+    def get_targets(self, positions: range) -> EquatorialArray:
+        """
+        Gets the targets at a contiguous range of positions in the index, e.g., a
+        band of VisibilityBands, as zero-copy views of the sorted columns.
+
+        :param positions: The contiguous range of positions.
+        :return: The right ascensions and declinations of the targets.
+        """
+        if positions.step != 1:
+            raise ValueError("positions must be a contiguous range")
+
+        s = slice(positions.start, positions.stop)
+
+        return EquatorialArray(
+            cast(MutableSequence[float], memoryview(self.ra)[s]),
+            cast(MutableSequence[float], memoryview(self.dec)[s]),
+        )
+
+
+# **************************************************************************************
@@ -6,9 +6,24 @@
 
 # **************************************************************************************
 
+from array import array
 from enum import Enum
 from math import cos, pow, radians
-from typing import Any, NotRequired, TypedDict
+from typing import (
+    Any,
+    Iterable,
+    MutableSequence,
+    NamedTuple,
+    NotRequired,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
+
+from .buffers import get_float64_column_pair, get_float64_view
 
 # **************************************************************************************
 
@@ -72,6 +87,20 @@ class HorizontalCoordinate(TypedDict):
 # **************************************************************************************
 
 
+class EclipticCoordinate(TypedDict):
+    λ: float
+    β: float
+
+
+# **************************************************************************************
+
+# The galactic longitude (l) and latitude (b), declared functionally as "l" is an
+# ambiguous attribute name:
+GalacticCoordinate = TypedDict("GalacticCoordinate", {"l": float, "b": float})
+
+# **************************************************************************************
+
+
 class CartesianCoordinate(TypedDict):
     x: float
     y: float
@@ -97,6 +126,15 @@ class HeliocentricSphericalCoordinate(TypedDict):
 # **************************************************************************************
 
 
+class GeocentricSphericalCoordinate(TypedDict):
+    λ: float
+    β: float
+    r: float
+
+
+# **************************************************************************************
+
+
 class SphericalCoordinate(TypedDict):
     φ: float
     θ: float
@@ -121,12 +159,225 @@ class Measurement(TypedDict):
 # **************************************************************************************
 
 
+class Equatorial(NamedTuple):
+    """
+    A lightweight, immutable, equivalent of EquatorialCoordinate.
+    """
+
+    ra: float
+    dec: float
+
+
+# **************************************************************************************
+
+
+class Horizontal(NamedTuple):
+    """
+    A lightweight, immutable, equivalent of HorizontalCoordinate.
+    """
+
+    alt: float
+    az: float
+
+
+# **************************************************************************************
+
+
+class Ecliptic(NamedTuple):
+    """
+    A lightweight, immutable, equivalent of EclipticCoordinate.
+    """
+
+    λ: float
+    β: float
+
+
+# **************************************************************************************
+
+# A lightweight, immutable, equivalent of GalacticCoordinate:
+Galactic = NamedTuple("Galactic", [("l", float), ("b", float)])
+
+# **************************************************************************************
+
+
+class EquatorialArray(NamedTuple):
+    """
+    A columnar (struct-of-arrays) catalog of equatorial coordinates, where the n-th
+    coordinate is (ra[n], dec[n]), e.g., as returned by the batch conversions.
+    """
+
+    ra: MutableSequence[float]
+    dec: MutableSequence[float]
+
+
+# **************************************************************************************
+
+
+class HorizontalArray(NamedTuple):
+    """
+    A columnar (struct-of-arrays) catalog of horizontal coordinates, where the n-th
+    coordinate is (alt[n], az[n]).
+    """
+
+    alt: MutableSequence[float]
+    az: MutableSequence[float]
+
+
+# **************************************************************************************
+
+
+class EclipticArray(NamedTuple):
+    """
+    A columnar (struct-of-arrays) catalog of ecliptic coordinates, where the n-th
+    coordinate is (λ[n], β[n]).
+    """
+
+    λ: MutableSequence[float]
+    β: MutableSequence[float]
+
+
+# **************************************************************************************
+
+# A columnar (struct-of-arrays) catalog of galactic coordinates, where the n-th
+# coordinate is (l[n], b[n]):
+GalacticArray = NamedTuple(
+    "GalacticArray", [("l", MutableSequence[float]), ("b", MutableSequence[float])]
+)
+
+# **************************************************************************************
+
+# Any columnar catalog of coordinates:
+CoordinateArray = Union[EquatorialArray, HorizontalArray, EclipticArray, GalacticArray]
+
+# **************************************************************************************
+
+# A catalog of equatorial coordinates, given as a column of right ascensions (with
+# the declinations given separately), an EquatorialArray, or a sequence of either
+# EquatorialCoordinate or Equatorial:
+EquatorialCatalog = Union[
+    Sequence[float],
+    EquatorialArray,
+    Iterable[EquatorialCoordinate],
+    Iterable[Equatorial],
+]
+
+# **************************************************************************************
+
+# A catalog of ecliptic coordinates, as for EquatorialCatalog:
+EclipticCatalog = Union[
+    Sequence[float], EclipticArray, Iterable[EclipticCoordinate], Iterable[Ecliptic]
+]
+
+# **************************************************************************************
+
+# A catalog of galactic coordinates, as for EquatorialCatalog:
+GalacticCatalog = Union[
+    Sequence[float], GalacticArray, Iterable[GalacticCoordinate], Iterable[Galactic]
+]
+
+# **************************************************************************************
+
+
+def get_coordinate_columns(
+    x: Union[Sequence[float], CoordinateArray, Iterable[Any]],
+    y: Optional[Sequence[float]],
+    keys: Tuple[str, str],
+) -> Tuple[Sequence[float], Sequence[float]]:
+    """
+    Gets the two columns of a catalog of coordinates, which may be given as a pair of
+    columns, a columnar catalog (e.g., an EquatorialArray), an N × 2 float64 buffer,
+    or a sequence of either TypedDict coordinates (e.g., EquatorialCoordinate) or their
+    NamedTuple equivalents (e.g., Equatorial).
+
+    Columns which support the buffer protocol with a float64 format, e.g., NumPy
+    arrays or memoryviews, are viewed without copying (see get_float64_view).
+
+    :param x: The first column, a columnar catalog, or a sequence of coordinates.
+    :param y: The second column, or None if x is not a column.
+    :param keys: The keys of the columns in a TypedDict coordinate, e.g., ("ra", "dec").
+    :return: The two columns of the catalog.
+    :raises ValueError: If y is None and x is not a columnar catalog, nor a sequence
+        of coordinates (i.e., dicts or pairs of numbers), e.g., a pair of columns.
+    """
+    if y is not None:
+        return get_float64_view(cast(Sequence[float], x)), get_float64_view(y)
+
+    if isinstance(x, (EquatorialArray, HorizontalArray, EclipticArray, GalacticArray)):
+        return get_float64_view(x[0]), get_float64_view(x[1])
+
+    # An N × 2 float64 buffer, e.g., a NumPy array of coordinate pairs, is viewed
+    # column by column without copying:
+    columns = get_float64_column_pair(x)
+
+    if columns is not None:
+        return columns
+
+    a, b = keys
+
+    coordinates = list(x)
+
+    # Reject anything which is not a coordinate, e.g., a bare column whose second
+    # column was omitted, or a (ra, dec) pair of columns, which would otherwise be
+    # silently misread as coordinates:
+    for c in coordinates:
+        if isinstance(c, dict):
+            continue
+
+        if (
+            isinstance(c, tuple)
+            and len(c) == 2
+            and all(isinstance(v, (int, float)) for v in c)
+        ):
+            continue
+
+        raise ValueError(
+            f"expected a sequence of coordinates, e.g., dicts with {a!r} and {b!r} "
+            f"keys or ({a}, {b}) tuples, but got an element of {c!r}; pass columns "
+            f"as separate {a} and {b} arguments"
+        )
+
+    return (
+        array(
+            "d",
+            (c[a] if isinstance(c, dict) else c[0] for c in coordinates),
+        ),
+        array(
+            "d",
+            (c[b] if isinstance(c, dict) else c[1] for c in coordinates),
+        ),
+    )
+
+
+# **************************************************************************************
+
+
+def get_equatorial_array(
+    coordinates: Iterable[Union[EquatorialCoordinate, Equatorial]],
+) -> EquatorialArray:
+    """
+    Gets a columnar catalog from a sequence of equatorial coordinates.
+
+    :param coordinates: The equatorial coordinates, as TypedDicts or NamedTuples.
+    :return: The columnar catalog, backed by two array('d').
+    """
+    ra, dec = get_coordinate_columns(coordinates, None, ("ra", "dec"))
+
+    return EquatorialArray(array("d", ra), array("d", dec))
+
+
+# **************************************************************************************
+
+
 def is_equatorial_coordinate(coordinate: Any) -> EquatorialCoordinate | None:
+    if isinstance(coordinate, Equatorial):
+        return {"ra": coordinate.ra, "dec": coordinate.dec}
+
     if not isinstance(coordinate, dict):
         return None
 
+    # The coordinate is narrowed in place, rather than copied into a new dict:
     return (
-        EquatorialCoordinate({"ra": coordinate["ra"], "dec": coordinate["dec"]})
+        cast(EquatorialCoordinate, coordinate)
         if "ra" in coordinate and "dec" in coordinate
         else None
     )
@@ -136,11 +387,15 @@ def is_equatorial_coordinate(coordinate: Any) -> EquatorialCoordinate | None:
 
 
 def is_horizontal_coordinate(coordinate: Any) -> HorizontalCoordinate | None:
+    if isinstance(coordinate, Horizontal):
+        return {"alt": coordinate.alt, "az": coordinate.az}
+
     if not isinstance(coordinate, dict):
         return None
 
+    # The coordinate is narrowed in place, rather than copied into a new dict:
     return (
-        HorizontalCoordinate({"alt": coordinate["alt"], "az": coordinate["az"]})
+        cast(HorizontalCoordinate, coordinate)
         if "az" in coordinate and "alt" in coordinate
         else None
     )
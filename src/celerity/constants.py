@@ -59,6 +59,14 @@ JULIAN_DAYS_PER_CENTURY: float = 36525.0
 
 # **************************************************************************************
 
+"""
+The ratio of a mean solar day to a mean sidereal day, i.e., the rate at which the
+mean sidereal time advances per unit of UTC.
+"""
+SIDEREAL_RATIO: float = 1.002737909
+
+# **************************************************************************************
+
 """
 The speed of light in a vacuum is defined to be exactly 299,792,458 m/s.
 """
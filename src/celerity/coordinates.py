@@ -6,19 +6,56 @@
 
 # **************************************************************************************
 
+from array import array
 from datetime import datetime
 from math import acos, asin, atan2, cos, degrees, radians, sin, tan
+from typing import List, MutableSequence, Optional, Sequence
 
-from .aberration import get_correction_to_equatorial_for_aberration
+from .aberration import (
+    get_aberration_terms,
+    get_correction_for_aberration,
+    get_correction_to_equatorial_for_aberration,
+)
 from .astrometry import get_hour_angle, get_obliquity_of_the_ecliptic
+from .buffers import get_writable_float64_view
 from .common import (
+    EclipticArray,
+    EclipticCatalog,
+    EclipticCoordinate,
+    EquatorialArray,
+    EquatorialCatalog,
     EquatorialCoordinate,
+    GalacticArray,
+    GalacticCatalog,
+    GalacticCoordinate,
     GeographicCoordinate,
     HeliocentricSphericalCoordinate,
+    HorizontalArray,
     HorizontalCoordinate,
+    get_coordinate_columns,
+)
+from .frames import (
+    GALACTIC_MATRIX,
+    get_equatorial_to_ecliptic_matrix,
+    get_equatorial_to_horizontal_matrix,
+)
+from .matrix import (
+    apply_matrix,
+    convert_spherical_to_unit_vector,
+    convert_vector_to_spherical,
+    rotate_spherical_coordinates,
+    transpose_matrix,
+)
+from .nutation import (
+    get_correction_for_nutation,
+    get_correction_to_equatorial_for_nutation,
+    get_nutation_terms,
+)
+from .precession import (
+    get_correction_for_precession_of_equinoxes,
+    get_correction_to_equatorial_for_precession_of_equinoxes,
+    get_precession_terms,
 )
-from .nutation import get_correction_to_equatorial_for_nutation
-from .precession import get_correction_to_equatorial_for_precession_of_equinoxes
 from .temporal import get_local_sidereal_time
 
 # **************************************************************************************
@@ -67,6 +104,97 @@ def get_correction_to_equatorial(
 # **************************************************************************************
 
 
+def get_corrections_to_equatorial(
+    date: datetime,
+    ra: EquatorialCatalog,
+    dec: Optional[Sequence[float]] = None,
+    out: Optional[EquatorialArray] = None,
+) -> EquatorialArray:
+    """
+    Apply all corrections to the equatorial coordinates of a catalog of targets for
+    a particular datetime, without mutating the inputs.
+
+    The corrections for nutation, aberration and precession are applied in turn, as
+    per get_correction_to_equatorial, to which the results are identical. However,
+    the epoch-dependent terms are computed once for the whole catalog, and as no
+    shared state is mutated, it is safe to call from multiple threads.
+
+    :param date: The datetime object to convert.
+    :param ra: The J2000.0 right ascensions of the targets (in degrees), or the
+        targets as an EquatorialArray or a sequence of equatorial coordinates.
+    :param dec: The J2000.0 declinations of the targets (in degrees), if ra is a
+        column of right ascensions.
+    :param out: Optional output buffers for the corrected right ascensions and
+        declinations, e.g., array('d') or NumPy arrays, of at least the same length
+        as ra, which may be the input columns themselves to correct them in place.
+    :return: The corrected right ascensions and declinations (in degrees).
+    """
+    ras, decs = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+    n = len(ras)
+
+    if len(decs) != n:
+        raise ValueError("ra and dec must be of the same length")
+
+    if out is None:
+        out = EquatorialArray(array("d", bytes(8 * n)), array("d", bytes(8 * n)))
+
+    # Write through zero-copy views of the output buffers, e.g., NumPy arrays:
+    corrected = EquatorialArray(
+        get_writable_float64_view(out.ra), get_writable_float64_view(out.dec)
+    )
+
+    if len(corrected.ra) < n or len(corrected.dec) < n:
+        raise ValueError("out must be at least as long as ra and dec")
+
+    # Get the epoch-dependent terms of each correction once for the whole catalog:
+    nutation = get_nutation_terms(date)
+
+    aberration = get_aberration_terms(date)
+
+    precession = get_precession_terms(date)
+
+    for i, (α, δ) in enumerate(zip(ras, decs)):
+        # Apply the correction for nutation:
+        Δα, Δδ = get_correction_for_nutation(α, δ, nutation)
+
+        α, δ = α + Δα, δ + Δδ
+
+        # Apply the correction for aberration:
+        Δα, Δδ = get_correction_for_aberration(α, δ, aberration)
+
+        α, δ = α + Δα, δ + Δδ
+
+        # Apply the correction for the precession of the equinoxes:
+        Δα, Δδ = get_correction_for_precession_of_equinoxes(α, δ, precession)
+
+        corrected.ra[i], corrected.dec[i] = α + Δα, δ + Δδ
+
+    return out
+
+
+# **************************************************************************************
+
+
+def get_corrections_to_equatorial_for_targets(
+    date: datetime, targets: Sequence[EquatorialCoordinate]
+) -> List[EquatorialCoordinate]:
+    """
+    Apply all corrections to the equatorial coordinates of a catalog of targets for
+    a particular datetime, returning new coordinates rather than mutating the inputs.
+
+    :param date: The datetime object to convert.
+    :param targets: The equatorial coordinates of the targets at epoch J2000.0.
+    :return: The corrected equatorial coordinates of the targets.
+    """
+    ras, decs = get_corrections_to_equatorial(date, targets)
+
+    return [{"ra": ra, "dec": dec} for ra, dec in zip(ras, decs)]
+
+
+# **************************************************************************************
+
+
 def convert_equatorial_to_horizontal(
     date: datetime,
     observer: GeographicCoordinate,
@@ -95,7 +223,11 @@ def convert_equatorial_to_horizontal(
 
     alt = asin(sin(dec) * sin(latitude) + cos(dec) * cos(latitude) * cos(ha))
 
-    az = acos((sin(dec) - sin(alt) * sin(latitude)) / (cos(alt) * cos(latitude)))
+    cos_az = (sin(dec) - sin(alt) * sin(latitude)) / (cos(alt) * cos(latitude))
+
+    # Clamp the cosine of the azimuth to [-1, 1] to guard against floating point
+    # rounding when the target is on (or very near to) the meridian:
+    az = acos(max(-1.0, min(1.0, cos_az)))
 
     return {
         "az": 360 - degrees(az) if sin(ha) > 0 else degrees(az),
@@ -106,6 +238,108 @@ def convert_equatorial_to_horizontal(
 # **************************************************************************************
 
 
+def convert_equatorial_coordinates_to_horizontal(
+    date: datetime,
+    observer: GeographicCoordinate,
+    ra: EquatorialCatalog,
+    dec: Optional[Sequence[float]] = None,
+    alt: Optional[MutableSequence[float]] = None,
+    az: Optional[MutableSequence[float]] = None,
+    refraction: bool = False,
+    temperature: float = 283.15,
+    pressure: float = 101325,
+) -> HorizontalArray:
+    """
+    Converts the equatorial coordinates of a catalog of targets to horizontal
+    coordinates for a single observer at a single instant.
+
+    Each target is rotated via its unit vector by the observer's horizontal matrix,
+    which is computed once (and cached per epoch and observer, see
+    get_equatorial_to_horizontal_matrix), such that the results agree with those of
+    convert_equatorial_to_horizontal (and of get_correction_to_horizontal_for_refraction,
+    if refraction is applied) to within floating point rounding.
+
+    :param date: The datetime object to convert.
+    :param observer: The geographic coordinate of the observer.
+    :param ra: The right ascensions of the targets (in degrees), or the targets as
+        an EquatorialArray or a sequence of equatorial coordinates.
+    :param dec: The declinations of the targets (in degrees), if ra is a column of
+        right ascensions.
+    :param alt: An optional output buffer for the altitudes, e.g., an array('d') or
+        a NumPy array, of at least the same length as ra.
+    :param az: An optional output buffer for the azimuths, as for alt.
+    :param refraction: Whether to correct the altitudes for atmospheric refraction.
+    :param temperature: The temperature in Kelvin, if refraction is applied.
+    :param pressure: The pressure in Pascals, if refraction is applied.
+    :return: The altitudes and azimuths of the targets (in degrees).
+    """
+    ras, decs = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+    n = len(ras)
+
+    if len(decs) != n:
+        raise ValueError("ra and dec must be of the same length")
+
+    if alt is None:
+        alt = array("d", bytes(8 * n))
+
+    if az is None:
+        az = array("d", bytes(8 * n))
+
+    # Write through zero-copy views of the output buffers, e.g., NumPy arrays:
+    alts, azs = get_writable_float64_view(alt), get_writable_float64_view(az)
+
+    if len(alts) < n or len(azs) < n:
+        raise ValueError("alt and az must be at least as long as ra and dec")
+
+    # Divide-by-zero errors can occur when we have cos(90), and sin(0)/sin(180) etc:
+    if cos(radians(observer["latitude"])) == 0:
+        for i in range(n):
+            alts[i], azs[i] = -1, -1
+        return HorizontalArray(alt, az)
+
+    # Get the rotation matrix to the observer's horizontal frame, once for every
+    # target, and unpack it into locals for the tight loop below:
+    (m11, m12, m13), (m21, m22, m23), (m31, m32, m33) = (
+        get_equatorial_to_horizontal_matrix(date, observer)
+    )
+
+    # Get the refraction scaling factors for the temperature and pressure:
+    P, T = pressure / 101325, 283.15 / temperature
+
+    for i in range(n):
+        α, δ = radians(ras[i]), radians(decs[i])
+
+        cosδ = cos(δ)
+
+        # Get the unit vector of the target in the equatorial frame:
+        u, v, w = cosδ * cos(α), cosδ * sin(α), sin(δ)
+
+        # Get the azimuth, measured from north toward east, where the y-axis of the
+        # horizontal frame is toward the west point (see convert_vector_to_horizontal):
+        A = -degrees(atan2(m21 * u + m22 * v + m23 * w, m11 * u + m12 * v + m13 * w))
+
+        A %= 360
+
+        # A tiny negative angle is rounded up to exactly 360 by the modulo:
+        azs[i] = A if A < 360 else 0.0
+
+        # Clamp to guard against rounding errors just beyond the zenith or nadir:
+        a = degrees(asin(max(-1.0, min(1.0, m31 * u + m32 * v + m33 * w))))
+
+        # Correct the altitude for atmospheric refraction, for targets above the
+        # horizon:
+        if refraction and a >= 0:
+            a = a + (1.02 / tan(radians(a + (10.3 / (a + 5.11))))) / 60 * P * T
+
+        alts[i] = a
+
+    return HorizontalArray(alt, az)
+
+
+# **************************************************************************************
+
+
 def convert_horizontal_to_equatorial(
     date: datetime,
     observer: GeographicCoordinate,
@@ -209,3 +443,219 @@ def convert_heliocentric_to_equatorial(
 
 
 # **************************************************************************************
+
+
+def convert_equatorial_to_galactic(target: EquatorialCoordinate) -> GalacticCoordinate:
+    """
+    Converts a J2000.0 equatorial coordinate to a galactic coordinate.
+
+    :param target: The equatorial J2000.0 coordinate of the target.
+    :return: The galactic coordinate of the target.
+    """
+    longitude, latitude = convert_vector_to_spherical(
+        apply_matrix(
+            GALACTIC_MATRIX,
+            convert_spherical_to_unit_vector(target["ra"], target["dec"]),
+        )
+    )
+
+    return {"l": longitude, "b": latitude}
+
+
+# **************************************************************************************
+
+
+def convert_galactic_to_equatorial(target: GalacticCoordinate) -> EquatorialCoordinate:
+    """
+    Converts a galactic coordinate to a J2000.0 equatorial coordinate.
+
+    :param target: The galactic coordinate of the target.
+    :return: The equatorial J2000.0 coordinate of the target.
+    """
+    ra, dec = convert_vector_to_spherical(
+        apply_matrix(
+            transpose_matrix(GALACTIC_MATRIX),
+            convert_spherical_to_unit_vector(target["l"], target["b"]),
+        )
+    )
+
+    return {"ra": ra, "dec": dec}
+
+
+# **************************************************************************************
+
+
+def convert_equatorial_to_ecliptic(
+    date: datetime, target: EquatorialCoordinate
+) -> EclipticCoordinate:
+    """
+    Converts an equatorial coordinate to an ecliptic coordinate, referred to the
+    mean obliquity of the ecliptic of date.
+
+    :param date: The datetime object to convert.
+    :param target: The equatorial coordinate of the target.
+    :return: The ecliptic coordinate of the target.
+    """
+    λ, β = convert_vector_to_spherical(
+        apply_matrix(
+            get_equatorial_to_ecliptic_matrix(date),
+            convert_spherical_to_unit_vector(target["ra"], target["dec"]),
+        )
+    )
+
+    return {"λ": λ, "β": β}
+
+
+# **************************************************************************************
+
+
+def convert_ecliptic_to_equatorial(
+    date: datetime, target: EclipticCoordinate
+) -> EquatorialCoordinate:
+    """
+    Converts an ecliptic coordinate, referred to the mean obliquity of the ecliptic
+    of date, to an equatorial coordinate.
+
+    :param date: The datetime object to convert.
+    :param target: The ecliptic coordinate of the target.
+    :return: The equatorial coordinate of the target.
+    """
+    ra, dec = convert_vector_to_spherical(
+        apply_matrix(
+            transpose_matrix(get_equatorial_to_ecliptic_matrix(date)),
+            convert_spherical_to_unit_vector(target["λ"], target["β"]),
+        )
+    )
+
+    return {"ra": ra, "dec": dec}
+
+
+# **************************************************************************************
+
+
+def convert_equatorial_coordinates_to_galactic(
+    ra: EquatorialCatalog,
+    dec: Optional[Sequence[float]] = None,
+    longitude: Optional[MutableSequence[float]] = None,
+    latitude: Optional[MutableSequence[float]] = None,
+) -> GalacticArray:
+    """
+    Converts the J2000.0 equatorial coordinates of a catalog of targets to galactic
+    coordinates.
+
+    :param ra: The J2000.0 right ascensions of the targets (in degrees), or the
+        targets as an EquatorialArray or a sequence of equatorial coordinates.
+    :param dec: The J2000.0 declinations of the targets (in degrees), if ra is a
+        column of right ascensions.
+    :param longitude: An optional output buffer for the galactic longitudes, e.g.,
+        an array('d') or a NumPy array, of at least the same length as ra.
+    :param latitude: An optional output buffer for the galactic latitudes, as for
+        longitude.
+    :return: The galactic longitudes and latitudes of the targets (in degrees).
+    """
+    ras, decs = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+    return GalacticArray(
+        *rotate_spherical_coordinates(GALACTIC_MATRIX, ras, decs, longitude, latitude)
+    )
+
+
+# **************************************************************************************
+
+
+def convert_galactic_coordinates_to_equatorial(
+    longitude: GalacticCatalog,
+    latitude: Optional[Sequence[float]] = None,
+    ra: Optional[MutableSequence[float]] = None,
+    dec: Optional[MutableSequence[float]] = None,
+) -> EquatorialArray:
+    """
+    Converts the galactic coordinates of a catalog of targets to J2000.0 equatorial
+    coordinates.
+
+    :param longitude: The galactic longitudes of the targets (in degrees), or the
+        targets as a GalacticArray or a sequence of galactic coordinates.
+    :param latitude: The galactic latitudes of the targets (in degrees), if longitude
+        is a column of galactic longitudes.
+    :param ra: An optional output buffer for the right ascensions, e.g., an
+        array('d') or a NumPy array, of at least the same length as longitude.
+    :param dec: An optional output buffer for the declinations, as for ra.
+    :return: The J2000.0 right ascensions and declinations of the targets (in degrees).
+    """
+    ls, bs = get_coordinate_columns(longitude, latitude, ("l", "b"))
+
+    return EquatorialArray(
+        *rotate_spherical_coordinates(
+            transpose_matrix(GALACTIC_MATRIX), ls, bs, ra, dec
+        )
+    )
+
+
+# **************************************************************************************
+
+
+def convert_equatorial_coordinates_to_ecliptic(
+    date: datetime,
+    ra: EquatorialCatalog,
+    dec: Optional[Sequence[float]] = None,
+    longitude: Optional[MutableSequence[float]] = None,
+    latitude: Optional[MutableSequence[float]] = None,
+) -> EclipticArray:
+    """
+    Converts the equatorial coordinates of a catalog of targets to ecliptic
+    coordinates, referred to the mean obliquity of the ecliptic of date.
+
+    :param date: The datetime object to convert.
+    :param ra: The right ascensions of the targets (in degrees), or the targets as
+        an EquatorialArray or a sequence of equatorial coordinates.
+    :param dec: The declinations of the targets (in degrees), if ra is a column of
+        right ascensions.
+    :param longitude: An optional output buffer for the ecliptic longitudes, e.g.,
+        an array('d') or a NumPy array, of at least the same length as ra.
+    :param latitude: An optional output buffer for the ecliptic latitudes, as for
+        longitude.
+    :return: The ecliptic longitudes and latitudes of the targets (in degrees).
+    """
+    ras, decs = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+    return EclipticArray(
+        *rotate_spherical_coordinates(
+            get_equatorial_to_ecliptic_matrix(date), ras, decs, longitude, latitude
+        )
+    )
+
+
+# **************************************************************************************
+
+
+def convert_ecliptic_coordinates_to_equatorial(
+    date: datetime,
+    λ: EclipticCatalog,
+    β: Optional[Sequence[float]] = None,
+    ra: Optional[MutableSequence[float]] = None,
+    dec: Optional[MutableSequence[float]] = None,
+) -> EquatorialArray:
+    """
+    Converts the ecliptic coordinates of a catalog of targets, referred to the mean
+    obliquity of the ecliptic of date, to equatorial coordinates.
+
+    :param date: The datetime object to convert.
+    :param λ: The ecliptic longitudes of the targets (in degrees), or the targets as
+        an EclipticArray or a sequence of ecliptic coordinates.
+    :param β: The ecliptic latitudes of the targets (in degrees), if λ is a column
+        of ecliptic longitudes.
+    :param ra: An optional output buffer for the right ascensions, e.g., an
+        array('d') or a NumPy array, of at least the same length as λ.
+    :param dec: An optional output buffer for the declinations, as for ra.
+    :return: The right ascensions and declinations of the targets (in degrees).
+    """
+    λs, βs = get_coordinate_columns(λ, β, ("λ", "β"))
+
+    return EquatorialArray(
+        *rotate_spherical_coordinates(
+            transpose_matrix(get_equatorial_to_ecliptic_matrix(date)), λs, βs, ra, dec
+        )
+    )
+
+
+# **************************************************************************************
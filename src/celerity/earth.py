@@ -9,11 +9,13 @@
 from datetime import datetime
 from math import pow
 
+from .memoise import memoise_by_epoch
 from .temporal import get_julian_date
 
 # **************************************************************************************
 
 
+@memoise_by_epoch(enabled=False)
 def get_eccentricity_of_orbit(date: datetime) -> float:
     """
     Get the eccentricity of the Earth's orbit.
@@ -0,0 +1,433 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
+from math import asin, atan2, cos, degrees, radians, sin
+from typing import NamedTuple, Sequence, Tuple
+
+from .astrometry import get_obliquity_of_the_ecliptic
+from .common import EquatorialCoordinate, GeocentricSphericalCoordinate
+from .moon import EARTH_EQUATORIAL_RADIUS
+from .tai import get_tt_utc_offset
+from .temporal import get_julian_centuries
+
+# **************************************************************************************
+
+# The mean distance of the Moon from the centre of the Earth (in kilometres):
+MEAN_LUNAR_DISTANCE = 385000.56
+
+# **************************************************************************************
+
+# The periodic terms for the longitude (Σl, in 10⁻⁶ degrees) and the distance (Σr, in
+# 10⁻³ kilometres) of the Moon, as given by Table 47.A of Meeus, Astronomical
+# Algorithms (2nd ed.), truncated from the ELP-2000/82 theory of Chapront-Touzé and
+# Chapront. Each row is (D, M, M′, F, Σl, Σr):
+ELP2000_LONGITUDE_DISTANCE_TERMS: Sequence[Tuple[int, int, int, int, int, int]] = (
+    (0, 0, 1, 0, 6288774, -20905355),
+    (2, 0, -1, 0, 1274027, -3699111),
+    (2, 0, 0, 0, 658314, -2955968),
+    (0, 0, 2, 0, 213618, -569925),
+    (0, 1, 0, 0, -185116, 48888),
+    (0, 0, 0, 2, -114332, -3149),
+    (2, 0, -2, 0, 58793, 246158),
+    (2, -1, -1, 0, 57066, -152138),
+    (2, 0, 1, 0, 53322, -170733),
+    (2, -1, 0, 0, 45758, -204586),
+    (0, 1, -1, 0, -40923, -129620),
+    (1, 0, 0, 0, -34720, 108743),
+    (0, 1, 1, 0, -30383, 104755),
+    (2, 0, 0, -2, 15327, 10321),
+    (0, 0, 1, 2, -12528, 0),
+    (0, 0, 1, -2, 10980, 79661),
+    (4, 0, -1, 0, 10675, -34782),
+    (0, 0, 3, 0, 10034, -23210),
+    (4, 0, -2, 0, 8548, -21636),
+    (2, 1, -1, 0, -7888, 24208),
+    (2, 1, 0, 0, -6766, 30824),
+    (1, 0, -1, 0, -5163, -8379),
+    (1, 1, 0, 0, 4987, -16675),
+    (2, -1, 1, 0, 4036, -12831),
+    (2, 0, 2, 0, 3994, -10445),
+    (4, 0, 0, 0, 3861, -11650),
+    (2, 0, -3, 0, 3665, 14403),
+    (0, 1, -2, 0, -2689, -7003),
+    (2, 0, -1, 2, -2602, 0),
+    (2, -1, -2, 0, 2390, 10056),
+    (1, 0, 1, 0, -2348, 6322),
+    (2, -2, 0, 0, 2236, -9884),
+    (0, 1, 2, 0, -2120, 5751),
+    (0, 2, 0, 0, -2069, 0),
+    (2, -2, -1, 0, 2048, -4950),
+    (2, 0, 1, -2, -1773, 4130),
+    (2, 0, 0, 2, -1595, 0),
+    (4, -1, -1, 0, 1215, -3958),
+    (0, 0, 2, 2, -1110, 0),
+    (3, 0, -1, 0, -892, 3258),
+    (2, 1, 1, 0, -810, 2616),
+    (4, -1, -2, 0, 759, -1897),
+    (0, 2, -1, 0, -713, -2117),
+    (2, 2, -1, 0, -700, 2354),
+    (2, 1, -2, 0, 691, 0),
+    (2, -1, 0, -2, 596, 0),
+    (4, 0, 1, 0, 549, -1423),
+    (0, 0, 4, 0, 537, -1117),
+    (4, -1, 0, 0, 520, -1571),
+    (1, 0, -2, 0, -487, -1739),
+    (2, 1, 0, -2, -399, 0),
+    (0, 0, 2, -2, -381, -4421),
+    (1, 1, 1, 0, 351, 0),
+    (3, 0, -2, 0, -340, 0),
+    (4, 0, -3, 0, 330, 0),
+    (2, -1, 2, 0, 327, 0),
+    (0, 2, 1, 0, -323, 1165),
+    (1, 1, -1, 0, 299, 0),
+    (2, 0, 3, 0, 294, 0),
+    (2, 0, -1, -2, 0, 8752),
+)
+
+# **************************************************************************************
+
+# The periodic terms for the latitude (Σb, in 10⁻⁶ degrees) of the Moon, as given by
+# Table 47.B of Meeus, Astronomical Algorithms (2nd ed.). Each row is (D, M, M′, F, Σb):
+ELP2000_LATITUDE_TERMS: Sequence[Tuple[int, int, int, int, int]] = (
+    (0, 0, 0, 1, 5128122),
+    (0, 0, 1, 1, 280602),
+    (0, 0, 1, -1, 277693),
+    (2, 0, 0, -1, 173237),
+    (2, 0, -1, 1, 55413),
+    (2, 0, -1, -1, 46271),
+    (2, 0, 0, 1, 32573),
+    (0, 0, 2, 1, 17198),
+    (2, 0, 1, -1, 9266),
+    (0, 0, 2, -1, 8822),
+    (2, -1, 0, -1, 8216),
+    (2, 0, -2, -1, 4324),
+    (2, 0, 1, 1, 4200),
+    (2, 1, 0, -1, -3359),
+    (2, -1, -1, 1, 2463),
+    (2, -1, 0, 1, 2211),
+    (2, -1, -1, -1, 2065),
+    (0, 1, -1, -1, -1870),
+    (4, 0, -1, -1, 1828),
+    (0, 1, 0, 1, -1794),
+    (0, 0, 0, 3, -1749),
+    (0, 1, -1, 1, -1565),
+    (1, 0, 0, 1, -1491),
+    (0, 1, 1, 1, -1475),
+    (0, 1, 1, -1, -1410),
+    (0, 1, 0, -1, -1344),
+    (1, 0, 0, -1, -1335),
+    (0, 0, 3, 1, 1107),
+    (4, 0, 0, -1, 1021),
+    (4, 0, -1, 1, 833),
+    (0, 0, 1, -3, 777),
+    (4, 0, -2, 1, 671),
+    (2, 0, 0, -3, 607),
+    (2, 0, 2, -1, 596),
+    (2, -1, 1, -1, 491),
+    (2, 0, -2, 1, -451),
+    (0, 0, 3, -1, 439),
+    (2, 0, 2, 1, 422),
+    (2, 0, -3, -1, 421),
+    (2, 1, -1, 1, -366),
+    (2, 1, 0, 1, -351),
+    (4, 0, 0, 1, 331),
+    (2, -1, 1, 1, 315),
+    (2, -2, 0, -1, 302),
+    (0, 0, 1, 3, -283),
+    (2, 1, 1, -1, -229),
+    (1, 1, 0, -1, 223),
+    (1, 1, 0, 1, 223),
+    (0, 1, -2, -1, -220),
+    (2, 1, -1, -1, -220),
+    (1, 0, 1, 1, -185),
+    (2, -1, -2, -1, 181),
+    (0, 1, 2, 1, -177),
+    (4, -2, -1, -1, 176),
+    (4, -1, -1, -1, 166),
+    (1, 0, 1, -1, -164),
+    (4, 0, 1, -1, 132),
+    (1, 0, -1, -1, -119),
+    (4, -1, 0, -1, 115),
+    (2, -2, 0, 1, 107),
+)
+
+# **************************************************************************************
+
+
+class ELP2000Series(NamedTuple):
+    """
+    A packed (columnar) representation of a truncated set of periodic terms.
+
+    The argument multipliers are stored as signed bytes, interleaved as (D, M, M′, F)
+    for each term, and the coefficients as signed integers, such that the series can
+    be evaluated in a single tight loop without any per-term object overhead.
+    """
+
+    # The interleaved (D, M, M′, F) argument multipliers of each term:
+    arguments: array
+
+    # The coefficients of the sine terms, e.g., Σl or Σb (in 10⁻⁶ degrees):
+    sines: array
+
+    # The coefficients of the cosine terms, e.g., Σr (in 10⁻³ kilometres):
+    cosines: array
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=16)
+def get_elp2000_series(precision: float = 0.0) -> Tuple[ELP2000Series, ELP2000Series]:
+    """
+    Gets the packed longitude/distance and latitude series, truncated such that any
+    term whose amplitude is smaller than the requested precision is discarded.
+
+    The distance terms are truncated at the equivalent arc length subtended at the
+    mean lunar distance, so that a single precision applies to all three components.
+
+    :param precision: The amplitude (in degrees) below which terms are discarded.
+    :return: The packed (longitude/distance, latitude) series.
+    """
+    # Convert the precision to the units of the tabulated coefficients:
+    threshold = precision * 1e6
+
+    r = radians(precision) * MEAN_LUNAR_DISTANCE * 1e3
+
+    lr = ELP2000Series(array("b"), array("l"), array("l"))
+
+    for D, M, Mp, F, Σl, Σr in ELP2000_LONGITUDE_DISTANCE_TERMS:
+        # Keep the term if either of its components is significant:
+        if abs(Σl) >= threshold or abs(Σr) >= r:
+            lr.arguments.extend((D, M, Mp, F))
+            lr.sines.append(Σl if abs(Σl) >= threshold else 0)
+            lr.cosines.append(Σr if abs(Σr) >= r else 0)
+
+    b = ELP2000Series(array("b"), array("l"), array("l"))
+
+    for D, M, Mp, F, Σb in ELP2000_LATITUDE_TERMS:
+        if abs(Σb) >= threshold:
+            b.arguments.extend((D, M, Mp, F))
+            b.sines.append(Σb)
+
+    return lr, b
+
+
+# **************************************************************************************
+
+
+def get_elp2000_ecliptic_coordinate(
+    date: datetime, precision: float = 0.0
+) -> GeocentricSphericalCoordinate:
+    """
+    Gets the geocentric ecliptic coordinate of the Moon, referred to the mean equinox
+    of date, from the truncated ELP-2000/82 series of Meeus, Astronomical Algorithms
+    (2nd ed.), Chapter 47.
+
+    At full precision the series is accurate to ~10″ in longitude, ~4″ in latitude,
+    and to within a few kilometres in distance.
+
+    :param date: The datetime object to convert.
+    :param precision: The amplitude (in degrees) below which terms are discarded.
+    :return: The ecliptic longitude λ and latitude β (in degrees) and distance r
+        (in metres) of the Moon.
+    """
+    # The series is expressed in terms of Terrestrial Time (TT):
+    TT = date + timedelta(seconds=get_tt_utc_offset(date))
+
+    # Get the number of Julian centuries since J2000.0 (in TT):
+    T = get_julian_centuries(TT)
+
+    T2 = T * T
+
+    T3 = T2 * T
+
+    T4 = T3 * T
+
+    # Get the Moon's mean longitude, L′ (in degrees):
+    Lp = (
+        218.3164477 + 481267.88123421 * T - 0.0015786 * T2 + T3 / 538841 - T4 / 65194000
+    ) % 360
+
+    # Get the mean elongation of the Moon, D (in radians):
+    D = radians(
+        (
+            297.8501921
+            + 445267.1114034 * T
+            - 0.0018819 * T2
+            + T3 / 545868
+            - T4 / 113065000
+        )
+        % 360
+    )
+
+    # Get the Sun's mean anomaly, M (in radians):
+    M = radians(
+        (357.5291092 + 35999.0502909 * T - 0.0001536 * T2 + T3 / 24490000) % 360
+    )
+
+    # Get the Moon's mean anomaly, M′ (in radians):
+    Mp = radians(
+        (134.9633964 + 477198.8675055 * T + 0.0087414 * T2 + T3 / 69699 - T4 / 14712000)
+        % 360
+    )
+
+    # Get the Moon's argument of latitude, F (in radians):
+    F = radians(
+        (
+            93.2720950
+            + 483202.0175233 * T
+            - 0.0036539 * T2
+            - T3 / 3526000
+            + T4 / 863310000
+        )
+        % 360
+    )
+
+    # Get the additional arguments for the action of Venus (A1), Jupiter (A2), and
+    # the flattening of the Earth (A3) (in radians):
+    A1 = radians((119.75 + 131.849 * T) % 360)
+
+    A2 = radians((53.09 + 479264.290 * T) % 360)
+
+    A3 = radians((313.45 + 481266.484 * T) % 360)
+
+    # Get the correction for the decreasing eccentricity of the Earth's orbit, where
+    # terms in M are multiplied by E, and terms in 2M by E²:
+    E = 1 - 0.002516 * T - 0.0000074 * T2
+
+    Es = (1.0, E, E * E)
+
+    lr, b = get_elp2000_series(precision)
+
+    Σl = 0.0
+
+    Σr = 0.0
+
+    arguments = lr.arguments
+
+    for i, (sl, sr) in enumerate(zip(lr.sines, lr.cosines)):
+        j = 4 * i
+
+        m = arguments[j + 1]
+
+        θ = arguments[j] * D + m * M + arguments[j + 2] * Mp + arguments[j + 3] * F
+
+        e = Es[m if m >= 0 else -m]
+
+        if sl:
+            Σl += sl * e * sin(θ)
+
+        if sr:
+            Σr += sr * e * cos(θ)
+
+    Σb = 0.0
+
+    arguments = b.arguments
+
+    for i, sb in enumerate(b.sines):
+        j = 4 * i
+
+        m = arguments[j + 1]
+
+        θ = arguments[j] * D + m * M + arguments[j + 2] * Mp + arguments[j + 3] * F
+
+        Σb += sb * Es[m if m >= 0 else -m] * sin(θ)
+
+    L = radians(Lp)
+
+    # Apply the additive terms for the action of Venus, Jupiter and the flattening
+    # of the Earth:
+    Σl += 3958 * sin(A1) + 1962 * sin(L - F) + 318 * sin(A2)
+
+    Σb += (
+        -2235 * sin(L)
+        + 382 * sin(A3)
+        + 175 * sin(A1 - F)
+        + 175 * sin(A1 + F)
+        + 127 * sin(L - Mp)
+        - 115 * sin(L + Mp)
+    )
+
+    return {
+        "λ": (Lp + Σl / 1e6) % 360,
+        "β": Σb / 1e6,
+        "r": (MEAN_LUNAR_DISTANCE + Σr / 1e3) * 1e3,
+    }
+
+
+# **************************************************************************************
+
+
+def get_elp2000_equatorial_coordinate(
+    date: datetime, precision: float = 0.0
+) -> EquatorialCoordinate:
+    """
+    Gets the geocentric equatorial coordinate of the Moon, referred to the mean
+    equator and equinox of date, from the truncated ELP-2000/82 series.
+
+    This is a higher accuracy (but more costly) alternative to the equatorial
+    coordinate of the low-order model in celerity.moon, with the same conventions.
+
+    :param date: The datetime object to convert.
+    :param precision: The amplitude (in degrees) below which terms are discarded.
+    :return: The equatorial coordinate in degrees.
+    """
+    ecliptic = get_elp2000_ecliptic_coordinate(date, precision)
+
+    λ = radians(ecliptic["λ"])
+
+    β = radians(ecliptic["β"])
+
+    # Get the obliquity of the ecliptic:
+    ε = radians(get_obliquity_of_the_ecliptic(date))
+
+    # Get the corresponding Right Ascension, α:
+    ra = degrees(atan2(sin(λ) * cos(ε) - sin(β) / cos(β) * sin(ε), cos(λ))) % 360
+
+    # Get the corresponding Declination, δ:
+    dec = degrees(asin(sin(β) * cos(ε) + cos(β) * sin(ε) * sin(λ)))
+
+    return {"ra": ra, "dec": dec}
+
+
+# **************************************************************************************
+
+
+def get_elp2000_distance(date: datetime, precision: float = 0.0) -> float:
+    """
+    Gets the distance between the centre of the Earth and the centre of the Moon,
+    from the truncated ELP-2000/82 series.
+
+    :param date: The datetime object to convert.
+    :param precision: The amplitude (in degrees) below which terms are discarded.
+    :return: The distance in metres.
+    """
+    return get_elp2000_ecliptic_coordinate(date, precision)["r"]
+
+
+# **************************************************************************************
+
+
+def get_elp2000_horizontal_parallax(date: datetime, precision: float = 0.0) -> float:
+    """
+    Gets the equatorial horizontal parallax of the Moon, from the distance given by
+    the truncated ELP-2000/82 series.
+
+    :param date: The datetime object to convert.
+    :param precision: The amplitude (in degrees) below which terms are discarded.
+    :return: The equatorial horizontal parallax in degrees.
+    """
+    return degrees(
+        asin(EARTH_EQUATORIAL_RADIUS / get_elp2000_distance(date, precision))
+    )
+
+
+# **************************************************************************************
@@ -10,13 +10,8 @@ from datetime import datetime, timezone
 from math import cos, radians, sin
 
 from .ecliptic import get_true_obliquity_of_the_ecliptic
-from .moon import (
-    get_mean_ecliptic_longitude_of_the_ascending_node,
-)
-from .moon import (
-    get_mean_geometric_longitude as get_mean_lunar_geometric_longitude,
-)
-from .sun import get_mean_geometric_longitude as get_mean_solar_geometric_longitude
+from .fundamentals import get_fundamental_arguments
+from .memoise import memoise_by_epoch
 
 # **************************************************************************************
 
@@ -63,6 +58,7 @@ def get_autumn_equinox(year: int) -> datetime:
 # **************************************************************************************
 
 
+@memoise_by_epoch(enabled=False)
 def get_equation_of_the_equinoxes(date: datetime) -> float:
     """
     Gets the equation of the equinoxes for a particular datetime
@@ -73,22 +69,13 @@ def get_equation_of_the_equinoxes(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The equation of the equinoxes in degrees.
     """
-    # Get the ecliptic longitude of the ascending node of the Moon (in degrees):
-    Ω = get_mean_ecliptic_longitude_of_the_ascending_node(date)
+    # Get the fundamental arguments at the epoch:
+    arguments = get_fundamental_arguments(date)
 
-    # Get the mean solar geometric longitude (in degrees):
-    L = get_mean_solar_geometric_longitude(date)
-
-    # Get the mean lunar geometric longitude (in degrees):
-    longitude = get_mean_lunar_geometric_longitude(date)
+    Ω = arguments.Ω
 
     # Get the nutation in longitude (in arcseconds):
-    Δψ = (
-        -17.20 * sin(radians(Ω))
-        - 1.32 * sin(radians(2.0 * L))
-        - 0.23 * sin(radians(2.0 * longitude))
-        + 0.21 * sin(radians(2.0 * Ω))
-    )
+    Δψ = arguments.Δψ
 
     # Get the true obliquity of the ecliptic (in degrees):
     ε = get_true_obliquity_of_the_ecliptic(date)
@@ -0,0 +1,268 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from math import pi, radians
+from typing import Optional, Tuple
+
+from .astrometry import get_obliquity_of_the_ecliptic
+from .common import GeographicCoordinate
+from .matrix import (
+    IDENTITY_MATRIX,
+    Matrix3,
+    Vector3,
+    convert_spherical_to_unit_vector,
+    convert_vector_to_spherical,
+    get_rotation_matrix_x,
+    get_rotation_matrix_y,
+    get_rotation_matrix_z,
+    multiply_matrices,
+    transpose_matrix,
+)
+from .temporal import get_greenwich_sidereal_time
+
+# **************************************************************************************
+
+
+class Frame(str, Enum):
+    EQUATORIAL = "equatorial"
+    ECLIPTIC = "ecliptic"
+    GALACTIC = "galactic"
+    HORIZONTAL = "horizontal"
+
+
+# **************************************************************************************
+
+# The rotation matrix from the J2000.0 equatorial frame to the galactic frame, as
+# defined by the Hipparcos catalogue (ESA 1997, Vol. 1, §1.5.3), where the rows are
+# the galactic x (toward the galactic centre), y and z (toward the north galactic
+# pole) axes expressed in the equatorial frame:
+GALACTIC_MATRIX: Matrix3 = (
+    (-0.0548755604162154, -0.8734370902348850, -0.4838350155487132),
+    (0.4941094278755837, -0.4448296299600112, 0.7469822444972189),
+    (-0.8676661490190047, -0.1980763734312015, 0.4559837761750669),
+)
+
+# **************************************************************************************
+
+
+def convert_horizontal_to_unit_vector(az: float, alt: float) -> Vector3:
+    """
+    Converts a horizontal coordinate to a unit vector in the horizontal frame, where
+    x is toward the north point, y is toward the west point and z is the zenith.
+
+    The azimuth is measured from north toward east, as per HorizontalCoordinate.
+
+    :param az: The azimuth (in degrees).
+    :param alt: The altitude (in degrees).
+    :return: The unit vector (x, y, z).
+    """
+    return convert_spherical_to_unit_vector(-az, alt)
+
+
+# **************************************************************************************
+
+
+def convert_vector_to_horizontal(v: Vector3) -> Tuple[float, float]:
+    """
+    Converts a vector in the horizontal frame to an azimuth in the range [0, 360),
+    measured from north toward east, and an altitude in the range [-90, 90].
+
+    :param v: The vector (x, y, z).
+    :return: The azimuth and altitude (in degrees).
+    """
+    λ, alt = convert_vector_to_spherical(v)
+
+    return (360 - λ) % 360, alt
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=32)
+def get_equatorial_to_ecliptic_matrix(date: datetime) -> Matrix3:
+    """
+    Gets the rotation matrix from the equatorial frame to the ecliptic frame of date,
+    i.e., a rotation about the equinox by the mean obliquity of the ecliptic.
+
+    :param date: The datetime object to convert.
+    :return: The rotation matrix.
+    """
+    return get_rotation_matrix_x(radians(get_obliquity_of_the_ecliptic(date)))
+
+
+# **************************************************************************************
+
+
+def _get_greenwich_to_horizontal_matrix(latitude: float, longitude: float) -> Matrix3:
+    return multiply_matrices(
+        # Flip the meridian axis from the south point to the north point, and the
+        # prime vertical from the east point to the west point:
+        get_rotation_matrix_z(pi),
+        # Tilt the celestial pole down to the observer's zenith:
+        get_rotation_matrix_y(radians(90 - latitude)),
+        # Rotate the Greenwich meridian onto the observer's meridian:
+        get_rotation_matrix_z(radians(longitude)),
+    )
+
+
+# **************************************************************************************
+
+
+def get_greenwich_to_horizontal_matrix(observer: GeographicCoordinate) -> Matrix3:
+    """
+    Gets the rotation matrix from the Greenwich frame, i.e., the equatorial frame of
+    date rotated by the Greenwich sidereal time, such that the x-axis lies on the
+    Greenwich meridian, to the horizontal frame of an observer.
+
+    The matrix is independent of the epoch, such that it may be computed once per
+    observer and composed with get_greenwich_sidereal_matrix at each epoch.
+
+    :param observer: The geographic coordinate of the observer.
+    :return: The rotation matrix.
+    """
+    return _get_greenwich_to_horizontal_matrix(
+        observer["latitude"], observer["longitude"]
+    )
+
+
+# **************************************************************************************
+
+
+def get_greenwich_sidereal_matrix(date: datetime) -> Matrix3:
+    """
+    Gets the rotation matrix from the equatorial frame of date to the Greenwich frame,
+    i.e., a rotation of the equinox onto the Greenwich meridian by the Greenwich
+    sidereal time.
+
+    :param date: The datetime object to convert.
+    :return: The rotation matrix.
+    """
+    return get_rotation_matrix_z(radians(get_greenwich_sidereal_time(date) * 15))
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=256)
+def _get_equatorial_to_horizontal_matrix(
+    date: datetime, latitude: float, longitude: float
+) -> Matrix3:
+    return multiply_matrices(
+        _get_greenwich_to_horizontal_matrix(latitude, longitude),
+        get_greenwich_sidereal_matrix(date),
+    )
+
+
+# **************************************************************************************
+
+
+def get_equatorial_to_horizontal_matrix(
+    date: datetime, observer: GeographicCoordinate
+) -> Matrix3:
+    """
+    Gets the rotation matrix from the equatorial frame of date to the horizontal
+    frame of an observer (see convert_horizontal_to_unit_vector).
+
+    The matrix is cached per epoch and observer, such that every target observed by
+    the same observer at the same epoch shares a single matrix.
+
+    :param date: The datetime object to convert.
+    :param observer: The geographic coordinate of the observer.
+    :return: The rotation matrix.
+    """
+    return _get_equatorial_to_horizontal_matrix(
+        date, observer["latitude"], observer["longitude"]
+    )
+
+
+# **************************************************************************************
+
+
+def _get_equatorial_to_frame_matrix(
+    frame: Frame,
+    date: Optional[datetime],
+    latitude: Optional[float],
+    longitude: Optional[float],
+) -> Matrix3:
+    if frame == Frame.EQUATORIAL:
+        return IDENTITY_MATRIX
+
+    if frame == Frame.GALACTIC:
+        return GALACTIC_MATRIX
+
+    if date is None:
+        raise ValueError(f"a date is required for the {frame.value} frame")
+
+    if frame == Frame.ECLIPTIC:
+        return get_equatorial_to_ecliptic_matrix(date)
+
+    if latitude is None or longitude is None:
+        raise ValueError(f"an observer is required for the {frame.value} frame")
+
+    return _get_equatorial_to_horizontal_matrix(date, latitude, longitude)
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=256)
+def _get_frame_matrix(
+    source: Frame,
+    target: Frame,
+    date: Optional[datetime],
+    latitude: Optional[float],
+    longitude: Optional[float],
+) -> Matrix3:
+    # Compose the rotations via the equatorial frame, where the inverse of a rotation
+    # matrix is its transpose:
+    return multiply_matrices(
+        _get_equatorial_to_frame_matrix(target, date, latitude, longitude),
+        transpose_matrix(
+            _get_equatorial_to_frame_matrix(source, date, latitude, longitude)
+        ),
+    )
+
+
+# **************************************************************************************
+
+
+def get_frame_matrix(
+    source: Frame,
+    target: Frame,
+    date: Optional[datetime] = None,
+    observer: Optional[GeographicCoordinate] = None,
+) -> Matrix3:
+    """
+    Gets the single rotation matrix which transforms a unit vector from one frame to
+    another, composed from the rotations between each frame and the equatorial frame.
+
+    The galactic frame is fixed to J2000.0, whereas the ecliptic frame requires a date,
+    and the horizontal frame requires both a date and an observer. The composed
+    matrices are cached per pair of frames, epoch and observer.
+
+    :param source: The frame to transform from.
+    :param target: The frame to transform to.
+    :param date: The datetime object to convert, if required by either frame.
+    :param observer: The geographic coordinate of the observer, if required by either
+        frame.
+    :return: The rotation matrix.
+    :raises ValueError: If a frame requires a date or observer which is not given.
+    """
+    return _get_frame_matrix(
+        Frame(source),
+        Frame(target),
+        date,
+        None if observer is None else observer["latitude"],
+        None if observer is None else observer["longitude"],
+    )
+
+
+# **************************************************************************************
@@ -0,0 +1,153 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime
+from functools import lru_cache
+from math import cos, pow, radians, sin
+
+from .astrometry import get_obliquity_of_the_ecliptic
+from .memoise import memoise_by_epoch
+from .temporal import get_julian_date
+
+# **************************************************************************************
+
+
+class FundamentalArguments:
+    """
+    The fundamental arguments of the Sun and the Moon at a particular epoch, along
+    with the low-precision nutation derived from them.
+
+    These are shared by the solar and lunar models, and by every apparent place
+    correction (e.g., nutation, aberration and the equation of the equinoxes), such
+    that the polynomials and trigonometric series are evaluated once per epoch.
+
+    :property JD: The Julian date.
+    :property T: The number of Julian centuries since J2000.0.
+    :property d: The number of days since J2000.0.
+    :property Ω: The mean longitude of the Moon's ascending node, corrected for the
+        Sun's mean anomaly (in degrees).
+    :property L: The mean geometric longitude of the Sun (in degrees).
+    :property M: The mean anomaly of the Sun (in degrees).
+    :property Lm: The mean geometric longitude of the Moon (in degrees).
+    :property Mm: The mean anomaly of the Moon (in degrees).
+    :property ε: The mean obliquity of the ecliptic (in degrees).
+    :property Δψ: The nutation in longitude (in arcseconds).
+    :property Δε: The nutation in obliquity (in arcseconds).
+    """
+
+    __slots__ = ("JD", "T", "d", "Ω", "L", "M", "Lm", "Mm", "ε", "Δψ", "Δε")
+
+    def __init__(self, date: datetime) -> None:
+        # Get the Julian date:
+        JD = get_julian_date(date)
+
+        # Calculate the number of centuries since J2000.0:
+        T = (JD - 2451545.0) / 36525
+
+        # Get the number of days since the standard epoch J2000:
+        d = JD - 2451545.0
+
+        # Get the Sun's mean anomaly at the current epoch relative to J2000:
+        M = (357.52911 + 35999.05029 * T - 0.0001537 * pow(T, 2)) % 360
+
+        # Correct for negative angles
+        if M < 0:
+            M += 360
+
+        # Calculate the Sun's mean geometric longitude:
+        L = (280.46646 + 36000.76983 * T + 0.0003032 * pow(T, 2)) % 360
+
+        # Correct for negative angles
+        if L < 0:
+            L += 360
+
+        # Get the Moon's mean anomaly at the current epoch relative to J2000:
+        Mm = (
+            134.9634114
+            + 477198.8676313 * T
+            + 0.008997 * pow(T, 2)
+            + pow(T, 3) / 69699
+            - pow(T, 4) / 14712000
+        ) % 360
+
+        # Correct for negative angles
+        if Mm < 0:
+            Mm += 360
+
+        # Get the Moon's mean geometric longitude:
+        Lm = (
+            218.3164477
+            + 481267.88123421 * T
+            - 0.0015786 * pow(T, 2)
+            + pow(T, 3) / 538841
+            - pow(T, 4) / 65194000
+        ) % 360
+
+        # Correct for negative angles
+        if Lm < 0:
+            Lm += 360
+
+        # Get the Moon's ecliptic longitude of the ascending node at the current epoch
+        # relative to J2000:
+        Ω = (125.044522 - (0.0529539 * d)) % 360
+
+        # Correct for negative angles
+        if Ω < 0:
+            Ω += 360
+
+        # Correct for the Sun's mean anomaly:
+        Ω = Ω - 0.16 * sin(radians(M))
+
+        # Calculate the nutation in longitude (in arcseconds):
+        Δψ = (
+            -17.2 * sin(radians(Ω))
+            - 1.32 * sin(radians(2 * L))
+            - 0.23 * sin(radians(2 * Lm))
+            + 0.21 * sin(radians(2 * Ω))
+        )
+
+        # Calculate the nutation in obliquity (in arcseconds):
+        Δε = (
+            9.2 * cos(radians(Ω))
+            + 0.57 * cos(radians(2 * L))
+            + 0.1 * cos(radians(2 * Lm))
+            - 0.09 * cos(radians(2 * Ω))
+        )
+
+        self.JD = JD
+        self.T = T
+        self.d = d
+        self.Ω = Ω
+        self.L = L
+        self.M = M
+        self.Lm = Lm
+        self.Mm = Mm
+        self.ε = get_obliquity_of_the_ecliptic(date)
+        self.Δψ = Δψ
+        self.Δε = Δε
+
+
+# **************************************************************************************
+
+
+@memoise_by_epoch(enabled=False)
+@lru_cache(maxsize=8)
+def get_fundamental_arguments(date: datetime) -> FundamentalArguments:
+    """
+    Get the fundamental arguments of the Sun and the Moon at a particular epoch.
+
+    Only the few most recently requested epochs are cached, as the arguments are
+    typically consumed by several corrections applied in turn at the same datetime.
+
+    :param date: The datetime object to convert.
+    :return: The fundamental arguments at the given epoch.
+    """
+    return FundamentalArguments(date)
+
+
+# **************************************************************************************
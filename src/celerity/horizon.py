@@ -0,0 +1,150 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from typing import Iterable, Optional, Sequence
+
+from .common import HorizontalCoordinate
+
+# **************************************************************************************
+
+
+class HorizonMask:
+    """
+    An observer's local horizon, e.g., the profile of surrounding buildings and
+    mountains, as altitude samples at given azimuths, which are linearly interpolated
+    in azimuth (wrapping around through north).
+
+    The samples are indexed by a lookup table of equal-width azimuth buckets, such
+    that the horizon altitude at any azimuth is found in O(1), without a search.
+
+    :property azimuths: The azimuths of the samples in the range [0, 360) (in degrees),
+        in ascending order.
+    :property altitudes: The altitudes of the horizon at each azimuth (in degrees).
+    :property minimum: The lowest altitude of the horizon (in degrees).
+    :property maximum: The highest altitude of the horizon (in degrees).
+    """
+
+    __slots__ = (
+        "azimuths",
+        "altitudes",
+        "minimum",
+        "maximum",
+        "_A",
+        "_h",
+        "_scale",
+        "_buckets",
+    )
+
+    def __init__(
+        self,
+        azimuths: Sequence[float],
+        altitudes: Sequence[float],
+        buckets: Optional[int] = None,
+    ) -> None:
+        if len(azimuths) != len(altitudes):
+            raise ValueError("azimuths and altitudes must be of the same length")
+
+        if not len(azimuths):
+            raise ValueError("a horizon mask requires at least one sample")
+
+        samples = sorted(zip((az % 360 for az in azimuths), altitudes))
+
+        self.azimuths = array("d", (az for az, _ in samples))
+
+        self.altitudes = array("d", (alt for _, alt in samples))
+
+        self.minimum, self.maximum = min(self.altitudes), max(self.altitudes)
+
+        # Pad the samples with the last sample one turn before, and the first sample
+        # one turn after, such that every azimuth in [0, 360) lies within a segment:
+        self._A = array(
+            "d", [self.azimuths[-1] - 360, *self.azimuths, self.azimuths[0] + 360]
+        )
+
+        self._h = array("d", [self.altitudes[-1], *self.altitudes, self.altitudes[0]])
+
+        # By default, use at least one bucket per degree and per sample:
+        n = max(360, len(samples)) if buckets is None else buckets
+
+        if n < 1:
+            raise ValueError("buckets must be a positive integer")
+
+        self._scale = n / 360
+
+        # Get the index of the segment containing the start of each bucket:
+        self._buckets = array("l", bytes(array("l").itemsize * n))
+
+        i = 0
+
+        for k in range(n):
+            while self._A[i + 1] <= k / self._scale:
+                i += 1
+
+            self._buckets[k] = i
+
+    def __len__(self) -> int:
+        return len(self.azimuths)
+
+    @classmethod
+    def from_coordinates(
+        cls, samples: Iterable[HorizontalCoordinate], buckets: Optional[int] = None
+    ) -> "HorizonMask":
+        """
+        Creates a horizon mask from a sequence of horizontal coordinates.
+
+        :param samples: The horizontal coordinates of the horizon.
+        :param buckets: The number of azimuth buckets of the lookup table.
+        :return: The horizon mask.
+        """
+        samples = list(samples)
+
+        return cls(
+            [sample["az"] for sample in samples],
+            [sample["alt"] for sample in samples],
+            buckets,
+        )
+
+    def get_altitude(self, az: float) -> float:
+        """
+        Gets the altitude of the horizon at the given azimuth.
+
+        :param az: The azimuth (in degrees).
+        :return: The interpolated altitude of the horizon (in degrees).
+        """
+        az %= 360
+
+        # A tiny negative azimuth is rounded up to exactly 360 by the modulo:
+        if az >= 360:
+            az = 0.0
+
+        A = self._A
+
+        # Rounding can place an azimuth just below 360 beyond the last bucket:
+        i = self._buckets[min(int(az * self._scale), len(self._buckets) - 1)]
+
+        # Step on to the segment containing the azimuth, which is at most a few
+        # samples on from the start of the bucket:
+        while A[i + 1] <= az:
+            i += 1
+
+        h = self._h
+
+        return h[i] + (h[i + 1] - h[i]) * (az - A[i]) / (A[i + 1] - A[i])
+
+    def is_above(self, coordinate: HorizontalCoordinate) -> bool:
+        """
+        Determines whether a horizontal coordinate is above the horizon.
+
+        :param coordinate: The horizontal coordinate.
+        :return: True if the coordinate is above the horizon, False otherwise.
+        """
+        return coordinate["alt"] >= self.get_altitude(coordinate["az"])
+
+
+# **************************************************************************************
@@ -0,0 +1,254 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from math import asin, atan2, cos, degrees, radians, sin, sqrt
+from typing import MutableSequence, Optional, Sequence, Tuple
+
+from .buffers import get_float64_view, get_writable_float64_view
+
+# **************************************************************************************
+
+Vector3 = Tuple[float, float, float]
+
+# **************************************************************************************
+
+Matrix3 = Tuple[Vector3, Vector3, Vector3]
+
+# **************************************************************************************
+
+IDENTITY_MATRIX: Matrix3 = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+# **************************************************************************************
+
+
+def get_rotation_matrix_x(θ: float) -> Matrix3:
+    """
+    Gets the matrix which rotates the coordinate axes by θ about the x-axis (R₁).
+
+    :param θ: The angle of rotation (in radians).
+    :return: The 3×3 rotation matrix.
+    """
+    c, s = cos(θ), sin(θ)
+
+    return ((1.0, 0.0, 0.0), (0.0, c, s), (0.0, -s, c))
+
+
+# **************************************************************************************
+
+
+def get_rotation_matrix_y(θ: float) -> Matrix3:
+    """
+    Gets the matrix which rotates the coordinate axes by θ about the y-axis (R₂).
+
+    :param θ: The angle of rotation (in radians).
+    :return: The 3×3 rotation matrix.
+    """
+    c, s = cos(θ), sin(θ)
+
+    return ((c, 0.0, -s), (0.0, 1.0, 0.0), (s, 0.0, c))
+
+
+# **************************************************************************************
+
+
+def get_rotation_matrix_z(θ: float) -> Matrix3:
+    """
+    Gets the matrix which rotates the coordinate axes by θ about the z-axis (R₃).
+
+    :param θ: The angle of rotation (in radians).
+    :return: The 3×3 rotation matrix.
+    """
+    c, s = cos(θ), sin(θ)
+
+    return ((c, s, 0.0), (-s, c, 0.0), (0.0, 0.0, 1.0))
+
+
+# **************************************************************************************
+
+
+def multiply_matrices(*matrices: Matrix3) -> Matrix3:
+    """
+    Composes a chain of rotations into a single matrix, i.e., A · B · C · ...,
+    such that the right-most matrix is applied to a vector first.
+
+    :param matrices: The matrices to multiply, from left to right.
+    :return: The product of the matrices.
+    """
+    product = IDENTITY_MATRIX
+
+    for m in matrices:
+        (p00, p01, p02), (p10, p11, p12), (p20, p21, p22) = product
+
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = m
+
+        product = (
+            (
+                p00 * m00 + p01 * m10 + p02 * m20,
+                p00 * m01 + p01 * m11 + p02 * m21,
+                p00 * m02 + p01 * m12 + p02 * m22,
+            ),
+            (
+                p10 * m00 + p11 * m10 + p12 * m20,
+                p10 * m01 + p11 * m11 + p12 * m21,
+                p10 * m02 + p11 * m12 + p12 * m22,
+            ),
+            (
+                p20 * m00 + p21 * m10 + p22 * m20,
+                p20 * m01 + p21 * m11 + p22 * m21,
+                p20 * m02 + p21 * m12 + p22 * m22,
+            ),
+        )
+
+    return product
+
+
+# **************************************************************************************
+
+
+def transpose_matrix(m: Matrix3) -> Matrix3:
+    """
+    Transposes a matrix, which for a rotation matrix is also its inverse.
+
+    :param m: The matrix to transpose.
+    :return: The transposed matrix.
+    """
+    (a, b, c), (d, e, f), (g, h, i) = m
+
+    return ((a, d, g), (b, e, h), (c, f, i))
+
+
+# **************************************************************************************
+
+
+def apply_matrix(m: Matrix3, v: Vector3) -> Vector3:
+    """
+    Applies a matrix to a vector, i.e., M · v.
+
+    :param m: The matrix to apply.
+    :param v: The vector to transform.
+    :return: The transformed vector.
+    """
+    (a, b, c), (d, e, f), (g, h, i) = m
+
+    x, y, z = v
+
+    return (a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z)
+
+
+# **************************************************************************************
+
+
+def convert_spherical_to_unit_vector(λ: float, φ: float) -> Vector3:
+    """
+    Converts a longitude-like and latitude-like angle pair (e.g., right ascension
+    and declination) to a Cartesian unit vector.
+
+    :param λ: The longitude-like angle (in degrees).
+    :param φ: The latitude-like angle (in degrees).
+    :return: The unit vector (x, y, z).
+    """
+    λ, φ = radians(λ), radians(φ)
+
+    cosφ = cos(φ)
+
+    return (cosφ * cos(λ), cosφ * sin(λ), sin(φ))
+
+
+# **************************************************************************************
+
+
+def convert_vector_to_spherical(v: Vector3) -> Tuple[float, float]:
+    """
+    Converts a Cartesian vector (of any non-zero length) to a longitude-like angle
+    in the range [0, 360) and a latitude-like angle in the range [-90, 90].
+
+    :param v: The vector (x, y, z).
+    :return: The longitude-like and latitude-like angles (in degrees).
+    """
+    x, y, z = v
+
+    r = sqrt(x * x + y * y + z * z)
+
+    # Clamp to guard against rounding errors just beyond the poles:
+    φ = degrees(asin(max(-1.0, min(1.0, z / r))))
+
+    λ = degrees(atan2(y, x)) % 360
+
+    # A tiny negative angle is rounded up to exactly 360 by the modulo:
+    return λ if λ < 360 else 0.0, φ
+
+
+# **************************************************************************************
+
+
+def rotate_spherical_coordinates(
+    m: Matrix3,
+    λ: Sequence[float],
+    φ: Sequence[float],
+    longitude: Optional[MutableSequence[float]] = None,
+    latitude: Optional[MutableSequence[float]] = None,
+) -> Tuple[MutableSequence[float], MutableSequence[float]]:
+    """
+    Rotates columnar longitude-like and latitude-like angle pairs (e.g., right
+    ascensions and declinations) from one frame to another, via their unit vectors.
+
+    :param m: The rotation matrix from the source frame to the target frame.
+    :param λ: The longitude-like angles in the source frame (in degrees).
+    :param φ: The latitude-like angles in the source frame (in degrees).
+    :param longitude: An optional output buffer for the longitude-like angles in the
+        target frame, e.g., an array('d') or a NumPy array, of at least the same
+        length as λ.
+    :param latitude: An optional output buffer for the latitude-like angles in the
+        target frame, as for longitude.
+    :return: The longitude-like angles in the range [0, 360), and the latitude-like
+        angles in the range [-90, 90], in the target frame (in degrees).
+    """
+    λ, φ = get_float64_view(λ), get_float64_view(φ)
+
+    n = len(λ)
+
+    if len(φ) != n:
+        raise ValueError("λ and φ must be of the same length")
+
+    if longitude is None:
+        longitude = array("d", bytes(8 * n))
+
+    if latitude is None:
+        latitude = array("d", bytes(8 * n))
+
+    # Write through zero-copy views of the output buffers, e.g., NumPy arrays:
+    Λ, Φ = get_writable_float64_view(longitude), get_writable_float64_view(latitude)
+
+    if len(Λ) < n or len(Φ) < n:
+        raise ValueError("longitude and latitude must be at least as long as λ and φ")
+
+    # Unpack the matrix into locals for the tight loop below:
+    (a, b, c), (d, e, f), (g, h, i) = m
+
+    for k in range(n):
+        α, δ = radians(λ[k]), radians(φ[k])
+
+        cosδ = cos(δ)
+
+        u, v, w = cosδ * cos(α), cosδ * sin(α), sin(δ)
+
+        z = g * u + h * v + i * w
+
+        λk = degrees(atan2(d * u + e * v + f * w, a * u + b * v + c * w)) % 360
+
+        # A tiny negative angle is rounded up to exactly 360 by the modulo:
+        Λ[k] = λk if λk < 360 else 0.0
+
+        # Clamp to guard against rounding errors just beyond the poles:
+        Φ[k] = degrees(asin(max(-1.0, min(1.0, z))))
+
+    return longitude, latitude
+
+
+# **************************************************************************************
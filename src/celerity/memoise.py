@@ -0,0 +1,425 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import update_wrapper
+from importlib import import_module
+from threading import Lock
+from typing import Any, Callable, Dict, Generic, NamedTuple, Optional, Tuple, TypeVar
+
+# **************************************************************************************
+
+T = TypeVar("T")
+
+# **************************************************************************************
+
+# The package whose functions may be memoised by epoch, e.g., "celerity":
+PACKAGE = __name__.rpartition(".")[0]
+
+# **************************************************************************************
+
+
+class EpochCacheInfo(NamedTuple):
+    """
+    The statistics of an epoch-quantised cache, mirroring functools' CacheInfo.
+
+    :property hits: The number of calls served from the cache.
+    :property misses: The number of calls which evaluated the wrapped function.
+    :property maxsize: The maximum number of epochs held in the cache.
+    :property currsize: The current number of epochs held in the cache.
+    :property quantum: The width of each epoch bucket (in seconds).
+    """
+
+    hits: int
+
+    misses: int
+
+    maxsize: int
+
+    currsize: int
+
+    quantum: float
+
+
+# **************************************************************************************
+
+
+class EpochErrorBudget(NamedTuple):
+    """
+    The maximum rate of change of a memoisable quantity, from which the maximum
+    error introduced by rounding its epoch to a quantum is derived.
+
+    :property rate: The maximum rate of change (in units per second).
+    :property units: The units of the quantity, e.g., "°".
+    """
+
+    rate: float
+
+    units: str
+
+
+# **************************************************************************************
+
+# The functions which may be memoised by epoch, keyed by name, along with the module
+# in which they are defined (where each is decorated with memoise_by_epoch, disabled
+# by default) and their error budget. The rates are the sum of the
+# amplitude × angular frequency of each term, i.e., an upper bound on |df/dt|:
+EPOCH_MEMOISABLE_FUNCTIONS: Dict[str, Tuple[str, EpochErrorBudget]] = {
+    # The mean obliquity changes by ~46.8″ per century:
+    "get_obliquity_of_the_ecliptic": ("astrometry", EpochErrorBudget(4.2e-12, "°")),
+    # The eccentricity changes by ~4.2 × 10⁻⁵ per century:
+    "get_eccentricity_of_orbit": ("earth", EpochErrorBudget(1.4e-14, "")),
+    # Dominated by the 13.66 day (0.23″), semi-annual (1.32″) and 18.6 year (17.2″)
+    # terms of the nutation in longitude, i.e., ~1.9 × 10⁻⁶″/s:
+    "get_nutation_in_longitude": ("nutation", EpochErrorBudget(5.4e-10, "°")),
+    # Dominated by the 13.66 day (0.1″), semi-annual (0.57″) and 18.6 year (9.2″)
+    # terms of the nutation in obliquity, i.e., ~8.6 × 10⁻⁷″/s:
+    "get_nutation_in_obliquity": ("nutation", EpochErrorBudget(2.4e-10, "°")),
+    # The mean obliquity, plus the nutation in obliquity:
+    "get_true_obliquity_of_the_ecliptic": ("ecliptic", EpochErrorBudget(2.5e-10, "°")),
+    # The nutation in longitude, projected onto the equator:
+    "get_equation_of_the_equinoxes": ("equinox", EpochErrorBudget(5.0e-10, "°")),
+    # Dominated by the Moon's mean longitude, which advances ~13.2° per day:
+    "get_fundamental_arguments": ("fundamentals", EpochErrorBudget(1.53e-4, "°")),
+    # Dominated by annual aberration (~4.1 × 10⁻⁶″/s), nutation and precession, as an
+    # angular displacement of the target on the sky:
+    "get_apparent_place_transform": ("apparent", EpochErrorBudget(8.0e-6, "″")),
+}
+
+# **************************************************************************************
+
+# The caches keyed by exact epoch (or by calendar date), as (module, name), whose
+# results are derived from the memoisable functions, and so must be cleared whenever
+# memoisation is enabled or disabled, such that no quantised result outlives an
+# opt-out (nor any exact result an opt-in):
+EPOCH_DEPENDENT_CACHES: Tuple[Tuple[str, str], ...] = (
+    ("apparent", "get_apparent_place_transform"),
+    ("frames", "get_equatorial_to_ecliptic_matrix"),
+    ("frames", "_get_equatorial_to_horizontal_matrix"),
+    ("frames", "_get_frame_matrix"),
+    ("fundamentals", "get_fundamental_arguments"),
+    ("moon", "get_lunar_state"),
+    ("night", "_get_solar_day_boundaries"),
+    ("precession", "_get_precession_nutation_matrix"),
+    ("sun", "get_solar_state"),
+)
+
+# **************************************************************************************
+
+
+def get_quantised_epoch(date: datetime, quantum: float) -> datetime:
+    """
+    Rounds an epoch to the nearest multiple of the quantum since the Unix epoch.
+
+    Naive datetimes are interpreted as local time, as they are by get_julian_date,
+    and the quantised epoch is always returned as a UTC datetime.
+
+    :param date: The datetime object to round.
+    :param quantum: The width of each epoch bucket (in seconds).
+    :return: The quantised epoch, as a UTC datetime.
+    """
+    if quantum <= 0:
+        raise ValueError("quantum must be a positive number of seconds")
+
+    return datetime.fromtimestamp(
+        round(date.timestamp() / quantum) * quantum, tz=timezone.utc
+    )
+
+
+# **************************************************************************************
+
+
+def get_epoch_memoisation_error(name: str, quantum: float) -> float:
+    """
+    Gets the maximum error introduced by memoising a function at a given quantum,
+    i.e., the maximum rate of change of the quantity over half a quantum.
+
+    For example, at a quantum of 1 second the error in the nutation in longitude is
+    at most ~1 μas, whilst at a quantum of 60 seconds it is at most ~58 μas.
+
+    :param name: The name of a function in EPOCH_MEMOISABLE_FUNCTIONS.
+    :param quantum: The width of each epoch bucket (in seconds).
+    :return: The maximum error (in the units of the function's error budget).
+    """
+    if name not in EPOCH_MEMOISABLE_FUNCTIONS:
+        raise ValueError(f"{name} is not an epoch memoisable function")
+
+    _, budget = EPOCH_MEMOISABLE_FUNCTIONS[name]
+
+    return budget.rate * quantum / 2
+
+
+# **************************************************************************************
+
+
+class EpochMemoisedFunction(Generic[T]):
+    """
+    A thread-safe wrapper which memoises a function of a single datetime, keyed by
+    the epoch rounded to the nearest quantum, in a bounded least-recently-used cache.
+
+    The wrapped function is always evaluated at the quantised epoch, such that the
+    result for a given bucket does not depend upon which call populated the cache.
+    Whilst disabled, every call is passed through to the wrapped function exactly.
+    """
+
+    def __init__(
+        self,
+        f: Callable[[datetime], T],
+        quantum: float = 1.0,
+        maxsize: int = 128,
+        enabled: bool = True,
+    ) -> None:
+        if quantum <= 0:
+            raise ValueError("quantum must be a positive number of seconds")
+
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.__wrapped__ = f
+
+        self.quantum = quantum
+
+        self.maxsize = maxsize
+
+        self.enabled = enabled
+
+        self._cache: "OrderedDict[int, T]" = OrderedDict()
+
+        self._lock = Lock()
+
+        self._hits = 0
+
+        self._misses = 0
+
+        update_wrapper(self, f)
+
+    def __call__(self, date: datetime) -> T:
+        if not self.enabled:
+            return self.__wrapped__(date)
+
+        quantum = self.quantum
+
+        # Get the index of the epoch bucket since the Unix epoch:
+        k = round(date.timestamp() / quantum)
+
+        with self._lock:
+            if k in self._cache:
+                self._cache.move_to_end(k)
+                self._hits += 1
+                return self._cache[k]
+
+        # Evaluate outside of the lock, such that a slow function does not block other
+        # threads (at worst, two threads evaluate the same bucket concurrently):
+        value = self.__wrapped__(datetime.fromtimestamp(k * quantum, tz=timezone.utc))
+
+        with self._lock:
+            self._misses += 1
+
+            # Only cache the value if the function has not been reconfigured whilst
+            # it was being evaluated:
+            if not self.enabled or self.quantum != quantum:
+                return value
+
+            self._cache[k] = value
+
+            self._cache.move_to_end(k)
+
+            # Evict the least recently used epochs:
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def enable(
+        self, quantum: Optional[float] = None, maxsize: Optional[int] = None
+    ) -> None:
+        """
+        Enables memoisation, clearing the cache, e.g., to change the quantum.
+
+        :param quantum: The width of each epoch bucket (in seconds), if changed.
+        :param maxsize: The maximum number of epochs held in the cache, if changed.
+        """
+        if quantum is not None and quantum <= 0:
+            raise ValueError("quantum must be a positive number of seconds")
+
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        with self._lock:
+            self.quantum = self.quantum if quantum is None else quantum
+            self.maxsize = self.maxsize if maxsize is None else maxsize
+            self.enabled = True
+            self._clear()
+
+    def disable(self) -> None:
+        """
+        Disables memoisation, clearing the cache, such that every call is passed
+        through to the wrapped function exactly.
+        """
+        with self._lock:
+            self.enabled = False
+            self._clear()
+
+    def cache_info(self) -> EpochCacheInfo:
+        """
+        Gets the statistics of the cache.
+
+        :return: The hits, misses, maximum and current size, and quantum of the cache.
+        """
+        with self._lock:
+            return EpochCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._cache),
+                quantum=self.quantum,
+            )
+
+    def cache_clear(self) -> None:
+        """
+        Clears the cache and its statistics.
+        """
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# **************************************************************************************
+
+
+def memoise_by_epoch(
+    quantum: float = 1.0, maxsize: int = 128, enabled: bool = True
+) -> Callable[[Callable[[datetime], T]], EpochMemoisedFunction[T]]:
+    """
+    Decorates a function of a single datetime, such that it is memoised by epoch.
+
+    :param quantum: The width of each epoch bucket (in seconds).
+    :param maxsize: The maximum number of epochs held in the cache.
+    :param enabled: Whether memoisation is enabled, or must be opted in to, e.g.,
+        with enable_epoch_memoisation.
+    :return: The decorator.
+    """
+
+    def decorator(f: Callable[[datetime], T]) -> EpochMemoisedFunction[T]:
+        return EpochMemoisedFunction(
+            f, quantum=quantum, maxsize=maxsize, enabled=enabled
+        )
+
+    return decorator
+
+
+# **************************************************************************************
+
+_memoisation_lock = Lock()
+
+# **************************************************************************************
+
+
+def _get_memoisable_function(name: str) -> EpochMemoisedFunction[Any]:
+    module, _ = EPOCH_MEMOISABLE_FUNCTIONS[name]
+
+    return getattr(import_module(f"{PACKAGE}.{module}"), name)
+
+
+# **************************************************************************************
+
+
+def _clear_epoch_dependent_caches() -> None:
+    for module, name in EPOCH_DEPENDENT_CACHES:
+        f = getattr(import_module(f"{PACKAGE}.{module}"), name)
+
+        # Clear every layer of caching, e.g., an epoch memoised function which wraps
+        # an lru_cache:
+        while hasattr(f, "cache_clear"):
+            f.cache_clear()
+            f = getattr(f, "__wrapped__", None)
+
+
+# **************************************************************************************
+
+
+def enable_epoch_memoisation(
+    *names: str, quantum: float = 1.0, maxsize: int = 128
+) -> None:
+    """
+    Opts in to memoising the named functions by epoch, throughout the package.
+
+    Each function is wrapped once, where it is defined, so every reference to it
+    (including those imported by name into other modules) shares the same
+    configuration. Every call, including those made internally by the library, is
+    then served from a cache keyed by the epoch rounded to the nearest quantum.
+    The maximum error introduced is given by get_epoch_memoisation_error.
+
+    The package's exact-epoch caches of derived quantities (see
+    EPOCH_DEPENDENT_CACHES) are cleared, such that no result computed before opting
+    in is served afterwards.
+
+    :param names: The names of functions in EPOCH_MEMOISABLE_FUNCTIONS, or all of
+        them if none are given.
+    :param quantum: The width of each epoch bucket (in seconds).
+    :param maxsize: The maximum number of epochs held in each cache.
+    """
+    for name in names:
+        if name not in EPOCH_MEMOISABLE_FUNCTIONS:
+            raise ValueError(f"{name} is not an epoch memoisable function")
+
+    with _memoisation_lock:
+        # Re-enabling a function replaces its existing cache, e.g., to change the
+        # quantum:
+        for name in names or tuple(EPOCH_MEMOISABLE_FUNCTIONS):
+            _get_memoisable_function(name).enable(quantum=quantum, maxsize=maxsize)
+
+        _clear_epoch_dependent_caches()
+
+
+# **************************************************************************************
+
+
+def disable_epoch_memoisation(*names: str) -> None:
+    """
+    Opts out of memoising the named functions by epoch, such that every call is
+    evaluated at its exact epoch.
+
+    The package's exact-epoch caches of derived quantities (see
+    EPOCH_DEPENDENT_CACHES) are cleared, such that no quantised result is served
+    after opting out.
+
+    :param names: The names of the functions to restore, or all of them if none
+        are given.
+    """
+    with _memoisation_lock:
+        for name in names or tuple(EPOCH_MEMOISABLE_FUNCTIONS):
+            if name in EPOCH_MEMOISABLE_FUNCTIONS:
+                _get_memoisable_function(name).disable()
+
+        _clear_epoch_dependent_caches()
+
+
+# **************************************************************************************
+
+
+def get_epoch_memoisation_info() -> Dict[str, EpochCacheInfo]:
+    """
+    Gets the cache statistics of every function currently memoised by epoch.
+
+    :return: The cache statistics, keyed by function name.
+    """
+    with _memoisation_lock:
+        functions = {
+            name: _get_memoisable_function(name) for name in EPOCH_MEMOISABLE_FUNCTIONS
+        }
+
+    return {name: f.cache_info() for name, f in functions.items() if f.enabled}
+
+
+# **************************************************************************************
@@ -6,17 +6,43 @@
 
 # **************************************************************************************
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from math import acos, asin, atan2, cos, degrees, pow, radians, sin, tan
+from functools import lru_cache
+from heapq import merge
+from math import acos, asin, atan2, cos, degrees, floor, radians, sin, tan
+from typing import Callable, Dict, Iterator, Optional, Tuple, TypedDict, Union
+
+from .astrometry import get_hour_angle
+from .common import (
+    Age,
+    EquatorialCoordinate,
+    GeographicCoordinate,
+    get_F_orbital_parameter,
+)
+from .fundamentals import get_fundamental_arguments
+from .roots import find_root
+from .sun import get_solar_state
 
-from .astrometry import get_obliquity_of_the_ecliptic
-from .common import Age, EquatorialCoordinate, get_F_orbital_parameter
-from .epoch import get_number_of_fractional_days_since_j2000
-from .sun import get_ecliptic_longitude as get_mean_solar_ecliptic_longitude
-from .sun import get_ecliptic_longitude as get_solar_ecliptic_longitude
-from .sun import get_mean_anomaly as get_solar_mean_anomaly
-from .temporal import get_julian_date
+# **************************************************************************************
+
+# The mean synodic month, e.g., the mean period between successive new moons (in days):
+SYNODIC_MONTH: float = 29.530588853
+
+# **************************************************************************************
+
+# The mean anomalistic month, e.g., the mean period between successive perigees (in days):
+ANOMALISTIC_MONTH: float = 27.554549886
+
+# **************************************************************************************
+
+# The mean lunar day, e.g., the mean period between successive upper transits (in days):
+LUNAR_DAY: float = 1.0350501
+
+# **************************************************************************************
+
+# The equatorial radius of the Earth (in metres), as defined by WGS84:
+EARTH_EQUATORIAL_RADIUS: float = 6378137.0
 
 # **************************************************************************************
 
@@ -35,88 +61,333 @@ class Phase(Enum):
 # **************************************************************************************
 
 
-def get_annual_equation_correction(date: datetime) -> float:
-    # Correct for the Sun's mean anomaly:
-    M = radians(get_solar_mean_anomaly(date))
+class Apsis(Enum):
+    Perigee = "Perigee"
+    Apogee = "Apogee"
+
+
+# **************************************************************************************
 
-    # Get the annual equation correction:
-    return 0.1858 * sin(M)
+
+class LunarEvent(TypedDict):
+    """
+    :property date: The date of the event.
+    :property event: The principal phase or apsis of the event.
+    """
+
+    date: datetime
+    event: Union[Phase, Apsis]
 
 
 # **************************************************************************************
 
 
-def get_evection_correction(date: datetime) -> float:
-    # Get the Moon's mean anomaly at the current epoch relative to J2000:
-    M = radians(get_mean_anomaly(date))
+class LunarTransit(TypedDict):
+    """
+    :property rise: The time of moonrise preceding the transit, if the Moon rises.
+    :property transit: The time of the Moon's upper transit.
+    :property set: The time of moonset following the transit, if the Moon sets.
+    """
+
+    rise: Optional[datetime]
+    transit: datetime
+    set: Optional[datetime]
+
+
+# **************************************************************************************
+
+
+class LunarState:
+    """
+    The state of the Moon at a particular epoch, where every intermediate quantity
+    (e.g., the mean anomaly, the evection and annual equation corrections, the true
+    anomaly and the true ecliptic longitude) is computed exactly once.
+
+    :property T: The number of Julian centuries since J2000.0.
+    :property d: The number of fractional days since J2000.0.
+    :property M: The mean anomaly (in degrees).
+    :property L: The mean geometric longitude (in degrees).
+    :property λm: The mean ecliptic longitude (in degrees).
+    :property Ω: The mean ecliptic longitude of the ascending node (in degrees).
+    :property Ωcorr: The corrected ecliptic longitude of the ascending node (in degrees).
+    :property Ae: The annual equation correction (in degrees).
+    :property Ev: The evection correction (in degrees).
+    :property Ca: The mean anomaly correction (in degrees).
+    :property ν: The true anomaly (in degrees).
+    :property λt: The true ecliptic longitude (in degrees).
+    :property λ: The ecliptic longitude (in degrees).
+    :property β: The ecliptic latitude (in degrees).
+    :property ε: The obliquity of the ecliptic (in degrees).
+    :property ra: The right ascension (in degrees).
+    :property dec: The declination (in degrees).
+    :property elongation: The elongation of the Moon from the Sun (in degrees).
+    :property A: The age of the Moon (in degrees).
+    :property a: The age of the Moon (in days).
+    :property phase_angle: The phase angle of the Moon (in degrees).
+    :property illumination: The visible illuminated fraction (in unitless %).
+    :property distance: The distance to the Moon (in metres).
+    :property angular_diameter: The angular diameter of the Moon (in degrees).
+    """
+
+    __slots__ = (
+        "T",
+        "d",
+        "M",
+        "L",
+        "λm",
+        "Ω",
+        "Ωcorr",
+        "Ae",
+        "Ev",
+        "Ca",
+        "ν",
+        "λt",
+        "λ",
+        "β",
+        "ε",
+        "ra",
+        "dec",
+        "elongation",
+        "A",
+        "a",
+        "phase_angle",
+        "illumination",
+        "distance",
+        "angular_diameter",
+    )
+
+    def __init__(self, date: datetime) -> None:
+        # Get the fundamental arguments at the epoch:
+        arguments = get_fundamental_arguments(date)
+
+        T = arguments.T
+
+        # Get the number of days since the standard epoch J2000:
+        d = arguments.d
+
+        # Get the state of the Sun at the same epoch:
+        sun = get_solar_state(date)
+
+        # Get the Sun's mean anomaly (in radians):
+        S = radians(sun.M)
+
+        # Get the Moon's mean anomaly at the current epoch relative to J2000:
+        M = arguments.Mm
+
+        # Get the Moon's mean geometric longitude:
+        L = arguments.Lm
+
+        # Get the Moon's ecliptic longitude of the ascending node at the current epoch
+        # relative to J2000, corrected for the Sun's mean anomaly:
+        Ω = arguments.Ω
+
+        # Get the corrected ecliptic longitude of the ascending node:
+        Ωcorr = Ω - 0.16 * sin(S)
+
+        # Get the uncorrected mean eclptic longitude:
+        λm = (13.176339686 * d + 218.31643388) % 360
+
+        # Correct for negative angles
+        if λm < 0:
+            λm += 360
+
+        # Get the annual equation correction:
+        Ae = 0.1858 * sin(S)
+
+        # Get the avection correction:
+        Ev = 1.2739 * sin(2 * (radians(λm) - radians(sun.λ)) - radians(M))
+
+        # Get the mean anomaly correction:
+        Ca = (M + Ev - Ae - 0.37 * sin(S)) % 360
+
+        # Correct for negative angles
+        if Ca < 0:
+            Ca += 360
+
+        # Get the true anomaly:
+        ν = 6.2886 * sin(radians(Ca)) + 0.214 * sin(radians(2 * Ca))
+
+        # Correct for negative angles
+        if ν < 0:
+            ν += 360
+
+        # Get the corrected ecliptic longitude:
+        λc = (λm + Ev + ν - Ae) % 360
+
+        # Correct for negative angles
+        if λc < 0:
+            λc += 360
+
+        # Get the correction of variation:
+        V = 0.6583 * sin(2 * radians(λc - sun.λ))
+
+        λt = (λc + V) % 360
+
+        # Correct for negative angles
+        if λt < 0:
+            λt += 360
+
+        # Get the Moon's orbital inclination:
+        ι = radians(5.1453964)
+
+        # Calculate the ecliptic longitude of the Moon (in degrees):
+        λ = Ωcorr + degrees(
+            atan2(sin(radians(λt - Ωcorr)) * cos(ι), cos(radians(λt - Ωcorr)))
+        )
+
+        # Correct for negative angles
+        if λ < 0:
+            λ += 360
+
+        # Calculate the ecliptic latitude of the Moon (in degrees):
+        β = degrees(asin(sin(radians(λt - Ωcorr)) * sin(ι)))
+
+        # Get the obliquity of the ecliptic:
+        ε = arguments.ε
+
+        # Get the corresponding Right Ascension, α:
+        ra = (
+            degrees(
+                atan2(
+                    sin(radians(λ)) * cos(radians(ε))
+                    - tan(radians(β)) * sin(radians(ε)),
+                    cos(radians(λ)),
+                )
+            )
+            % 360
+        )
+
+        # Correct ra for negative angles
+        if ra < 0:
+            ra += 360
+
+        # Get the elongation of the Moon in degrees:
+        elongation = degrees(acos(cos(radians(λ - sun.λ)) * cos(radians(β)))) % 360
+
+        if elongation < 0:
+            elongation += 360
+
+        # Get the Moon's age in degrees:
+        A = (λt - sun.λ) % 360
 
-    # Get the Moon's mean ecliptic longitude:
-    λ = radians(get_mean_ecliptic_longitude(date))
+        # correct for negative angles:
+        if A < 0:
+            A += 360
 
-    # Get the Sun's mean ecliptic longitude:
-    longitude = radians(get_mean_solar_ecliptic_longitude(date))
+        # Get the phase angle of the Moon in degrees:
+        PA = (
+            180
+            - elongation
+            - (
+                0.1468
+                * ((1 - (0.0549 * sin(radians(M)))) / (1 - (0.0167 * sin(radians(M)))))
+                * sin(radians(elongation))
+            )
+        )
 
-    # Get the avection correction:
-    return 1.2739 * sin(2 * (λ - longitude) - M)
+        # Get the F orbital paramater which applies corrections
+        # due to the Moon's orbital eccentricity:
+        F = get_F_orbital_parameter(ν, 0.0549)
+
+        self.T = T
+        self.d = d
+        self.M = M
+        self.L = L
+        self.λm = λm
+        self.Ω = Ω
+        self.Ωcorr = Ωcorr
+        self.Ae = Ae
+        self.Ev = Ev
+        self.Ca = Ca
+        self.ν = ν
+        self.λt = λt
+        self.λ = λ
+        self.β = β
+        self.ε = ε
+        self.ra = ra
+        self.dec = degrees(
+            asin(
+                sin(radians(β)) * cos(radians(ε))
+                + cos(radians(β)) * sin(radians(ε)) * sin(radians(λ))
+            )
+        )
+        self.elongation = elongation
+        self.A = A
+        # Get the Moon's age in days by multiplying the age, A,
+        # by the number of degrees traversed per day given that
+        # the Moon orbits the Earth every 29.5306 days:
+        self.a = A * (29.5306 / 360)
+        self.phase_angle = PA
+        # Get the total illuminated % fraction:
+        self.illumination = 50 * (1 + cos(radians(PA)))
+        self.distance = 3.84400e8 / F
+        self.angular_diameter = 0.5181 * F
+
+    @property
+    def equatorial_coordinate(self) -> EquatorialCoordinate:
+        """
+        The equatorial coordinate of the Moon (in degrees).
+        """
+        return {"ra": self.ra, "dec": self.dec}
+
+    @property
+    def age(self) -> Age:
+        """
+        The age of the Moon in both degrees and days.
+        """
+        return {"A": self.A, "a": self.a}
 
 
 # **************************************************************************************
 
 
-def get_mean_anomaly(date: datetime) -> float:
+@lru_cache(maxsize=128)
+def get_lunar_state(date: datetime) -> LunarState:
     """
-    The mean anomaly is the angle between the perihelion and the current position
-    of the planet, as seen from the Moon.
+    Get the state of the Moon at a particular epoch.
+
+    The most recently requested epochs are cached, such that repeated calls for the
+    same datetime (e.g., from each of the functions below) share a single computation.
 
     :param date: The datetime object to convert.
-    :return: The mean anomaly in degrees.
+    :return: The state of the Moon at the given epoch.
     """
-    # Get the Julian date:
-    JD = get_julian_date(date)
+    return LunarState(date)
 
-    # Calculate the number of centuries since J2000.0:
-    T = (JD - 2451545.0) / 36525
 
-    # Get the Moon's mean anomaly at the current epoch relative to J2000:
-    M = (
-        134.9634114
-        + 477198.8676313 * T
-        + 0.008997 * pow(T, 2)
-        + pow(T, 3) / 69699
-        - pow(T, 4) / 14712000
-    ) % 360
+# **************************************************************************************
 
-    # Correct for negative angles
-    if M < 0:
-        M += 360
 
-    return M
+def get_annual_equation_correction(date: datetime) -> float:
+    return get_lunar_state(date).Ae
 
 
 # **************************************************************************************
 
 
-def get_mean_anomaly_correction(date: datetime) -> float:
-    # Get the annual equation correction:
-    Ae = get_annual_equation_correction(date)
+def get_evection_correction(date: datetime) -> float:
+    return get_lunar_state(date).Ev
+
+
+# **************************************************************************************
+
 
-    # Get the evection correction:
-    Ev = get_evection_correction(date)
+def get_mean_anomaly(date: datetime) -> float:
+    """
+    The mean anomaly is the angle between the perihelion and the current position
+    of the planet, as seen from the Moon.
 
-    # Get the mean anomaly for the Moon:
-    M = get_mean_anomaly(date)
+    :param date: The datetime object to convert.
+    :return: The mean anomaly in degrees.
+    """
+    return get_lunar_state(date).M
 
-    # Correct for the Sun's mean anomaly:
-    S = radians(get_solar_mean_anomaly(date))
 
-    # Get the mean anomaly correction:
-    Ca = (M + Ev - Ae - 0.37 * sin(S)) % 360
+# **************************************************************************************
 
-    # Correct for negative angles
-    if Ca < 0:
-        Ca += 360
 
-    return Ca
+def get_mean_anomaly_correction(date: datetime) -> float:
+    return get_lunar_state(date).Ca
 
 
 # **************************************************************************************
@@ -130,25 +401,7 @@ def get_mean_geometric_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The mean lunar geometric longitude in degrees
     """
-    # Get the Julian date:
-    JD = get_julian_date(date)
-
-    # Calculate the number of centuries since J2000.0:
-    T = (JD - 2451545.0) / 36525
-
-    longitude = (
-        218.3164477
-        + 481267.88123421 * T
-        - 0.0015786 * pow(T, 2)
-        + pow(T, 3) / 538841
-        - pow(T, 4) / 65194000
-    ) % 360
-
-    # Correct for negative angles
-    if longitude < 0:
-        longitude += 360
-
-    return longitude
+    return get_lunar_state(date).L
 
 
 # **************************************************************************************
@@ -162,20 +415,7 @@ def get_mean_ecliptic_longitude_of_the_ascending_node(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The mean lunar ecliptic longitude of the ascending node in degrees
     """
-    # Get the number of days since the standard epoch J2000:
-    d = get_number_of_fractional_days_since_j2000(date)
-
-    # Get the Moon's ecliptic longitude of the ascending node at the current epoch relative to J2000:
-    Ω = (125.044522 - (0.0529539 * d)) % 360
-
-    # Correct for negative angles
-    if Ω < 0:
-        Ω += 360
-
-    # Correct for the Sun's mean anomaly:
-    M = radians(get_solar_mean_anomaly(date))
-
-    return Ω - 0.16 * sin(M)
+    return get_lunar_state(date).Ω
 
 
 # **************************************************************************************
@@ -189,17 +429,7 @@ def get_mean_ecliptic_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The mean lunar ecliptic longitude in degrees
     """
-    # Get the number of days since the standard epoch J2000:
-    De = get_number_of_fractional_days_since_j2000(date)
-
-    # Get the uncorrected mean eclptic longitude:
-    λ = (13.176339686 * De + 218.31643388) % 360
-
-    # Correct for negative angles
-    if λ < 0:
-        λ += 360
-
-    return λ
+    return get_lunar_state(date).λm
 
 
 # **************************************************************************************
@@ -213,17 +443,7 @@ def get_true_anomaly(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The true anomaly in degrees.
     """
-    # Get the mean anomaly correction:
-    Ca = get_mean_anomaly_correction(date)
-
-    # Get the true anomaly:
-    ν = 6.2886 * sin(radians(Ca)) + 0.214 * sin(radians(2 * Ca))
-
-    # Correct for negative angles
-    if ν < 0:
-        ν += 360
-
-    return ν
+    return get_lunar_state(date).ν
 
 
 # **************************************************************************************
@@ -237,38 +457,7 @@ def get_true_ecliptic_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The corrected lunar ecliptic longitude in degrees
     """
-    # Get the mean ecliptic longitude:
-    λ = get_mean_ecliptic_longitude(date)
-
-    # Get the
-    Ae = get_annual_equation_correction(date)
-
-    # Get the evection correction:
-    Ev = get_evection_correction(date)
-
-    # Get the true anomaly:
-    ν = get_true_anomaly(date)
-
-    # Get the corrected ecliptic longitude:
-    λ = (λ + Ev + ν - Ae) % 360
-
-    # Correct for negative angles
-    if λ < 0:
-        λ += 360
-
-    # Get the solar ecliptic longitude:
-    L = get_solar_ecliptic_longitude(date)
-
-    # Get the correction of variation:
-    V = 0.6583 * sin(2 * radians(λ - L))
-
-    λt = (λ + V) % 360
-
-    # Correct for negative angles
-    if λt < 0:
-        λt += 360
-
-    return λt
+    return get_lunar_state(date).λt
 
 
 # **************************************************************************************
@@ -283,13 +472,7 @@ def get_corrected_ecliptic_longitude_of_the_ascending_node(date: datetime) -> fl
     :param date: The datetime object to convert.
     :return: The corrected ecliptic longitude of the ascending node of the Moon in degrees
     """
-    # Get the ecliptic longitude of the ascending node:
-    Ω = get_mean_ecliptic_longitude_of_the_ascending_node(date)
-
-    # Get the solar mean anomaly:
-    M = get_solar_mean_anomaly(date)
-
-    return Ω - 0.16 * sin(radians(M))
+    return get_lunar_state(date).Ωcorr
 
 
 # **************************************************************************************
@@ -305,25 +488,7 @@ def get_ecliptic_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The ecliptic longitude in degrees.
     """
-    # Get the true ecliptic longitude:
-    λt = get_true_ecliptic_longitude(date)
-
-    # Get the corrected ecliptic longitude of the ascending node:
-    Ωcorr = get_corrected_ecliptic_longitude_of_the_ascending_node(date)
-
-    # Get the Moon's orbital inclination:
-    ι = radians(5.1453964)
-
-    # Calculate the ecliptic longitude of the Moon (in degrees):
-    λ = Ωcorr + degrees(
-        atan2(sin(radians(λt - Ωcorr)) * cos(ι), cos(radians(λt - Ωcorr)))
-    )
-
-    # Correct for negative angles
-    if λ < 0:
-        λ += 360
-
-    return λ
+    return get_lunar_state(date).λ
 
 
 # **************************************************************************************
@@ -339,19 +504,7 @@ def get_ecliptic_latitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The ecliptic latitude in degrees.
     """
-    # Get the true ecliptic longitude:
-    λt = get_true_ecliptic_longitude(date)
-
-    # Get the corrected ecliptic longitude of the ascending node:
-    Ωcorr = get_corrected_ecliptic_longitude_of_the_ascending_node(date)
-
-    # Get the Moon's orbital inclination:
-    ι = radians(5.1453964)
-
-    # Calculate the ecliptic longitude of the Moon (in degrees):
-    β = degrees(asin(sin(radians(λt - Ωcorr)) * sin(ι)))
-
-    return β
+    return get_lunar_state(date).β
 
 
 # **************************************************************************************
@@ -366,25 +519,7 @@ def get_equatorial_coordinate(date: datetime) -> EquatorialCoordinate:
     :param date: The datetime object to convert.
     :return: The equatorial coordinate in degrees.
     """
-    # Get the ecliptic longitude:
-    λ = radians(get_ecliptic_longitude(date))
-
-    # Get the ecliptic latitude:
-    β = radians(get_ecliptic_latitude(date))
-
-    # Get the obliquity of the ecliptic:
-    ε = radians(get_obliquity_of_the_ecliptic(date))
-
-    # Get the corresponding Right Ascension, α:
-    ra = degrees(atan2(sin(λ) * cos(ε) - tan(β) * sin(ε), cos(λ))) % 360
-
-    # Correct ra for negative angles
-    if ra < 0:
-        ra += 360
-
-    dec = degrees(asin(sin(β) * cos(ε) + cos(β) * sin(ε) * sin(λ)))
-
-    return {"ra": ra, "dec": dec}
+    return get_lunar_state(date).equatorial_coordinate
 
 
 # **************************************************************************************
@@ -398,22 +533,7 @@ def get_elongation(date: datetime):
     :param date:
     :return: The Lunar elongation in degrees.
     """
-    # Get the ecliptic longitude:
-    λ = get_ecliptic_longitude(date)
-
-    # Get the ecliptic latitude:
-    β = radians(get_ecliptic_latitude(date))
-
-    # Get the solar ecliptic longitude:
-    λS = get_solar_ecliptic_longitude(date)
-
-    # Get the age of the Moon in degrees:
-    d = degrees(acos(cos(radians(λ - λS)) * cos(β))) % 360
-
-    if d < 0:
-        d += 360
-
-    return d
+    return get_lunar_state(date).elongation
 
 
 # **************************************************************************************
@@ -427,14 +547,7 @@ def get_angular_diameter(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The angular diameter in degrees.
     """
-    # Get the true anomaly:
-    ν = get_true_anomaly(date)
-
-    # Get the F orbital paramater which applies corrections
-    # due to the Moon's orbital eccentricity:
-    F = get_F_orbital_parameter(ν, 0.0549)
-
-    return 0.5181 * F
+    return get_lunar_state(date).angular_diameter
 
 
 # **************************************************************************************
@@ -449,14 +562,7 @@ def get_distance(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The distance in metres.
     """
-    # Get the true anomaly:
-    ν = get_true_anomaly(date)
-
-    # Get the F orbital paramater which applies corrections
-    # due to the Moon's orbital eccentricity:
-    F = get_F_orbital_parameter(ν, 0.0549)
-
-    return 3.84400e8 / F
+    return get_lunar_state(date).distance
 
 
 # **************************************************************************************
@@ -471,26 +577,7 @@ def get_age(date: datetime) -> Age:
     :param date: The datetime object to convert.
     :return: The age of the Moon in both degrees and days.
     """
-
-    # Get the true ecliptic longitude:
-    λt = get_true_ecliptic_longitude(date)
-
-    # Get the solar ecliptic longitude:
-    λ = get_solar_ecliptic_longitude(date)
-
-    # Get the Moon's age in degrees:
-    A = (λt - λ) % 360
-
-    # correct for negative angles:
-    if A < 0:
-        A += 360
-
-    # Get the Moon's age in days by multiplying the age, A,
-    # by the number of degrees traversed per day given that
-    # the Moon orbits the Earth every 29.5306 days:
-    age = A * (29.5306 / 360)
-
-    return {"A": A, "a": age}
+    return get_lunar_state(date).age
 
 
 # **************************************************************************************
@@ -504,24 +591,7 @@ def get_phase_angle(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The phase angle of the Moon in degrees.
     """
-    # Get the mean anomaly:
-    M = radians(get_mean_anomaly(date))
-
-    # Get the age of the Moon in degrees (elongation):
-    d = get_elongation(date)
-
-    # Get the phase angle of the Moon in degrees:
-    PA = (
-        180
-        - d
-        - (
-            0.1468
-            * ((1 - (0.0549 * sin(M))) / (1 - (0.0167 * sin(M))))
-            * sin(radians(d))
-        )
-    )
-
-    return PA
+    return get_lunar_state(date).phase_angle
 
 
 # **************************************************************************************
@@ -536,11 +606,7 @@ def get_illumination(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The visible portion illumination of the Moon (in unitless %)
     """
-    # Get the phase angle:
-    PA = get_phase_angle(date)
-
-    # Get the total illuminated % fraction:
-    return 50 * (1 + cos(radians(PA)))
+    return get_lunar_state(date).illumination
 
 
 # **************************************************************************************
@@ -584,3 +650,267 @@ def get_phase(date: datetime) -> Phase:
 
 
 # **************************************************************************************
+
+
+def _get_lunar_angle_crossings(
+    start: datetime,
+    end: datetime,
+    angle: Callable[[datetime], float],
+    period: float,
+    count: int,
+) -> Iterator[Tuple[datetime, int]]:
+    """
+    Yield the instants at which an angle, which increases by 360 degrees per period,
+    passes through each of a set of equally spaced targets between two dates.
+
+    Each crossing is bracketed using the mean period, and then refined to within
+    one second using a bracketed root solver.
+
+    :param start: The date to start searching from.
+    :param end: The date to stop searching at.
+    :param angle: The angle (in degrees) as a function of the date.
+    :param period: The mean period of the angle (in days).
+    :param count: The number of equally spaced target angles, starting from 0°.
+    :return: An iterator of the crossings between the two dates, in time order, as
+    tuples of the date and the index of the target angle.
+    """
+    # The angle between successive targets (in degrees):
+    step = 360 / count
+
+    # Get the angle at the start date:
+    θ = angle(start) % 360
+
+    # Get the index of the next target angle after the start date:
+    index = (floor(θ / step) + 1) % count
+
+    # Get the first guess for the next target, assuming the mean rate of motion:
+    guess = start + timedelta(days=((index * step - θ) % 360) / 360 * period)
+
+    # The half-width of the bracket around each guess, which only ever contains a
+    # single crossing of the target angle (in seconds):
+    width = period / count / 2 * 86400
+
+    while guess - timedelta(seconds=width) <= end:
+        target = index * step
+
+        def f(seconds: float) -> float:
+            return (
+                (angle(guess + timedelta(seconds=seconds)) - target + 180) % 360
+            ) - 180
+
+        when = guess + timedelta(
+            seconds=find_root(f, -width, width, tolerance=1.0),
+        )
+
+        if start <= when <= end:
+            yield when, index
+
+        # Get the first guess for the next target, from the current crossing:
+        guess = when + timedelta(days=period / count)
+
+        index = (index + 1) % count
+
+
+# **************************************************************************************
+
+
+def get_lunar_events(
+    start: datetime, end: datetime, apsides: bool = False
+) -> Iterator[LunarEvent]:
+    """
+    Yield the exact instants of the principal phases of the Moon (new, first
+    quarter, full and last quarter), and optionally of perigee and apogee, between
+    two dates.
+
+    The principal phases are defined where the difference between the ecliptic
+    longitudes of the Moon and the Sun is 0°, 90°, 180° and 270°, and the apsides
+    where the corrected mean anomaly of the Moon is 0° and 180°.
+
+    :param start: The date to start searching from.
+    :param end: The date to stop searching at.
+    :param apsides: Whether to also yield perigee and apogee.
+    :return: An iterator of the lunar events between the two dates, in time order.
+    """
+
+    def get_elongation_in_longitude(date: datetime) -> float:
+        return get_lunar_state(date).λ - get_solar_state(date).λ
+
+    principal = (Phase.New, Phase.FirstQuarter, Phase.Full, Phase.LastQuarter)
+
+    phases: Iterator[LunarEvent] = (
+        {"date": when, "event": principal[index]}
+        for when, index in _get_lunar_angle_crossings(
+            start, end, get_elongation_in_longitude, SYNODIC_MONTH, 4
+        )
+    )
+
+    if not apsides:
+        yield from phases
+        return
+
+    def get_anomaly(date: datetime) -> float:
+        return get_lunar_state(date).Ca
+
+    extrema = (Apsis.Perigee, Apsis.Apogee)
+
+    apsis: Iterator[LunarEvent] = (
+        {"date": when, "event": extrema[index]}
+        for when, index in _get_lunar_angle_crossings(
+            start, end, get_anomaly, ANOMALISTIC_MONTH, 2
+        )
+    )
+
+    yield from merge(phases, apsis, key=lambda event: event["date"])
+
+
+# **************************************************************************************
+
+
+def get_horizontal_parallax(date: datetime) -> float:
+    """
+    The horizontal parallax of the Moon is the angle subtended by the Earth's
+    equatorial radius, as seen from the centre of the Moon.
+
+    :param date: The datetime object to convert.
+    :return: The horizontal parallax in degrees.
+    """
+    return degrees(asin(EARTH_EQUATORIAL_RADIUS / get_lunar_state(date).distance))
+
+
+# **************************************************************************************
+
+
+def _get_lunar_limb_altitude(
+    date: datetime, observer: GeographicCoordinate, horizon: float
+) -> float:
+    """
+    Get the apparent topocentric altitude of the Moon's upper limb above the given
+    horizon, corrected for horizontal parallax, the Moon's semi-diameter and the
+    standard atmospheric refraction at the horizon (34').
+
+    :param date: The datetime object to convert.
+    :param observer: The geographic coordinate of the observer.
+    :param horizon: The observer's horizon (in degrees).
+    :return: The altitude of the Moon's upper limb above the horizon (in degrees).
+    """
+    state = get_lunar_state(date)
+
+    latitude, dec = radians(observer["latitude"]), radians(state.dec)
+
+    ha = radians(get_hour_angle(date, state.ra, observer["longitude"]))
+
+    # Get the geocentric altitude of the Moon's centre:
+    alt = asin(sin(dec) * sin(latitude) + cos(dec) * cos(latitude) * cos(ha))
+
+    # Get the horizontal parallax of the Moon:
+    π = asin(EARTH_EQUATORIAL_RADIUS / state.distance)
+
+    return degrees(alt - π * cos(alt)) + state.angular_diameter / 2 + 34 / 60 - horizon
+
+
+# **************************************************************************************
+
+
+def get_lunar_transits(
+    start: datetime,
+    end: datetime,
+    observer: GeographicCoordinate,
+    horizon: float = 0,
+) -> Iterator[LunarTransit]:
+    """
+    Yield the times of moonrise, upper transit and moonset, to within one second,
+    for each upper transit of the Moon between two dates.
+
+    Transits are solved on the Moon's hour angle, and rise and set on the apparent
+    topocentric altitude of the Moon's upper limb, re-evaluating the Moon's position
+    at every iteration such that its fast motion is accounted for.
+
+    :param start: The date to start searching from.
+    :param end: The date to stop searching at.
+    :param observer: The geographic coordinate of the observer.
+    :param horizon: The observer's horizon (in degrees).
+    :return: An iterator of the rise, transit and set of the Moon, in time order.
+    """
+    latitude, longitude = radians(observer["latitude"]), observer["longitude"]
+
+    def get_lunar_hour_angle(date: datetime) -> float:
+        state = get_lunar_state(date)
+        return get_hour_angle(date, state.ra, longitude)
+
+    # Find the upper (index 0) and lower (index 1) transits, including those either
+    # side of the date range which bound the first and last rise and set:
+    transits = list(
+        _get_lunar_angle_crossings(
+            start - timedelta(days=LUNAR_DAY),
+            end + timedelta(days=LUNAR_DAY),
+            get_lunar_hour_angle,
+            LUNAR_DAY,
+            2,
+        )
+    )
+
+    altitudes: Dict[datetime, float] = {}
+
+    def get_altitude(date: datetime) -> float:
+        if date not in altitudes:
+            altitudes[date] = _get_lunar_limb_altitude(date, observer, horizon)
+        return altitudes[date]
+
+    def get_crossing(
+        transit: datetime, culmination: datetime, rising: bool
+    ) -> Optional[datetime]:
+        a, b = (culmination, transit) if rising else (transit, culmination)
+
+        fa, fb = get_altitude(a), get_altitude(b)
+
+        # If the Moon does not cross the horizon between culminations, there is
+        # no rise (or set):
+        if (fa < 0) == (fb < 0):
+            return None
+
+        def f(seconds: float) -> float:
+            return _get_lunar_limb_altitude(
+                a + timedelta(seconds=seconds), observer, horizon
+            )
+
+        width = (b - a).total_seconds()
+
+        lo, flo, hi, fhi = 0.0, fa, width, fb
+
+        dec = radians(get_lunar_state(transit).dec)
+
+        # Get the cosine of the hour angle of the crossing from the closed form:
+        cosH = -tan(latitude) * tan(dec)
+
+        if abs(cosH) <= 1:
+            # Get the hour angle of the crossing from transit (in seconds):
+            H = degrees(acos(cosH)) / 360 * LUNAR_DAY * 86400
+
+            guess = (width - H) if rising else H
+
+            # Attempt to narrow the bracket to thirty minutes either side of the guess:
+            nlo, nhi = max(guess - 1800, 0.0), min(guess + 1800, width)
+
+            fnlo, fnhi = f(nlo), f(nhi)
+
+            if (fnlo < 0) != (fnhi < 0):
+                lo, flo, hi, fhi = nlo, fnlo, nhi, fnhi
+
+        return a + timedelta(
+            seconds=find_root(f, lo, hi, tolerance=1.0, fa=flo, fb=fhi)
+        )
+
+    for i in range(1, len(transits) - 1):
+        transit, index = transits[i]
+
+        if index != 0 or not start <= transit <= end:
+            continue
+
+        yield {
+            "rise": get_crossing(transit, transits[i - 1][0], True),
+            "transit": transit,
+            "set": get_crossing(transit, transits[i + 1][0], False),
+        }
+
+
+# **************************************************************************************
@@ -6,13 +6,26 @@
 
 # **************************************************************************************
 
-from datetime import datetime, timedelta
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import List, Optional, Tuple, TypedDict
-
-from .common import GeographicCoordinate, HorizontalCoordinate
+from functools import lru_cache
+from json import dumps, loads
+from math import acos, ceil, cos, degrees, isnan, nan, radians, sin
+from os import replace
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypedDict
+
+from .astrometry import get_hour_angle
+from .common import GeographicCoordinate
 from .coordinates import convert_equatorial_to_horizontal
 from .refraction import get_correction_to_horizontal_for_refraction
+from .roots import find_root
 from .sun import get_equatorial_coordinate
 
 # **************************************************************************************
@@ -37,6 +50,40 @@ class Night(TypedDict):
 # **************************************************************************************
 
 
+class Twilight(TypedDict):
+    """
+    :property dawn: The time the Sun rises through the twilight altitude.
+    :property dusk: The time the Sun sets through the twilight altitude.
+    """
+
+    dawn: Optional[datetime]
+    dusk: Optional[datetime]
+
+
+# **************************************************************************************
+
+
+class SolarEvents(TypedDict):
+    """
+    :property rise: The time of sunrise, or None if the Sun does not rise.
+    :property transit: The time of solar transit (local solar noon).
+    :property set: The time of sunset, or None if the Sun does not set.
+    :property civil: The civil twilight boundaries (Sun 6° below the horizon).
+    :property nautical: The nautical twilight boundaries (Sun 12° below the horizon).
+    :property astronomical: The astronomical twilight boundaries (Sun 18° below the horizon).
+    """
+
+    rise: Optional[datetime]
+    transit: datetime
+    set: Optional[datetime]
+    civil: Twilight
+    nautical: Twilight
+    astronomical: Twilight
+
+
+# **************************************************************************************
+
+
 def get_solar_altitude(
     date: datetime,
     observer: GeographicCoordinate,
@@ -64,64 +111,219 @@ def get_solar_altitude(
 # **************************************************************************************
 
 
-def get_solar_transit(
-    date: datetime, observer: GeographicCoordinate, horizon: float = 0
-) -> Tuple[Optional[datetime], Optional[datetime], Optional[datetime]]:
-    # Set the date to be at 1 minute before midnight for the previous date:
-    date = date.replace(hour=0, minute=0, second=0, microsecond=0)
+def get_solar_noon(date: datetime, observer: GeographicCoordinate) -> datetime:
+    """
+    Get the time of solar transit (local solar noon) for the given date and location,
+    i.e., when the hour angle of the Sun is zero.
 
-    # Cycle through the day in 1 second intervals to construct a list of
-    # the Sun's altitude at each second:
-    sun: List[HorizontalCoordinate] = []
+    The first guess assumes the mean Sun, and is then refined using the hour angle
+    of the true Sun until the correction is less than half of one second.
 
-    rise: Optional[int] = None
+    :param date: The date to check.
+    :param observer: The geographic coordinates of the observer.
+    :return: The time of solar transit.
+    """
+    longitude = observer["longitude"]
 
-    set: Optional[int] = None
+    # Assume the mean Sun transits at 12h local mean time as a first guess:
+    noon = date.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+        hours=12 - longitude / 15
+    )
 
-    for i in range(1440):
+    for _ in range(5):
         # Get the Sun's equatorial coordinate:
-        eq = get_equatorial_coordinate(date)
+        eq = get_equatorial_coordinate(noon)
+
+        # Get the hour angle of the Sun (in degrees), normalised to [-180, 180):
+        ha = get_hour_angle(noon, eq["ra"], longitude)
+
+        if ha >= 180:
+            ha -= 360
+
+        # The Sun's hour angle advances by (approximately) 15 degrees per solar hour:
+        Δ = timedelta(hours=ha / 15)
+
+        noon -= Δ
+
+        if abs(Δ.total_seconds()) < 0.5:
+            break
+
+    return noon
+
+
+# **************************************************************************************
+
+
+def _get_solar_horizon_crossing(
+    noon: datetime,
+    observer: GeographicCoordinate,
+    horizon: float,
+    rising: bool,
+    altitudes: Tuple[float, float],
+) -> Optional[datetime]:
+    """
+    Get the time the Sun crosses the given altitude between the preceding (when
+    rising) or following (when setting) lower culmination and solar transit.
+
+    The hour angle closed form provides a first guess, which is bracketed and then
+    refined to within one second using a bracketed root solver on solar altitude.
+
+    :param noon: The time of solar transit.
+    :param observer: The geographic coordinates of the observer.
+    :param horizon: The altitude to find the crossing of (in degrees).
+    :param rising: Whether to find the rising (True) or setting (False) crossing.
+    :param altitudes: The Sun's altitude at lower culmination and at transit.
+    :return: The time of the crossing, or None if the Sun does not cross the altitude.
+    """
+
+    def f(seconds: float) -> float:
+        return get_solar_altitude(noon + timedelta(seconds=seconds), observer) - horizon
+
+    # The signed offset from transit to the lower culmination (in seconds):
+    culmination = -43200.0 if rising else 43200.0
+
+    lower, upper = altitudes[0] - horizon, altitudes[1] - horizon
+
+    # If the Sun does not pass through the altitude between lower culmination and
+    # transit, e.g., during polar day or polar night, there is no crossing:
+    if (lower < 0) == (upper < 0):
+        return None
+
+    # The widest possible bracket, between lower culmination and transit:
+    a, fa, b, fb = culmination, lower, 0.0, upper
+
+    latitude = radians(observer["latitude"])
+
+    dec = radians(get_equatorial_coordinate(noon)["dec"])
+
+    # Get the cosine of the hour angle of the crossing from the closed form:
+    cosH = (sin(radians(horizon)) - sin(latitude) * sin(dec)) / (
+        cos(latitude) * cos(dec)
+    )
+
+    if abs(cosH) <= 1:
+        # Get the hour angle of the crossing from transit (in seconds):
+        H = degrees(acos(cosH)) / 15 * 3600
+
+        guess = -H if rising else H
+
+        # Attempt to narrow the bracket to ten minutes either side of the guess:
+        lo, hi = max(guess - 600, -43200.0), min(guess + 600, 43200.0)
+
+        flo, fhi = f(lo), f(hi)
+
+        if (flo < 0) != (fhi < 0):
+            a, fa, b, fb = lo, flo, hi, fhi
+
+    seconds = find_root(f, a, b, tolerance=0.5, fa=fa, fb=fb)
+
+    return noon + timedelta(seconds=seconds)
+
+
+# **************************************************************************************
+
+
+def get_solar_events(
+    date: datetime, observer: GeographicCoordinate, horizon: float = 0
+) -> SolarEvents:
+    """
+    Get the times of sunrise, solar transit and sunset, alongside the civil,
+    nautical and astronomical twilight boundaries, for the given date and location.
 
-        # Convert the equatorial coordinate to a horizontal coordinate:
-        hz = convert_equatorial_to_horizontal(date, observer, eq)
+    Each event is solved for directly (to within one second) from the hour angle
+    closed form, refined with a bracketed root solver on solar altitude, rather
+    than by scanning the Sun's altitude throughout the day.
 
-        # Correct the horizontal coordinate for atmospheric refraction:
-        hz = get_correction_to_horizontal_for_refraction(hz, 288.15, 101325)
+    :param date: The date to check.
+    :param observer: The geographic coordinates of the observer.
+    :param horizon: The altitude of the horizon in degrees.
+    :return: The solar events for the given date and location.
+    """
+    noon = get_solar_noon(date, observer)
 
-        # Find the altitude of the Sun where it crosses over the horizon:
-        if hz["alt"] > horizon and rise is None:
-            rise = i
+    # Get the Sun's altitude at the preceding lower culmination, transit and the
+    # following lower culmination, which are shared by all of the crossings:
+    dawn = get_solar_altitude(noon - timedelta(hours=12), observer)
 
-        # Find the altitude of the Sun where it crosses back under the horizon:
-        if hz["alt"] < horizon and set is None and rise is not None:
-            set = i
+    zenith = get_solar_altitude(noon, observer)
 
-        sun.append(hz)
+    dusk = get_solar_altitude(noon + timedelta(hours=12), observer)
 
-        # Increment the date by 1 second:
-        date += timedelta(minutes=1)
+    def get_twilight(altitude: float) -> Twilight:
+        return {
+            "dawn": _get_solar_horizon_crossing(
+                noon, observer, altitude, True, (dawn, zenith)
+            ),
+            "dusk": _get_solar_horizon_crossing(
+                noon, observer, altitude, False, (dusk, zenith)
+            ),
+        }
 
-    # Find the index of the maximum altitude:
-    noon = max(range(len(sun)), key=lambda i: sun[i]["alt"])
+    horizontal = get_twilight(horizon)
 
-    date = date - timedelta(minutes=1440)
+    return {
+        "rise": horizontal["dawn"],
+        "transit": noon,
+        "set": horizontal["dusk"],
+        "civil": get_twilight(-6),
+        "nautical": get_twilight(-12),
+        "astronomical": get_twilight(-18),
+    }
 
-    # Get the time of the maximum altitude:
-    transit = date.replace(hour=0, minute=0, second=0) + timedelta(minutes=noon)
 
-    # Get the time of the sunrise:
-    if rise is not None:
-        sunrise = date.replace(hour=0, minute=0, second=0) + timedelta(minutes=rise)
-    else:
-        sunrise = None
+# **************************************************************************************
+
+
+def get_solar_transit(
+    date: datetime, observer: GeographicCoordinate, horizon: float = 0
+) -> Tuple[Optional[datetime], Optional[datetime], Optional[datetime]]:
+    """
+    Get the times of sunrise, solar transit and sunset for the given date and
+    location, to minute resolution.
 
-    # Get the time of the sunset:
-    if set is not None:
-        sunset = date.replace(hour=0, minute=0, second=0) + timedelta(minutes=set)
-    else:
-        sunset = None
+    Sunrise and sunset are given as the first whole minute at which the Sun is
+    above or below the horizon respectively, and the transit is given as the
+    whole minute nearest to the Sun's maximum altitude.
 
-    return sunrise, transit, sunset
+    :param date: The date to check.
+    :param observer: The geographic coordinates of the observer.
+    :param horizon: The altitude of the horizon in degrees.
+    :return: A tuple of the times of sunrise, solar transit and sunset.
+    """
+    noon = get_solar_noon(date, observer)
+
+    zenith = get_solar_altitude(noon, observer)
+
+    rise = _get_solar_horizon_crossing(
+        noon,
+        observer,
+        horizon,
+        True,
+        (get_solar_altitude(noon - timedelta(hours=12), observer), zenith),
+    )
+
+    set = _get_solar_horizon_crossing(
+        noon,
+        observer,
+        horizon,
+        False,
+        (get_solar_altitude(noon + timedelta(hours=12), observer), zenith),
+    )
+
+    def get_minute(when: datetime, rounding=ceil) -> datetime:
+        minutes = rounding(
+            (when - when.replace(hour=0, minute=0, second=0, microsecond=0))
+            / timedelta(minutes=1)
+        )
+        return when.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+            minutes=minutes
+        )
+
+    return (
+        get_minute(rise) if rise else None,
+        get_minute(noon, round),
+        get_minute(set) if set else None,
+    )
 
 
 # **************************************************************************************
@@ -154,26 +356,103 @@ def get_night(
 # **************************************************************************************
 
 
+@lru_cache(maxsize=4096)
+def _get_solar_day_boundaries(
+    year: int,
+    month: int,
+    day: int,
+    latitude: float,
+    longitude: float,
+    horizon: float,
+) -> Tuple[float, float, bool]:
+    """
+    Get the times the Sun rises and sets through the horizon for the solar day
+    centred on local mean noon of the given date.
+
+    :return: A tuple of the POSIX timestamps of the rise and set (NaN if the Sun does
+    not rise or set), and whether the Sun is above the horizon at transit.
+    """
+    observer: GeographicCoordinate = {"latitude": latitude, "longitude": longitude}
+
+    noon = get_solar_noon(datetime(year, month, day, tzinfo=timezone.utc), observer)
+
+    zenith = get_solar_altitude(noon, observer)
+
+    rise = _get_solar_horizon_crossing(
+        noon,
+        observer,
+        horizon,
+        True,
+        (get_solar_altitude(noon - timedelta(hours=12), observer), zenith),
+    )
+
+    set = _get_solar_horizon_crossing(
+        noon,
+        observer,
+        horizon,
+        False,
+        (get_solar_altitude(noon + timedelta(hours=12), observer), zenith),
+    )
+
+    return (
+        nan if rise is None else rise.timestamp(),
+        nan if set is None else set.timestamp(),
+        zenith > horizon,
+    )
+
+
+# **************************************************************************************
+
+
 def is_night(
-    date: datetime, observer: GeographicCoordinate, horizon: float = 0
+    date: datetime,
+    observer: GeographicCoordinate,
+    horizon: float = 0,
+    cache: bool = False,
 ) -> bool:
     """
     Determine if the Sun is below the horizon at the given datetime and location.
 
+    By default, the Sun's altitude is evaluated directly at the given instant. When
+    cache is True, the rise and set of the Sun for the observer's local solar day
+    are computed once and cached, such that subsequent queries for the same day and
+    observer reduce to a comparison.
+
     :param date: The datetime to check.
     :param observer: The geographic coordinates of the observer.
     :param horizon: The altitude of the horizon in degrees.
+    :param cache: Whether to cache the Sun's rise and set for the observer's day.
     """
+    if not cache:
+        return get_solar_altitude(date, observer) < horizon
 
-    # Get the time of the sunset for the given date:
-    sunrise, _, sunset = get_solar_transit(date, observer, horizon)
+    longitude = observer["longitude"]
 
-    if (sunrise is not None and date < sunrise) or (
-        sunset is not None and date > sunset
-    ):
-        return True
+    # Get the observer's local mean solar date, so that the instant falls within
+    # the solar day centred on local mean noon:
+    local = date.astimezone(tz=timezone.utc) + timedelta(hours=longitude / 15)
 
-    return False
+    rise, set, up = _get_solar_day_boundaries(
+        local.year,
+        local.month,
+        local.day,
+        observer["latitude"],
+        longitude,
+        horizon,
+    )
+
+    # The observer could be in perpetual daylight or perpetual night, e.g., the
+    # North Pole or South Pole:
+    if isnan(rise) and isnan(set):
+        return not up
+
+    # If the Sun only rises or sets during the day, fall back to its altitude:
+    if isnan(rise) or isnan(set):
+        return get_solar_altitude(date, observer) < horizon
+
+    when = date.timestamp()
+
+    return when < rise or when > set
 
 
 # **************************************************************************************
@@ -201,3 +480,396 @@ def get_night_phase(altitude: float) -> NightPhase:
 
 
 # **************************************************************************************
+
+
+def get_night_phases(
+    timestamps: Iterable[float], observer: GeographicCoordinate
+) -> List[NightPhase]:
+    """
+    Determine the phase of the night for many instants at the given location.
+
+    Each instant requires exactly one evaluation of the Sun's altitude.
+
+    :param timestamps: The POSIX timestamps (in seconds) of the instants to classify.
+    :param observer: The geographic coordinates of the observer.
+    :return: The phase of the night at each instant.
+    """
+    return [
+        get_night_phase(
+            get_solar_altitude(datetime.fromtimestamp(when, timezone.utc), observer)
+        )
+        for when in timestamps
+    ]
+
+
+# **************************************************************************************
+
+# The columns of the almanac, each holding one POSIX timestamp (in seconds) per day:
+ALMANAC_COLUMNS: Tuple[str, ...] = (
+    "rise",
+    "transit",
+    "set",
+    "civil_dawn",
+    "civil_dusk",
+    "nautical_dawn",
+    "nautical_dusk",
+    "astronomical_dawn",
+    "astronomical_dusk",
+    "night_start",
+    "night_end",
+)
+
+# **************************************************************************************
+
+# The maximum number of almanacs to retain in the in-memory cache:
+MAX_ALMANAC_CACHE_SIZE = 256
+
+# **************************************************************************************
+
+# The cache key of an almanac, e.g., the rounded latitude and longitude of the observer,
+# the year and the horizon:
+AlmanacKey = Tuple[float, float, int, float]
+
+# **************************************************************************************
+
+
+@dataclass(frozen=True)
+class Almanac:
+    """
+    A year of daily solar events for an observer, stored in a compact columnar
+    layout where each column is an array of POSIX timestamps (in seconds), one
+    per day of the year.
+
+    Events which do not occur on a given day (e.g., sunset during polar day) are
+    stored as NaN.
+    """
+
+    year: int
+
+    latitude: float
+
+    longitude: float
+
+    horizon: float
+
+    columns: Dict[str, array]
+
+    def __len__(self) -> int:
+        return len(self.columns["transit"])
+
+    def get_column(self, name: str) -> array:
+        """
+        Get a column of the almanac by name, e.g., "rise" or "civil_dusk".
+
+        :param name: The name of the column.
+        :return: The column of POSIX timestamps (in seconds), one per day.
+        """
+        return self.columns[name]
+
+    def get_event(self, name: str, day: int) -> Optional[datetime]:
+        """
+        Get a single event from the almanac as a datetime.
+
+        :param name: The name of the column.
+        :param day: The zero-based day of the year.
+        :return: The datetime of the event, or None if it does not occur.
+        """
+        timestamp = self.columns[name][day]
+
+        return (
+            None
+            if isnan(timestamp)
+            else datetime.fromtimestamp(timestamp, timezone.utc)
+        )
+
+    def get_night(self, day: int) -> Optional[Night]:
+        """
+        Get the night following the given day of the year.
+
+        :param day: The zero-based day of the year.
+        :return: The start and end of the night, or None in perpetual day or night.
+        """
+        start = self.get_event("night_start", day)
+
+        end = self.get_event("night_end", day)
+
+        if start is None or end is None:
+            return None
+
+        return {"start": start, "end": end}
+
+
+# **************************************************************************************
+
+_almanac_cache_lock = Lock()
+
+# **************************************************************************************
+
+_almanac_cache: "OrderedDict[AlmanacKey, Almanac]" = OrderedDict()
+
+# **************************************************************************************
+
+
+def _get_almanac_key(
+    year: int, observer: GeographicCoordinate, horizon: float
+) -> AlmanacKey:
+    # Round the observer's location to ~10 metres, as the solar events are
+    # insensitive to smaller changes in position. N.B. The observer's elevation is
+    # not part of the key, as the solar events do not depend upon it:
+    return (
+        round(observer["latitude"], 4),
+        round(observer["longitude"], 4),
+        year,
+        round(horizon, 2),
+    )
+
+
+# **************************************************************************************
+
+
+def _get_almanac_path(directory: Path, key: AlmanacKey) -> Path:
+    latitude, longitude, year, horizon = key
+
+    return directory / (
+        f"almanac_{year}_{latitude:+.4f}_{longitude:+.4f}_{horizon:+.2f}.json"
+    )
+
+
+# **************************************************************************************
+
+
+def _generate_almanac(key: AlmanacKey) -> Almanac:
+    latitude, longitude, year, horizon = key
+
+    observer: GeographicCoordinate = {"latitude": latitude, "longitude": longitude}
+
+    start = datetime(year, 1, 1, tzinfo=timezone.utc)
+
+    days = (datetime(year + 1, 1, 1, tzinfo=timezone.utc) - start).days
+
+    columns: Dict[str, array] = {name: array("d") for name in ALMANAC_COLUMNS}
+
+    def get_timestamp(when: Optional[datetime]) -> float:
+        return nan if when is None else when.timestamp()
+
+    # Compute one additional day, so that the night following the final day of the
+    # year has an end:
+    for day in range(days + 1):
+        events = get_solar_events(start + timedelta(days=day), observer, horizon)
+
+        if day > 0:
+            columns["night_end"].append(get_timestamp(events["rise"]))
+
+        if day == days:
+            break
+
+        columns["rise"].append(get_timestamp(events["rise"]))
+        columns["transit"].append(get_timestamp(events["transit"]))
+        columns["set"].append(get_timestamp(events["set"]))
+        columns["night_start"].append(get_timestamp(events["set"]))
+
+        for twilight in ("civil", "nautical", "astronomical"):
+            columns[f"{twilight}_dawn"].append(get_timestamp(events[twilight]["dawn"]))
+            columns[f"{twilight}_dusk"].append(get_timestamp(events[twilight]["dusk"]))
+
+    return Almanac(
+        year=year,
+        latitude=latitude,
+        longitude=longitude,
+        horizon=horizon,
+        columns=columns,
+    )
+
+
+# **************************************************************************************
+
+
+def _read_almanac(path: Path) -> Optional[Almanac]:
+    # A missing, unreadable or invalid (e.g., truncated or corrupted) almanac is
+    # treated as a cache miss, such that it is regenerated and rewritten:
+    try:
+        data = loads(path.read_text(encoding="utf-8"))
+
+        almanac = Almanac(
+            year=data["year"],
+            latitude=data["latitude"],
+            longitude=data["longitude"],
+            horizon=data["horizon"],
+            columns={
+                name: array("d", data["columns"][name]) for name in ALMANAC_COLUMNS
+            },
+        )
+
+        days = (datetime(almanac.year + 1, 1, 1) - datetime(almanac.year, 1, 1)).days
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if any(len(column) != days for column in almanac.columns.values()):
+        return None
+
+    return almanac
+
+
+# **************************************************************************************
+
+
+def _write_almanac(path: Path, almanac: Almanac) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = {
+        "year": almanac.year,
+        "latitude": almanac.latitude,
+        "longitude": almanac.longitude,
+        "horizon": almanac.horizon,
+        "columns": {name: almanac.columns[name].tolist() for name in ALMANAC_COLUMNS},
+    }
+
+    # Write to a temporary file in the same directory, and then atomically replace
+    # the almanac, such that concurrent readers never see a partially written file:
+    fd, temporary = mkstemp(dir=path.parent, prefix=f".{path.stem}_", suffix=".tmp")
+
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(dumps(data))
+
+        replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+# **************************************************************************************
+
+
+def _cache_almanac(key: AlmanacKey, almanac: Almanac) -> None:
+    with _almanac_cache_lock:
+        _almanac_cache[key] = almanac
+
+        _almanac_cache.move_to_end(key)
+
+        # Evict the least recently used almanacs:
+        while len(_almanac_cache) > MAX_ALMANAC_CACHE_SIZE:
+            _almanac_cache.popitem(last=False)
+
+
+# **************************************************************************************
+
+
+def _get_cached_almanac(
+    key: AlmanacKey, directory: Optional[Path] = None
+) -> Optional[Almanac]:
+    with _almanac_cache_lock:
+        if key in _almanac_cache:
+            _almanac_cache.move_to_end(key)
+            return _almanac_cache[key]
+
+    if directory is None:
+        return None
+
+    almanac = _read_almanac(_get_almanac_path(directory, key))
+
+    if almanac is not None:
+        _cache_almanac(key, almanac)
+
+    return almanac
+
+
+# **************************************************************************************
+
+
+def get_almanac(
+    year: int,
+    observer: GeographicCoordinate,
+    horizon: float = 0,
+    directory: Optional[Path] = None,
+) -> Almanac:
+    """
+    Get a year of daily solar events (rise, transit, set, twilights and night) for
+    the given observer.
+
+    Almanacs are cached in memory by the rounded location of the observer, the year
+    and the horizon, with the least recently used almanacs evicted first. If a
+    directory is given, almanacs are also persisted to (and read from) disk.
+
+    :param year: The year to generate the almanac for.
+    :param observer: The geographic coordinates of the observer.
+    :param horizon: The altitude of the horizon in degrees.
+    :param directory: The optional directory to persist almanacs to.
+    :return: The almanac for the given year and observer.
+    """
+    key = _get_almanac_key(year, observer, horizon)
+
+    almanac = _get_cached_almanac(key, directory)
+
+    if almanac is not None:
+        return almanac
+
+    almanac = _generate_almanac(key)
+
+    if directory is not None:
+        _write_almanac(_get_almanac_path(directory, key), almanac)
+
+    _cache_almanac(key, almanac)
+
+    return almanac
+
+
+# **************************************************************************************
+
+
+def get_almanacs(
+    year: int,
+    observers: Sequence[GeographicCoordinate],
+    horizon: float = 0,
+    directory: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> List[Almanac]:
+    """
+    Get a year of daily solar events for many observers, generating any almanacs
+    which are not already cached in parallel across a process pool.
+
+    :param year: The year to generate the almanacs for.
+    :param observers: The geographic coordinates of the observers.
+    :param horizon: The altitude of the horizon in degrees.
+    :param directory: The optional directory to persist almanacs to.
+    :param workers: The maximum number of worker processes (defaults to the CPU count).
+    :return: The almanacs for the given year, in the same order as the observers.
+    """
+    keys = [_get_almanac_key(year, observer, horizon) for observer in observers]
+
+    almanacs: Dict[AlmanacKey, Almanac] = {}
+
+    for key in keys:
+        almanac = _get_cached_almanac(key, directory)
+
+        if almanac is not None:
+            almanacs[key] = almanac
+
+    # Generate each missing almanac only once, even if sites share a key:
+    missing = list(dict.fromkeys(key for key in keys if key not in almanacs))
+
+    if missing:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for key, almanac in zip(missing, executor.map(_generate_almanac, missing)):
+                if directory is not None:
+                    _write_almanac(_get_almanac_path(directory, key), almanac)
+
+                _cache_almanac(key, almanac)
+
+                almanacs[key] = almanac
+
+    return [almanacs[key] for key in keys]
+
+
+# **************************************************************************************
+
+
+def clear_almanac_cache() -> None:
+    """
+    Clear the in-memory almanac cache.
+    """
+    with _almanac_cache_lock:
+        _almanac_cache.clear()
+
+
+# **************************************************************************************
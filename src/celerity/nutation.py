@@ -6,18 +6,19 @@
 
 # **************************************************************************************
 
+from array import array
 from datetime import datetime
 from math import cos, degrees, radians, sin, tan
+from typing import NamedTuple, Sequence, Tuple
 
-from .astrometry import get_obliquity_of_the_ecliptic
 from .common import EquatorialCoordinate
-from .moon import get_mean_ecliptic_longitude_of_the_ascending_node
-from .moon import get_mean_geometric_longitude as get_mean_lunar_geometric_longitude
-from .sun import get_mean_geometric_longitude as get_mean_solar_geometric_longitude
+from .fundamentals import get_fundamental_arguments
+from .memoise import memoise_by_epoch
 
 # **************************************************************************************
 
 
+@memoise_by_epoch(enabled=False)
 def get_nutation_in_longitude(date: datetime) -> float:
     """
     Gets the nutation in longitude for a particular datetime.
@@ -25,26 +26,14 @@ def get_nutation_in_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The nutation in longitude in degrees.
     """
-    # Get the ecliptic longitude of the ascending node of the Moon (in degrees)
-    Ω = get_mean_ecliptic_longitude_of_the_ascending_node(date)
-
-    # Get the mean solar geometric longitude (in degrees):
-    L = get_mean_solar_geometric_longitude(date)
-
-    # Get the mean lunar geometric longitude (in degrees):
-    longitude = get_mean_lunar_geometric_longitude(date)
-
-    return (
-        -17.2 * sin(radians(Ω))
-        - 1.32 * sin(radians(2 * L))
-        - 0.23 * sin(radians(2 * longitude))
-        + 0.21 * sin(radians(2 * Ω))
-    ) / 3600.0
+    # Get the nutation in longitude (in arcseconds) from the fundamental arguments:
+    return get_fundamental_arguments(date).Δψ / 3600.0
 
 
 # **************************************************************************************
 
 
+@memoise_by_epoch(enabled=False)
 def get_nutation_in_obliquity(date: datetime) -> float:
     """
     Gets the nutation in obliquity for a particular datetime.
@@ -52,57 +41,272 @@ def get_nutation_in_obliquity(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The nutation in obliquity in degrees.
     """
-    # Get the ecliptic longitude of the ascending node of the Moon (in degrees)
-    Ω = get_mean_ecliptic_longitude_of_the_ascending_node(date)
+    # Get the nutation in obliquity (in arcseconds) from the fundamental arguments:
+    return get_fundamental_arguments(date).Δε / 3600.0
+
+
+# **************************************************************************************
+
+
+class NutationTerms(NamedTuple):
+    """
+    The epoch-dependent terms of the correction for nutation, which are shared by
+    every target at the same epoch.
+
+    :property Δψ: The nutation in longitude (in degrees).
+    :property Δε: The nutation in obliquity (in degrees).
+    :property cosε: The cosine of the true obliquity of the ecliptic.
+    :property sinε: The sine of the true obliquity of the ecliptic.
+    """
+
+    Δψ: float
 
-    # Get the mean solar geometric longitude (in degrees):
-    L = get_mean_solar_geometric_longitude(date)
+    Δε: float
 
-    # Get the mean lunar geometric longitude (in degrees):
-    longitude = get_mean_lunar_geometric_longitude(date)
+    cosε: float
 
-    return (
-        9.2 * cos(radians(Ω))
-        + 0.57 * cos(radians(2 * L))
-        + 0.1 * cos(radians(2 * longitude))
-        - 0.09 * cos(radians(2 * Ω))
-    ) / 3600.0
+    sinε: float
 
 
 # **************************************************************************************
 
 
-def get_correction_to_equatorial_for_nutation(
-    date: datetime,
-    target: EquatorialCoordinate,
-) -> EquatorialCoordinate:
+def get_nutation_terms(date: datetime) -> NutationTerms:
     """
-    Corrects the equatorial coordinates of a target for nutation in longitude and obliquity.
+    Gets the epoch-dependent terms of the correction for nutation.
 
     :param date: The datetime object to convert.
-    :param longitude: The longitude of the observer in degrees.
-    :param target: The equatorial coordinates of the target.
+    :return: The terms of the correction for nutation at the epoch.
     """
-    ra, dec = radians(target["ra"]), radians(target["dec"])
+    # Get the fundamental arguments at the epoch:
+    arguments = get_fundamental_arguments(date)
 
     # Get the nutation in longitude (in degrees)
-    Δψ = get_nutation_in_longitude(date)
+    Δψ = arguments.Δψ / 3600.0
 
     # Get the nutation in obliquity (in degrees)
-    Δε = get_nutation_in_obliquity(date)
+    Δε = arguments.Δε / 3600.0
 
     # Get the true obliquity of the ecliptic (in degrees):
-    ε = radians(get_obliquity_of_the_ecliptic(date) + Δε)
+    ε = radians(arguments.ε + Δε)
+
+    return NutationTerms(Δψ=Δψ, Δε=Δε, cosε=cos(ε), sinε=sin(ε))
+
+
+# **************************************************************************************
+
+
+def get_correction_for_nutation(
+    ra: float, dec: float, terms: NutationTerms
+) -> Tuple[float, float]:
+    """
+    Gets the correction for nutation to the equatorial coordinate of a single target,
+    from the precomputed terms at the epoch.
+
+    :param ra: The right ascension of the target (in degrees).
+    :param dec: The declination of the target (in degrees).
+    :param terms: The terms of the correction for nutation at the epoch.
+    :return: The corrections to the right ascension and declination (in degrees).
+    """
+    ra, dec = radians(ra), radians(dec)
+
+    Δψ, Δε, cosε, sinε = terms
 
     # Calculate the nutation correction in right ascension (in degrees)
-    Δra = (degrees(cos(ε) + sin(ε) * sin(ra) * tan(dec)) * Δψ) - degrees(
+    Δra = (degrees(cosε + sinε * sin(ra) * tan(dec)) * Δψ) - degrees(
         cos(ra) * tan(dec)
     ) * Δε
 
     # Calculate the nutation correction in declination (in degrees)
-    Δdec = degrees(sin(ε) * cos(ra)) * Δψ + degrees(sin(ra)) * Δε
+    Δdec = degrees(sinε * cos(ra)) * Δψ + degrees(sin(ra)) * Δε
+
+    return Δra, Δdec
+
+
+# **************************************************************************************
+
+
+def get_correction_to_equatorial_for_nutation(
+    date: datetime,
+    target: EquatorialCoordinate,
+) -> EquatorialCoordinate:
+    """
+    Corrects the equatorial coordinates of a target for nutation in longitude and obliquity.
+
+    :param date: The datetime object to convert.
+    :param longitude: The longitude of the observer in degrees.
+    :param target: The equatorial coordinates of the target.
+    """
+    Δra, Δdec = get_correction_for_nutation(
+        target["ra"], target["dec"], get_nutation_terms(date)
+    )
 
     return {"ra": Δra, "dec": Δdec}
 
 
 # **************************************************************************************
+
+
+# The IAU 2000B luni-solar nutation series (McCarthy & Luzum 2003), truncated to the
+# 77 largest terms. Each row is the multipliers of the fundamental arguments
+# (l, l′, F, D, Ω) followed by the coefficients (ψ, ψ̇, ψ′, ε, ε̇, ε′) in units of
+# 0.1 μas (and 0.1 μas per Julian century), such that:
+#
+#   Δψ = Σ (ψ + ψ̇ T) sin(arg) + ψ′ cos(arg)
+#   Δε = Σ (ε + ε̇ T) cos(arg) + ε′ sin(arg)
+IAU2000B_NUTATION_TERMS: Sequence[Tuple[int, ...]] = (
+    (0, 0, 0, 0, 1, -172064161, -174666, 33386, 92052331, 9086, 15377),
+    (0, 0, 2, -2, 2, -13170906, -1675, -13696, 5730336, -3015, -4587),
+    (0, 0, 2, 0, 2, -2276413, -234, 2796, 978459, -485, 1374),
+    (0, 0, 0, 0, 2, 2074554, 207, -698, -897492, 470, -291),
+    (0, 1, 0, 0, 0, 1475877, -3633, 11817, 73871, -184, -1924),
+    (0, 1, 2, -2, 2, -516821, 1226, -524, 224386, -677, -174),
+    (1, 0, 0, 0, 0, 711159, 73, -872, -6750, 0, 358),
+    (0, 0, 2, 0, 1, -387298, -367, 380, 200728, 18, 318),
+    (1, 0, 2, 0, 2, -301461, -36, 816, 129025, -63, 367),
+    (0, -1, 2, -2, 2, 215829, -494, 111, -95929, 299, 132),
+    (0, 0, 2, -2, 1, 128227, 137, 181, -68982, -9, 39),
+    (-1, 0, 2, 0, 2, 123457, 11, 19, -53311, 32, -4),
+    (-1, 0, 0, 2, 0, 156994, 10, -168, -1235, 0, 82),
+    (1, 0, 0, 0, 1, 63110, 63, 27, -33228, 0, -9),
+    (-1, 0, 0, 0, 1, -57976, -63, -189, 31429, 0, -75),
+    (-1, 0, 2, 2, 2, -59641, -11, 149, 25543, -11, 66),
+    (1, 0, 2, 0, 1, -51613, -42, 129, 26366, 0, 78),
+    (-2, 0, 2, 0, 1, 45893, 50, 31, -24236, -10, 20),
+    (0, 0, 0, 2, 0, 63384, 11, -150, -1220, 0, 29),
+    (0, 0, 2, 2, 2, -38571, -1, 158, 16452, -11, 68),
+    (0, -2, 2, -2, 2, 32481, 0, 0, -13870, 0, 0),
+    (-2, 0, 0, 2, 0, -47722, 0, -18, 477, 0, -25),
+    (2, 0, 2, 0, 2, -31046, -1, 131, 13238, -11, 59),
+    (1, 0, 2, -2, 2, 28593, 0, -1, -12338, 10, -3),
+    (-1, 0, 2, 0, 1, 20441, 21, 10, -10758, 0, -3),
+    (2, 0, 0, 0, 0, 29243, 0, -74, -609, 0, 13),
+    (0, 0, 2, 0, 0, 25887, 0, -66, -550, 0, 11),
+    (0, 1, 0, 0, 1, -14053, -25, 79, 8551, -2, -45),
+    (-1, 0, 0, 2, 1, 15164, 10, 11, -8001, 0, -1),
+    (0, 2, 2, -2, 2, -15794, 72, -16, 6850, -42, -5),
+    (0, 0, -2, 2, 0, 21783, 0, 13, -167, 0, 13),
+    (1, 0, 0, -2, 1, -12873, -10, -37, 6953, 0, -14),
+    (0, -1, 0, 0, 1, -12654, 11, 63, 6415, 0, 26),
+    (-1, 0, 2, 2, 1, -10204, 0, 25, 5222, 0, 15),
+    (0, 2, 0, 0, 0, 16707, -85, -10, 168, -1, 10),
+    (1, 0, 2, 2, 2, -7691, 0, 44, 3268, 0, 19),
+    (-2, 0, 2, 0, 0, -11024, 0, -14, 104, 0, 2),
+    (0, 1, 2, 0, 2, 7566, -21, -11, -3250, 0, -5),
+    (0, 0, 2, 2, 1, -6637, -11, 25, 3353, 0, 14),
+    (0, -1, 2, 0, 2, -7141, 21, 8, 3070, 0, 4),
+    (0, 0, 0, 2, 1, -6302, -11, 2, 3272, 0, 4),
+    (1, 0, 2, -2, 1, 5800, 10, 2, -3045, 0, -1),
+    (2, 0, 2, -2, 2, 6443, 0, -7, -2768, 0, -4),
+    (-2, 0, 0, 2, 1, -5774, -11, -15, 3041, 0, -5),
+    (2, 0, 2, 0, 1, -5350, 0, 21, 2695, 0, 12),
+    (0, -1, 2, -2, 1, -4752, -11, -3, 2719, 0, -3),
+    (0, 0, 0, -2, 1, -4940, -11, -21, 2720, 0, -9),
+    (-1, -1, 0, 2, 0, 7350, 0, -8, -51, 0, 4),
+    (2, 0, 0, -2, 1, 4065, 0, 6, -2206, 0, 1),
+    (1, 0, 0, 2, 0, 6579, 0, -24, -199, 0, 2),
+    (0, 1, 2, -2, 1, 3579, 0, 5, -1900, 0, 1),
+    (1, -1, 0, 0, 0, 4725, 0, -6, -41, 0, 3),
+    (-2, 0, 2, 0, 2, -3075, 0, -2, 1313, 0, -1),
+    (3, 0, 2, 0, 2, -2904, 0, 15, 1233, 0, 7),
+    (0, -1, 0, 2, 0, 4348, 0, -10, -81, 0, 2),
+    (1, -1, 2, 0, 2, -2878, 0, 8, 1232, 0, 4),
+    (0, 0, 0, 1, 0, -4230, 0, 5, -20, 0, -2),
+    (-1, -1, 2, 2, 2, -2819, 0, 7, 1207, 0, 3),
+    (-1, 0, 2, 0, 0, -4056, 0, 5, 40, 0, -2),
+    (0, -1, 2, 2, 2, -2647, 0, 11, 1129, 0, 5),
+    (-2, 0, 0, 0, 1, -2294, 0, -10, 1266, 0, -4),
+    (1, 1, 2, 0, 2, 2481, 0, -7, -1062, 0, -3),
+    (2, 0, 0, 0, 1, 2179, 0, -2, -1129, 0, -2),
+    (-1, 1, 0, 1, 0, 3276, 0, 1, -9, 0, 0),
+    (1, 1, 0, 0, 0, -3389, 0, 5, 35, 0, -2),
+    (1, 0, 2, 0, 0, 3339, 0, -13, -107, 0, 1),
+    (-1, 0, 2, -2, 1, -1987, 0, -6, 1073, 0, -2),
+    (1, 0, 0, 0, 2, -1981, 0, 0, 854, 0, 0),
+    (-1, 0, 0, 1, 0, 4026, 0, -353, -553, 0, -139),
+    (0, 0, 2, 1, 2, 1660, 0, -5, -710, 0, -2),
+    (-1, 0, 2, 4, 2, -1521, 0, 9, 647, 0, 4),
+    (-1, 1, 0, 1, 1, 1314, 0, 0, -700, 0, 0),
+    (0, -2, 2, -2, 1, -1283, 0, 0, 672, 0, 0),
+    (1, 0, 2, 2, 1, -1331, 0, 8, 663, 0, 4),
+    (-2, 0, 2, 2, 2, 1383, 0, -2, -594, 0, -2),
+    (-1, 0, 0, 0, 2, 1405, 0, 4, -610, 0, 2),
+    (1, 1, 2, -2, 2, 1290, 0, 0, -556, 0, 0),
+)
+
+# **************************************************************************************
+
+# The packed argument multipliers, interleaved as (l, l′, F, D, Ω) for each term:
+_IAU2000B_ARGUMENTS = array(
+    "b", [n for row in IAU2000B_NUTATION_TERMS for n in row[:5]]
+)
+
+# The packed coefficients, interleaved as (ψ, ψ̇, ψ′, ε, ε̇, ε′) for each term:
+_IAU2000B_COEFFICIENTS = array(
+    "l", [c for row in IAU2000B_NUTATION_TERMS for c in row[5:]]
+)
+
+# **************************************************************************************
+
+
+def get_iau2000b_nutation(T: float) -> Tuple[float, float]:
+    """
+    Gets the nutation in longitude and obliquity from the 77 term IAU 2000B model,
+    which is accurate to ~1 mas between 1995 and 2050.
+
+    :param T: The number of Julian centuries since J2000.0 (in TT).
+    :return: The nutation in longitude Δψ and obliquity Δε (in degrees).
+    """
+    # Get the fundamental (Delaunay) arguments, as given by Simon et al. (1994), once
+    # for all of the terms (in radians). The mean anomaly of the Moon, l:
+    Mm = radians(((485868.249036 + 1717915923.2178 * T) % 1296000) / 3600)
+
+    # The mean anomaly of the Sun, l′:
+    M = radians(((1287104.79305 + 129596581.0481 * T) % 1296000) / 3600)
+
+    # The mean argument of latitude of the Moon:
+    F = radians(((335779.526232 + 1739527262.8478 * T) % 1296000) / 3600)
+
+    # The mean elongation of the Moon from the Sun:
+    D = radians(((1072260.70369 + 1602961601.2090 * T) % 1296000) / 3600)
+
+    # The mean longitude of the Moon's ascending node:
+    Ω = radians(((450160.398036 - 6962890.5431 * T) % 1296000) / 3600)
+
+    arguments = _IAU2000B_ARGUMENTS
+
+    coefficients = _IAU2000B_COEFFICIENTS
+
+    Δψ = 0.0
+
+    Δε = 0.0
+
+    for i in range(len(IAU2000B_NUTATION_TERMS)):
+        j, k = 5 * i, 6 * i
+
+        θ = (
+            arguments[j] * Mm
+            + arguments[j + 1] * M
+            + arguments[j + 2] * F
+            + arguments[j + 3] * D
+            + arguments[j + 4] * Ω
+        )
+
+        sinθ, cosθ = sin(θ), cos(θ)
+
+        Δψ += (coefficients[k] + coefficients[k + 1] * T) * sinθ
+        Δψ += coefficients[k + 2] * cosθ
+
+        Δε += (coefficients[k + 3] + coefficients[k + 4] * T) * cosθ
+        Δε += coefficients[k + 5] * sinθ
+
+    # Convert from 0.1 μas to arcseconds, adding the fixed offsets which stand in
+    # for the omitted planetary terms (-0.135 mas and +0.388 mas):
+    Δψ = Δψ * 1e-7 - 0.000135
+
+    Δε = Δε * 1e-7 + 0.000388
+
+    return Δψ / 3600, Δε / 3600
+
+
+# **************************************************************************************
@@ -0,0 +1,154 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from datetime import datetime
+from math import asin, atan2, cos, degrees, radians, sin
+from typing import Iterable, List, MutableSequence, Optional, Sequence
+
+from .buffers import get_writable_float64_view
+from .common import EquatorialCoordinate, GeographicCoordinate, HorizontalArray
+from .frames import get_greenwich_sidereal_matrix, get_greenwich_to_horizontal_matrix
+from .matrix import Matrix3, apply_matrix, convert_spherical_to_unit_vector
+
+# **************************************************************************************
+
+
+class ObserverArray:
+    """
+    A columnar array of observers, e.g., the sites of an alert network, which
+    caches the trigonometry of each site's latitude, and each site's rotation from
+    the Greenwich frame to its horizontal frame, such that they are computed once
+    and then reused for every target and every epoch.
+
+    :property latitude: The latitudes of the observers (in degrees).
+    :property longitude: The longitudes of the observers (in degrees).
+    :property sinφ: The sines of the latitudes of the observers.
+    :property cosφ: The cosines of the latitudes of the observers.
+    """
+
+    __slots__ = ("latitude", "longitude", "sinφ", "cosφ", "_matrices")
+
+    def __init__(self, latitude: Sequence[float], longitude: Sequence[float]) -> None:
+        if len(latitude) != len(longitude):
+            raise ValueError("latitude and longitude must be of the same length")
+
+        self.latitude = array("d", latitude)
+
+        self.longitude = array("d", longitude)
+
+        φ = [radians(latitude) for latitude in self.latitude]
+
+        self.sinφ = array("d", (sin(latitude) for latitude in φ))
+
+        self.cosφ = array("d", (cos(latitude) for latitude in φ))
+
+        # The rotation matrices from the Greenwich frame to each horizontal frame:
+        self._matrices: List[Matrix3] = [
+            get_greenwich_to_horizontal_matrix(self[i]) for i in range(len(self))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+    def __getitem__(self, index: int) -> GeographicCoordinate:
+        return {"latitude": self.latitude[index], "longitude": self.longitude[index]}
+
+    @classmethod
+    def from_coordinates(
+        cls, observers: Iterable[GeographicCoordinate]
+    ) -> "ObserverArray":
+        """
+        Creates an observer array from a sequence of geographic coordinates.
+
+        :param observers: The geographic coordinates of the observers.
+        :return: The observer array.
+        """
+        observers = list(observers)
+
+        return cls(
+            [observer["latitude"] for observer in observers],
+            [observer["longitude"] for observer in observers],
+        )
+
+
+# **************************************************************************************
+
+
+def convert_equatorial_to_horizontal_for_observers(
+    date: datetime,
+    observers: ObserverArray,
+    target: EquatorialCoordinate,
+    alt: Optional[MutableSequence[float]] = None,
+    az: Optional[MutableSequence[float]] = None,
+) -> HorizontalArray:
+    """
+    Converts the equatorial coordinate of a single target to horizontal coordinates
+    for every observer in an observer array, at a single instant.
+
+    The target is rotated once into the Greenwich frame by the Greenwich sidereal
+    time, and then into each observer's horizontal frame by the matrices cached on
+    the observer array (see get_equatorial_to_horizontal_matrix), such that the
+    results agree with those of convert_equatorial_to_horizontal for each observer
+    to within floating point rounding.
+
+    :param date: The datetime object to convert.
+    :param observers: The observer array.
+    :param target: The equatorial coordinate of the observed object.
+    :param alt: An optional output buffer for the altitudes, e.g., an array('d') or
+        a NumPy array, of at least the same length as the observer array.
+    :param az: An optional output buffer for the azimuths, as for alt.
+    :return: The altitudes and azimuths of the target for each observer (in degrees).
+    """
+    n = len(observers)
+
+    if alt is None:
+        alt = array("d", bytes(8 * n))
+
+    if az is None:
+        az = array("d", bytes(8 * n))
+
+    # Write through zero-copy views of the output buffers, e.g., NumPy arrays:
+    alts, azs = get_writable_float64_view(alt), get_writable_float64_view(az)
+
+    if len(alts) < n or len(azs) < n:
+        raise ValueError("alt and az must be at least as long as the observers")
+
+    # Get the unit vector of the target in the Greenwich frame, once for every
+    # observer:
+    x, y, z = apply_matrix(
+        get_greenwich_sidereal_matrix(date),
+        convert_spherical_to_unit_vector(target["ra"], target["dec"]),
+    )
+
+    cosφ, matrices = observers.cosφ, observers._matrices
+
+    for i in range(n):
+        # Divide-by-zero errors can occur when we have cos(90), and sin(0)/sin(180):
+        if cosφ[i] == 0:
+            alts[i], azs[i] = -1, -1
+            continue
+
+        (m11, m12, m13), (m21, m22, m23), (m31, m32, m33) = matrices[i]
+
+        # Get the azimuth, measured from north toward east, where the y-axis of the
+        # horizontal frame is toward the west point (see convert_vector_to_horizontal):
+        A = -degrees(atan2(m21 * x + m22 * y + m23 * z, m11 * x + m12 * y + m13 * z))
+
+        A %= 360
+
+        # A tiny negative angle is rounded up to exactly 360 by the modulo:
+        azs[i] = A if A < 360 else 0.0
+
+        # Clamp to guard against rounding errors just beyond the zenith or nadir:
+        alts[i] = degrees(asin(max(-1.0, min(1.0, m31 * x + m32 * y + m33 * z))))
+
+    return HorizontalArray(alt, az)
+
+
+# **************************************************************************************
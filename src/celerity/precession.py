@@ -6,28 +6,53 @@
 
 # **************************************************************************************
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from math import cos, radians, sin, tan
+from typing import NamedTuple, Tuple
 
 from .common import EquatorialCoordinate
-from .temporal import get_julian_date
+from .matrix import (
+    Matrix3,
+    get_rotation_matrix_x,
+    get_rotation_matrix_z,
+    multiply_matrices,
+)
+from .nutation import get_iau2000b_nutation
+from .tai import get_tt_utc_offset
+from .temporal import get_julian_centuries, get_julian_date
 
 # **************************************************************************************
 
 
-def get_correction_to_equatorial_for_precession_of_equinoxes(
-    date: datetime,
-    target: EquatorialCoordinate,
-) -> EquatorialCoordinate:
+class PrecessionTerms(NamedTuple):
     """
-    Corrects the equatorial coordinates of a target for the precession of the equinoxes.
+    The epoch-dependent terms of the correction for the precession of the equinoxes,
+    which are shared by every target at the same epoch.
 
-    :param date: The date to correct the equatorial coordinates for.
-    :param target: The equatorial J2000 coordinates of the target.
-    :return: The corrected equatorial coordinates of the target.
+    :property T: The number of Julian centuries since J2000.0.
+    :property M: The precession in right ascension (in seconds*).
+    :property Nd: The precession in declination (in arcseconds).
     """
-    ra, dec = radians(target["ra"]), radians(target["dec"])
 
+    T: float
+
+    M: float
+
+    Nd: float
+
+
+# **************************************************************************************
+
+
+def get_precession_terms(date: datetime) -> PrecessionTerms:
+    """
+    Gets the epoch-dependent terms of the correction for the precession of the
+    equinoxes.
+
+    :param date: The date to correct the equatorial coordinates for.
+    :return: The terms of the correction for precession at the epoch.
+    """
     # Get the Julian date:
     JD = get_julian_date(date)
 
@@ -40,13 +65,181 @@ def get_correction_to_equatorial_for_precession_of_equinoxes(
     # Interpolate the precession in declination (in arcseconds)
     Nd = 20.0468 - 0.0085 * T
 
+    return PrecessionTerms(T=T, M=M, Nd=Nd)
+
+
+# **************************************************************************************
+
+
+def get_correction_for_precession_of_equinoxes(
+    ra: float, dec: float, terms: PrecessionTerms
+) -> Tuple[float, float]:
+    """
+    Gets the correction for the precession of the equinoxes to the equatorial
+    coordinate of a single target, from the precomputed terms at the epoch.
+
+    :param ra: The right ascension of the target (in degrees).
+    :param dec: The declination of the target (in degrees).
+    :param terms: The terms of the correction for precession at the epoch.
+    :return: The corrections to the right ascension and declination (in degrees).
+    """
+    ra, dec = radians(ra), radians(dec)
+
+    T, M, Nd = terms
+
     # Calculate the precession correction in right ascension (in seconds*)
     Δra = M + Nd / 15 * sin(ra) * tan(dec) * T
 
     # Calculate the precession correction in declination (in arcseconds)
     Δdec = Nd * cos(ra) * T
 
-    return {"ra": Δra / (3600 / 15), "dec": Δdec / 3600}
+    return Δra / (3600 / 15), Δdec / 3600
+
+
+# **************************************************************************************
+
+
+def get_correction_to_equatorial_for_precession_of_equinoxes(
+    date: datetime,
+    target: EquatorialCoordinate,
+) -> EquatorialCoordinate:
+    """
+    Corrects the equatorial coordinates of a target for the precession of the equinoxes.
+
+    :param date: The date to correct the equatorial coordinates for.
+    :param target: The equatorial J2000 coordinates of the target.
+    :return: The corrected equatorial coordinates of the target.
+    """
+    Δra, Δdec = get_correction_for_precession_of_equinoxes(
+        target["ra"], target["dec"], get_precession_terms(date)
+    )
+
+    return {"ra": Δra, "dec": Δdec}
+
+
+# **************************************************************************************
+
+
+def get_iau2006_mean_obliquity(T: float) -> float:
+    """
+    Gets the mean obliquity of the ecliptic from the IAU 2006 precession model.
+
+    :param T: The number of Julian centuries since J2000.0 (in TT).
+    :return: The mean obliquity of the ecliptic (in degrees).
+    """
+    return (
+        84381.406
+        + (
+            -46.836769
+            + (-0.0001831 + (0.00200340 + (-0.000000576 - 0.0000000434 * T) * T) * T)
+            * T
+        )
+        * T
+    ) / 3600
+
+
+# **************************************************************************************
+
+
+def get_iau2006_fukushima_williams_angles(
+    T: float,
+) -> Tuple[float, float, float, float]:
+    """
+    Gets the Fukushima-Williams angles of the IAU 2006 precession model, which
+    include the frame bias between the GCRS and the J2000.0 mean equator.
+
+    :param T: The number of Julian centuries since J2000.0 (in TT).
+    :return: The angles γ, φ, ψ and ε (in degrees).
+    """
+    γ = (
+        -0.052928
+        + (
+            10.556378
+            + (0.4932044 + (-0.00031238 + (-0.000002788 + 0.0000000260 * T) * T) * T)
+            * T
+        )
+        * T
+    )
+
+    φ = (
+        84381.412819
+        + (
+            -46.811016
+            + (0.0511268 + (0.00053289 + (-0.000000440 - 0.0000000176 * T) * T) * T) * T
+        )
+        * T
+    )
+
+    ψ = (
+        -0.041775
+        + (
+            5038.481484
+            + (1.5584175 + (-0.00018522 + (-0.000026452 - 0.0000000148 * T) * T) * T)
+            * T
+        )
+        * T
+    )
+
+    return γ / 3600, φ / 3600, ψ / 3600, get_iau2006_mean_obliquity(T)
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=256)
+def _get_precession_nutation_matrix(
+    epoch: int, quantum: float, nutation: bool
+) -> Matrix3:
+    # Get the number of Julian centuries since J2000.0 (in TT) of the quantised epoch:
+    T = epoch * quantum / 86400 / 36525
+
+    γ, φ, ψ, ε = get_iau2006_fukushima_williams_angles(T)
+
+    if nutation:
+        Δψ, Δε = get_iau2000b_nutation(T)
+
+        ψ, ε = ψ + Δψ, ε + Δε
+
+    # The (bias-)precession(-nutation) matrix is R₁(-ε) · R₃(-ψ) · R₁(φ) · R₃(γ):
+    return multiply_matrices(
+        get_rotation_matrix_x(-radians(ε)),
+        get_rotation_matrix_z(-radians(ψ)),
+        get_rotation_matrix_x(radians(φ)),
+        get_rotation_matrix_z(radians(γ)),
+    )
+
+
+# **************************************************************************************
+
+
+def get_precession_nutation_matrix(
+    date: datetime, quantum: float = 1.0, nutation: bool = True
+) -> Matrix3:
+    """
+    Gets the IAU 2006/2000B matrix which rotates a GCRS (J2000.0) vector to the true
+    equator and equinox of date (or, without nutation, the mean equator and equinox
+    of date), including the frame bias.
+
+    The epoch is rounded to the nearest multiple of the quantum, and the matrix for
+    each quantised epoch is cached, such that requests within the same quantum share
+    a single evaluation. The precession-nutation changes by at most ~0.02 mas per
+    second, so a quantum of up to a minute contributes ~1 mas or less.
+
+    :param date: The datetime object to convert.
+    :param quantum: The time quantum (in seconds) to round the epoch to.
+    :param nutation: Whether to include the IAU 2000B nutation.
+    :return: The 3×3 precession-nutation matrix.
+    """
+    if quantum <= 0:
+        raise ValueError("The time quantum must be a positive number of seconds")
+
+    # Get the number of Julian centuries since J2000.0 (in TT):
+    T = get_julian_centuries(date + timedelta(seconds=get_tt_utc_offset(date)))
+
+    # Round the epoch to the nearest whole number of quanta since J2000.0:
+    epoch = round(T * 36525 * 86400 / quantum)
+
+    return _get_precession_nutation_matrix(epoch, quantum, nutation)
 
 
 # **************************************************************************************
@@ -0,0 +1,95 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from typing import Optional
+
+from .integration import RealFunction
+
+# **************************************************************************************
+
+
+def find_root(
+    f: RealFunction,
+    a: float,
+    b: float,
+    tolerance: float = 1e-9,
+    max_iterations: int = 100,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None,
+) -> float:
+    """
+    Finds a root of f within the bracket [a, b] using the Illinois variant of the
+    regula falsi (false position) method.
+
+    The method is guaranteed to remain within the bracket, and so is robust to
+    discontinuities (e.g., atmospheric refraction switching on at the horizon),
+    whilst converging superlinearly for smooth functions.
+
+    :param f: The function to find the root of
+    :param a: The lower limit of the bracket
+    :param b: The upper limit of the bracket
+    :param tolerance: The width of the bracket at which to stop iterating
+    :param max_iterations: The maximum number of iterations to perform
+    :param fa: The value of f(a), if already known
+    :param fb: The value of f(b), if already known
+    :return: The approximate root of f within [a, b]
+    :raises ValueError: If f(a) and f(b) do not bracket a root
+    """
+    # Evaluate the function at the limits of the bracket, if not already known:
+    fa = f(a) if fa is None else fa
+
+    fb = f(b) if fb is None else fb
+
+    if fa == 0:
+        return a
+
+    if fb == 0:
+        return b
+
+    # Ensure that the bracket contains a sign change:
+    if (fa < 0) == (fb < 0):
+        raise ValueError("f(a) and f(b) must have opposite signs to bracket a root")
+
+    # The side of the bracket that was last retained, used by the Illinois method:
+    side = 0
+
+    c = a
+
+    for _ in range(max_iterations):
+        # The false position estimate of the root:
+        c = (a * fb - b * fa) / (fb - fa)
+
+        if abs(b - a) < tolerance:
+            break
+
+        fc = f(c)
+
+        if fc == 0:
+            break
+
+        if (fc < 0) == (fb < 0):
+            b, fb = c, fc
+
+            # If the lower limit has been retained twice in a row, halve its weight:
+            if side == -1:
+                fa /= 2
+
+            side = -1
+        else:
+            a, fa = c, fc
+
+            # If the upper limit has been retained twice in a row, halve its weight:
+            if side == 1:
+                fb /= 2
+
+            side = 1
+
+    return c
+
+
+# **************************************************************************************
@@ -7,40 +7,148 @@
 # **************************************************************************************
 
 from datetime import datetime
+from functools import lru_cache
 from math import asin, atan2, cos, degrees, pow, radians, sin
 
-from .astrometry import get_obliquity_of_the_ecliptic
 from .common import EquatorialCoordinate, get_F_orbital_parameter
-from .temporal import get_julian_date
+from .fundamentals import get_fundamental_arguments
 
 # **************************************************************************************
 
 
-def get_equation_of_center(date) -> float:
+class SolarState:
     """
-    The equation of center is the difference between the mean geometric longitude
-    and the mean anomaly.
+    The state of the Sun at a particular epoch, where every intermediate quantity
+    (e.g., the mean anomaly, the equation of center, the true anomaly and the
+    ecliptic longitude) is computed exactly once.
+
+    :property T: The number of Julian centuries since J2000.0.
+    :property M: The mean anomaly (in degrees).
+    :property L: The mean geometric longitude (in degrees).
+    :property C: The equation of center (in degrees).
+    :property ν: The true anomaly (in degrees).
+    :property λ: The ecliptic longitude (in degrees).
+    :property ε: The obliquity of the ecliptic (in degrees).
+    :property ra: The right ascension (in degrees).
+    :property dec: The declination (in degrees).
+    :property distance: The distance to the Sun (in metres).
+    :property angular_diameter: The angular diameter of the Sun (in degrees).
+    """
+
+    __slots__ = (
+        "T",
+        "M",
+        "L",
+        "C",
+        "ν",
+        "λ",
+        "ε",
+        "ra",
+        "dec",
+        "distance",
+        "angular_diameter",
+    )
+
+    def __init__(self, date: datetime) -> None:
+        # Get the fundamental arguments at the epoch:
+        arguments = get_fundamental_arguments(date)
+
+        T = arguments.T
+
+        # Get the Sun's mean anomaly at the current epoch relative to J2000:
+        M = arguments.M
+
+        # Get the Sun's mean geometric longitude:
+        L = arguments.L
+
+        # Calculate the equation of center:
+        C = (
+            (1.914602 - 0.004817 * pow(T, 2) - 0.000014 * pow(T, 3)) * sin(radians(M))
+            + (0.019993 - 0.000101 * pow(T, 2)) * sin(radians(2 * M))
+            + 0.000289 * sin(radians(3 * M))
+        )
+
+        # Correct the mean anomaly for the equation of center:
+        ν = (M + C) % 360
+
+        # Correct the true anomaly with the Sun's ecliptic longitude
+        # at perigee at the epoch:
+        λ = ν + 282.938346 % 360
+
+        # Correct for negative angles
+        if λ < 0:
+            λ += 360
+
+        # Get the obliquity of the ecliptic:
+        ε = arguments.ε
+
+        # Get the corresponding Right Ascension, α:
+        ra = degrees(atan2(sin(radians(λ)) * cos(radians(ε)), cos(radians(λ)))) % 360
+
+        # Correct ra for negative angles
+        if ra < 0:
+            ra += 360
+
+        # Get the F orbital paramater which applies corrections
+        # due to the Sun's orbital eccentricity:
+        F = get_F_orbital_parameter(ν, 0.016708)
+
+        self.T = T
+        self.M = M
+        self.L = L
+        self.C = C
+        self.ν = ν
+        self.λ = λ
+        self.ε = ε
+        self.ra = ra
+        self.dec = degrees(asin(sin(radians(ε)) * sin(radians(λ))))
+        self.distance = 1.495985e11 / F
+        self.angular_diameter = 0.533128 * F
+
+    @property
+    def true_geometric_longitude(self) -> float:
+        """
+        The true geometric longitude of the Sun (in degrees).
+        """
+        return (self.L + self.C) % 360
+
+    @property
+    def equatorial_coordinate(self) -> EquatorialCoordinate:
+        """
+        The equatorial coordinate of the Sun (in degrees).
+        """
+        return {"ra": self.ra, "dec": self.dec}
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=128)
+def get_solar_state(date: datetime) -> SolarState:
+    """
+    Get the state of the Sun at a particular epoch.
+
+    The most recently requested epochs are cached, such that repeated calls for the
+    same datetime (e.g., from each of the functions below) share a single computation.
 
     :param date: The datetime object to convert.
-    :return: The equation of center in degrees.
+    :return: The state of the Sun at the given epoch.
     """
-    # Get the Julian date:
-    JD = get_julian_date(date)
+    return SolarState(date)
+
 
-    # Calculate the number of centuries since J2000.0:
-    T = (JD - 2451545.0) / 36525
+# **************************************************************************************
 
-    # Get the mean anomaly:
-    M = get_mean_anomaly(date)
 
-    # Calculate the equation of center:
-    C = (
-        (1.914602 - 0.004817 * pow(T, 2) - 0.000014 * pow(T, 3)) * sin(radians(M))
-        + (0.019993 - 0.000101 * pow(T, 2)) * sin(radians(2 * M))
-        + 0.000289 * sin(radians(3 * M))
-    )
+def get_equation_of_center(date) -> float:
+    """
+    The equation of center is the difference between the mean geometric longitude
+    and the mean anomaly.
 
-    return C
+    :param date: The datetime object to convert.
+    :return: The equation of center in degrees.
+    """
+    return get_solar_state(date).C
 
 
 # **************************************************************************************
@@ -54,20 +162,7 @@ def get_mean_anomaly(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The mean anomaly in degrees.
     """
-    # Get the Julian date:
-    JD = get_julian_date(date)
-
-    # Calculate the number of centuries since J2000.0:
-    T = (JD - 2451545.0) / 36525
-
-    # Get the Sun's mean anomaly at the current epoch relative to J2000:
-    M = (357.52911 + 35999.05029 * T - 0.0001537 * pow(T, 2)) % 360
-
-    # Correct for negative angles
-    if M < 0:
-        M += 360
-
-    return M
+    return get_solar_state(date).M
 
 
 # **************************************************************************************
@@ -81,20 +176,7 @@ def get_mean_geometric_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The mean geometric longitude in degrees.
     """
-    # Get the Julian date:
-    JD = get_julian_date(date)
-
-    # Calculate the number of centuries since J2000.0:
-    T = (JD - 2451545.0) / 36525
-
-    # Calculate the mean geometric longitude:
-    L = (280.46646 + 36000.76983 * T + 0.0003032 * pow(T, 2)) % 360
-
-    # Correct for negative angles
-    if L < 0:
-        L += 360
-
-    return L
+    return get_solar_state(date).L
 
 
 # **************************************************************************************
@@ -109,14 +191,7 @@ def get_true_anomaly(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The true anomaly in degrees.
     """
-    # Get the mean anomaly:
-    M = get_mean_anomaly(date)
-
-    # Get the equation of center:
-    C = get_equation_of_center(date)
-
-    # Correct the mean anomaly for the equation of center:
-    return (M + C) % 360
+    return get_solar_state(date).ν
 
 
 # **************************************************************************************
@@ -131,14 +206,7 @@ def get_true_geometric_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The true geometric longitude in degrees.
     """
-    # Get the mean geometric longitude:
-    L = get_mean_geometric_longitude(date)
-
-    # Get the equation of center:
-    C = get_equation_of_center(date)
-
-    # Correct the mean geometric longitude for the equation of center:
-    return (L + C) % 360
+    return get_solar_state(date).true_geometric_longitude
 
 
 # **************************************************************************************
@@ -154,18 +222,7 @@ def get_ecliptic_longitude(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The ecliptic longitude in degrees.
     """
-    # Get the true anomaly:
-    ν = get_true_anomaly(date)
-
-    # Correct the true anomaly with the Sun's ecliptic longitude
-    # at perigee at the epoch:
-    λ = ν + 282.938346 % 360
-
-    # Correct for negative angles
-    if λ < 0:
-        λ += 360
-
-    return λ
+    return get_solar_state(date).λ
 
 
 # **************************************************************************************
@@ -180,28 +237,7 @@ def get_equatorial_coordinate(date: datetime) -> EquatorialCoordinate:
     :param date: The datetime object to convert.
     :return: The equatorial coordinate in degrees.
     """
-    # Get the ecliptic longitude:
-    λ = radians(get_ecliptic_longitude(date))
-
-    # Get the ecliptic latitude:
-    # This term is zero for the Sun, so we can largely ignore it by refactoring
-    # the standard equations for the conversion between ecliptic and equatorial
-    # coordinates.
-    # β = 0
-
-    # Get the obliquity of the ecliptic:
-    ε = radians(get_obliquity_of_the_ecliptic(date))
-
-    # Get the corresponding Right Ascension, α:
-    ra = degrees(atan2(sin(λ) * cos(ε), cos(λ))) % 360
-
-    # Correct ra for negative angles
-    if ra < 0:
-        ra += 360
-
-    dec = degrees(asin(sin(ε) * sin(λ)))
-
-    return {"ra": ra, "dec": dec}
+    return get_solar_state(date).equatorial_coordinate
 
 
 # **************************************************************************************
@@ -215,14 +251,7 @@ def get_angular_diameter(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The angular diameter in degrees.
     """
-    # Get the true anomaly:
-    ν = get_true_anomaly(date)
-
-    # Get the F orbital paramater which applies corrections
-    # due to the Sun's orbital eccentricity:
-    F = get_F_orbital_parameter(ν, 0.016708)
-
-    return 0.533128 * F
+    return get_solar_state(date).angular_diameter
 
 
 # **************************************************************************************
@@ -237,14 +266,7 @@ def get_distance(date: datetime) -> float:
     :param date: The datetime object to convert.
     :return: The distance in metres.
     """
-    # Get the true anomaly:
-    ν = get_true_anomaly(date)
-
-    # Get the F orbital paramater which applies corrections
-    # due to the Sun's orbital eccentricity:
-    F = get_F_orbital_parameter(ν, 0.016708)
-
-    return 1.495985e11 / F
+    return get_solar_state(date).distance
 
 
 # **************************************************************************************
@@ -6,13 +6,22 @@
 
 # **************************************************************************************
 
+from array import array
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from math import floor, pow
-from typing import Tuple
+from typing import Iterable, MutableSequence, Optional, Sequence, Tuple, cast
 from urllib.parse import urlencode
 
+from .buffers import get_float64_view, get_writable_float64_view
 from .common import GeographicCoordinate
-from .constants import J1900, J2000, JULIAN_DAYS_PER_CENTURY
+from .constants import (
+    J1900,
+    J1970,
+    J2000,
+    JULIAN_DAYS_PER_CENTURY,
+    SIDEREAL_RATIO,
+)
 from .iers import IERS_EOP_BASE_URL, fetch_iers_rapid_service_data
 from .tai import get_tai_utc_offset
 
@@ -153,7 +162,7 @@ def get_greenwich_sidereal_time(date: datetime, dut1: float = 0.0) -> float:
         + date.hour
     ) + (dut1 / 3600.0)
 
-    A = UTC * 1.002737909
+    A = UTC * SIDEREAL_RATIO
 
     T_0 += A
 
@@ -263,29 +272,27 @@ def convert_local_sidereal_time_to_greenwich_sidereal_time(
 # **************************************************************************************
 
 
-def convert_greenwich_sidereal_time_to_universal_coordinate_time(
-    date: datetime, GST: float
-) -> datetime:
+@lru_cache(maxsize=366)
+def _get_sidereal_time_constants_for_date(
+    year: int, month: int, day: int
+) -> Tuple[float, float]:
     """
-    Convert the Greenwich Sidereal Time (GST) to the Universal Coordinated Time (UTC).
+    Get the constants required to invert Greenwich Sidereal Time (GST) to Universal
+    Coordinated Time (UTC) for a given calendar date.
 
-    :param date: The datetime object to convert.
-    :param GST: The Greenwich Sidereal Time (GST) to convert.
-    :return: The Universal Coordinated Time (UTC) of the given date normalised to UTC.
-    """
-    # Adjust the date to UTC:
-    date = date.astimezone(tz=timezone.utc)
+    These depend only on the calendar date, and so are cached such that repeated
+    inversions for the same date reduce to simple arithmetic.
 
+    :param year: The year of the calendar date (in UTC).
+    :param month: The month of the calendar date (in UTC).
+    :param day: The day of the calendar date (in UTC).
+    :return: A tuple of the Julian Date (JD) at 0h UTC and the T₀ constant (in hours).
+    """
     # Get the Julian Date at 0h:
-    JD = get_julian_date(datetime(date.year, date.month, date.day, 0, 0, 0, 0))
+    JD = get_julian_date(datetime(year, month, day, 0, 0, 0, 0, tzinfo=timezone.utc))
 
     # Get the Julian Date at 0h on 1st January for the current year:
-    JD_0 = (
-        get_julian_date(
-            datetime(date.year, 1, 1, 0, 0, 0, 0).astimezone(tz=timezone.utc)
-        )
-        - 1
-    )
+    JD_0 = get_julian_date(datetime(year, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc)) - 1
 
     # Get the number of Julian days since 1st January for the current year:
     d = JD - JD_0
@@ -295,7 +302,7 @@ def convert_greenwich_sidereal_time_to_universal_coordinate_time(
 
     R = 6.6460656 + 2400.051262 * T + 0.00002581 * pow(T, 2)
 
-    B = 24 - R + (24 * (date.year - 1900))
+    B = 24 - R + (24 * (year - 1900))
 
     T_0 = (0.0657098 * d) - B
 
@@ -305,13 +312,50 @@ def convert_greenwich_sidereal_time_to_universal_coordinate_time(
     if T_0 > 24:
         T_0 -= 24
 
+    return JD, T_0
+
+
+# **************************************************************************************
+
+
+def _convert_greenwich_sidereal_time_to_decimal_hours(T_0: float, GST: float) -> float:
+    """
+    Convert the Greenwich Sidereal Time (GST) to decimal hours of UTC, given the
+    T₀ constant for the date.
+
+    :param T_0: The T₀ constant (in hours) for the date.
+    :param GST: The Greenwich Sidereal Time (GST) to convert.
+    :return: The Universal Coordinated Time (UTC) in decimal hours.
+    """
     A = GST - T_0
 
     # Correct for negative hour angles
     if A < 0:
         A += 24
 
-    UTC = 0.99727 * A
+    return 0.99727 * A
+
+
+# **************************************************************************************
+
+
+def convert_greenwich_sidereal_time_to_universal_coordinate_time(
+    date: datetime, GST: float
+) -> datetime:
+    """
+    Convert the Greenwich Sidereal Time (GST) to the Universal Coordinated Time (UTC).
+
+    :param date: The datetime object to convert.
+    :param GST: The Greenwich Sidereal Time (GST) to convert.
+    :return: The Universal Coordinated Time (UTC) of the given date normalised to UTC.
+    """
+    # Adjust the date to UTC:
+    date = date.astimezone(tz=timezone.utc)
+
+    # Get the T₀ constant for the current date:
+    _, T_0 = _get_sidereal_time_constants_for_date(date.year, date.month, date.day)
+
+    UTC = _convert_greenwich_sidereal_time_to_decimal_hours(T_0, GST)
 
     # Convert decimal hours to hours, minutes and seconds:
 
@@ -338,6 +382,96 @@ def convert_greenwich_sidereal_time_to_universal_coordinate_time(
 # **************************************************************************************
 
 
+def convert_greenwich_sidereal_time_to_julian_date(date: datetime, GST: float) -> float:
+    """
+    Convert the Greenwich Sidereal Time (GST) to the Julian Date (JD) of the
+    corresponding instant in Universal Coordinated Time (UTC) for the given date.
+
+    This is the float-returning equivalent of
+    convert_greenwich_sidereal_time_to_universal_coordinate_time, and avoids
+    any datetime construction.
+
+    :param date: The datetime object to convert.
+    :param GST: The Greenwich Sidereal Time (GST) to convert.
+    :return: The Julian Date (JD) of the given GST on the given date.
+    """
+    # Adjust the date to UTC:
+    date = date.astimezone(tz=timezone.utc)
+
+    JD, T_0 = _get_sidereal_time_constants_for_date(date.year, date.month, date.day)
+
+    return JD + _convert_greenwich_sidereal_time_to_decimal_hours(T_0, GST) / 24.0
+
+
+# **************************************************************************************
+
+
+def convert_greenwich_sidereal_times_to_julian_dates(
+    date: datetime,
+    GSTs: Iterable[float],
+    JDs: Optional[MutableSequence[float]] = None,
+) -> MutableSequence[float]:
+    """
+    Convert many Greenwich Sidereal Times (GST) to the Julian Dates (JD) of the
+    corresponding instants in Universal Coordinated Time (UTC) for a single date.
+
+    The date-dependent constants are computed once and shared across all of the
+    given sidereal times.
+
+    :param date: The datetime object to convert.
+    :param GSTs: The Greenwich Sidereal Times (GST) to convert.
+    :param JDs: An optional output buffer for the Julian Dates, e.g., an array('d')
+        or a NumPy array, of at least the same length as GSTs.
+    :return: The Julian Dates (JD) of the given GSTs on the given date.
+    """
+    # Adjust the date to UTC:
+    date = date.astimezone(tz=timezone.utc)
+
+    JD, T_0 = _get_sidereal_time_constants_for_date(date.year, date.month, date.day)
+
+    # View a buffer of sidereal times, e.g., a NumPy array, without copying:
+    values = get_float64_view(cast(Sequence[float], GSTs))
+
+    if JDs is None:
+        return array(
+            "d",
+            (
+                JD + _convert_greenwich_sidereal_time_to_decimal_hours(T_0, GST) / 24.0
+                for GST in values
+            ),
+        )
+
+    # Write through a zero-copy view of the output buffer, e.g., a NumPy array:
+    out = get_writable_float64_view(JDs)
+
+    try:
+        for i, GST in enumerate(values):
+            out[i] = (
+                JD + _convert_greenwich_sidereal_time_to_decimal_hours(T_0, GST) / 24.0
+            )
+    except IndexError:
+        raise ValueError("JDs must be at least as long as GSTs")
+
+    return JDs
+
+
+# **************************************************************************************
+
+
+def convert_julian_date_to_universal_coordinate_time(JD: float) -> datetime:
+    """
+    Convert the Julian Date (JD) to the Universal Coordinated Time (UTC), i.e., the
+    inverse of get_julian_date.
+
+    :param JD: The Julian Date (JD) to convert.
+    :return: The Universal Coordinated Time (UTC) of the given Julian Date.
+    """
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(days=JD - J1970)
+
+
+# **************************************************************************************
+
+
 def get_ut1_utc_offset(when: datetime) -> float:
     MJD, _ = get_modified_julian_date_as_parts(when)
 
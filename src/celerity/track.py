@@ -0,0 +1,224 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from datetime import datetime, timedelta
+from math import acos, asin, atan2, cos, degrees, floor, nan, radians, sin, tan
+from typing import Iterator, MutableSequence, NamedTuple, Optional, Tuple, TypedDict
+
+from .buffers import get_writable_float64_view
+from .common import EquatorialCoordinate, GeographicCoordinate
+from .constants import SIDEREAL_RATIO
+from .seeing import get_airmass
+from .temporal import get_local_sidereal_time
+
+# **************************************************************************************
+
+# The rate at which the local sidereal time advances (in degrees per second of UTC):
+SIDEREAL_RATE = 15 * SIDEREAL_RATIO / 3600
+
+# **************************************************************************************
+
+
+class TrackPoint(TypedDict):
+    """
+    :property date: The date of the point on the track.
+    :property alt: The altitude of the target (in degrees).
+    :property az: The azimuth of the target (in degrees).
+    :property airmass: The airmass of the target, or NaN if below the horizon.
+    :property parallactic_angle: The parallactic angle of the target (in degrees).
+    """
+
+    date: datetime
+    alt: float
+    az: float
+    airmass: float
+    parallactic_angle: float
+
+
+# **************************************************************************************
+
+
+class Track(NamedTuple):
+    """
+    The columnar altitude, azimuth, airmass and parallactic angle of a target over
+    a regular time grid, where the n-th element is at start + n × step.
+    """
+
+    alt: MutableSequence[float]
+
+    az: MutableSequence[float]
+
+    airmass: MutableSequence[float]
+
+    parallactic_angle: MutableSequence[float]
+
+
+# **************************************************************************************
+
+
+def get_track_size(start: datetime, end: datetime, step: timedelta) -> int:
+    """
+    Gets the number of points on a time grid from start to end (inclusive), e.g.,
+    to preallocate the buffers passed to get_track_arrays.
+
+    :param start: The date at the start of the grid.
+    :param end: The date at the end of the grid.
+    :param step: The (positive) interval between points on the grid.
+    :return: The number of points on the grid.
+    """
+    if step <= timedelta(0):
+        raise ValueError("step must be a positive timedelta")
+
+    if end < start:
+        return 0
+
+    return floor((end - start) / step) + 1
+
+
+# **************************************************************************************
+
+
+def _get_track(
+    start: datetime,
+    size: int,
+    step: timedelta,
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+) -> Iterator[Tuple[float, float, float, float]]:
+    latitude = radians(observer["latitude"])
+
+    sinφ, cosφ, tanφ = sin(latitude), cos(latitude), tan(latitude)
+
+    dec = radians(target["dec"])
+
+    sinδ, cosδ = sin(dec), cos(dec)
+
+    # Get the local sidereal time at the start of the grid (in degrees), which then
+    # advances linearly in time, rather than being recomputed at every point:
+    LST = get_local_sidereal_time(start, observer["longitude"]) * 15
+
+    # Get the advance of the local sidereal time per step (in degrees):
+    Δ = step.total_seconds() * SIDEREAL_RATE
+
+    for n in range(size):
+        # Get the hour angle for the target (in radians):
+        ha = radians((LST + n * Δ - target["ra"]) % 360)
+
+        sinH, cosH = sin(ha), cos(ha)
+
+        alt = asin(sinδ * sinφ + cosδ * cosφ * cosH)
+
+        # Clamp the cosine of the azimuth to [-1, 1] to guard against floating point
+        # rounding when the target is on (or very near to) the meridian:
+        az = degrees(
+            acos(max(-1.0, min(1.0, (sinδ - sin(alt) * sinφ) / (cos(alt) * cosφ))))
+        )
+
+        alt = degrees(alt)
+
+        yield (
+            alt,
+            360 - az if sinH > 0 else az,
+            get_airmass(alt) if alt >= 0 else nan,
+            degrees(atan2(sinH, tanφ * cosδ - sinδ * cosH)),
+        )
+
+
+# **************************************************************************************
+
+
+def get_track(
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+) -> Iterator[TrackPoint]:
+    """
+    Yields the altitude, azimuth, airmass and parallactic angle of a target over a
+    regular time grid from start to end (inclusive), e.g., for a visibility plot.
+
+    The local sidereal time is computed once at the start of the grid, and advanced
+    incrementally thereafter, so the points agree with those of
+    convert_equatorial_to_horizontal and get_parallactic_angle to within ~0.01″.
+
+    :param start: The date at the start of the grid.
+    :param end: The date at the end of the grid.
+    :param step: The (positive) interval between points on the grid.
+    :param observer: The geographic coordinate of the observer.
+    :param target: The equatorial coordinate of the observed object.
+    :return: An iterator of the points on the track, in time order.
+    """
+    size = get_track_size(start, end, step)
+
+    for n, (alt, az, airmass, q) in enumerate(
+        _get_track(start, size, step, observer, target)
+    ):
+        yield {
+            "date": start + n * step,
+            "alt": alt,
+            "az": az,
+            "airmass": airmass,
+            "parallactic_angle": q,
+        }
+
+
+# **************************************************************************************
+
+
+def get_track_arrays(
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+    alt: Optional[MutableSequence[float]] = None,
+    az: Optional[MutableSequence[float]] = None,
+    airmass: Optional[MutableSequence[float]] = None,
+    parallactic_angle: Optional[MutableSequence[float]] = None,
+) -> Track:
+    """
+    Gets the altitude, azimuth, airmass and parallactic angle of a target over a
+    regular time grid from start to end (inclusive), as columnar arrays.
+
+    :param start: The date at the start of the grid.
+    :param end: The date at the end of the grid.
+    :param step: The (positive) interval between points on the grid.
+    :param observer: The geographic coordinate of the observer.
+    :param target: The equatorial coordinate of the observed object.
+    :param alt: An optional output buffer for the altitudes, e.g., an array('d') or
+        a NumPy array, of at least get_track_size(start, end, step) elements.
+    :param az: An optional output buffer for the azimuths, as for alt.
+    :param airmass: An optional output buffer for the airmasses, as for alt.
+    :param parallactic_angle: An optional output buffer for the parallactic angles,
+        as for alt.
+    :return: The track of the target.
+    """
+    size = get_track_size(start, end, step)
+
+    track = Track(
+        *(
+            array("d", bytes(8 * size)) if buffer is None else buffer
+            for buffer in (alt, az, airmass, parallactic_angle)
+        )
+    )
+
+    # Write through zero-copy views of the output buffers, e.g., NumPy arrays:
+    alts, azs, airmasses, qs = (get_writable_float64_view(buffer) for buffer in track)
+
+    if any(len(buffer) < size for buffer in (alts, azs, airmasses, qs)):
+        raise ValueError(f"output buffers must have at least {size} elements")
+
+    for n, point in enumerate(_get_track(start, size, step, observer, target)):
+        alts[n], azs[n], airmasses[n], qs[n] = point
+
+    return track
+
+
+# **************************************************************************************
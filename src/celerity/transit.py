@@ -6,25 +6,53 @@
 
 # **************************************************************************************
 
+from array import array
 from datetime import datetime, timedelta, timezone
-from math import acos, cos, degrees, radians, sin, tan
-from typing import Literal, TypedDict, Union
+from enum import IntEnum
+from itertools import count
+from math import acos, asin, ceil, cos, degrees, isnan, nan, radians, sin, tan
+from typing import (
+    Iterator,
+    List,
+    Literal,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from .common import (
+    EquatorialCatalog,
     EquatorialCoordinate,
     GeographicCoordinate,
     HorizontalCoordinate,
+    get_coordinate_columns,
     is_equatorial_coordinate,
     is_horizontal_coordinate,
 )
+from .constants import SIDEREAL_RATIO
 from .coordinates import convert_equatorial_to_horizontal
+from .horizon import HorizonMask
+from .roots import find_root
 from .temporal import (
     convert_greenwich_sidereal_time_to_universal_coordinate_time,
+    convert_greenwich_sidereal_times_to_julian_dates,
+    convert_julian_date_to_universal_coordinate_time,
     convert_local_sidereal_time_to_greenwich_sidereal_time,
+    get_julian_date,
+    get_local_sidereal_time,
 )
 
 # **************************************************************************************
 
+# The length of the mean sidereal day (in days of UTC):
+SIDEREAL_DAY = 1 / SIDEREAL_RATIO
+
+# **************************************************************************************
+
 
 class Transit(TypedDict):
     """
@@ -83,8 +111,191 @@ class TransitParameters(TypedDict):
 # **************************************************************************************
 
 
+class Visibility(IntEnum):
+    """
+    The visibility of a target for an observer over a sidereal day, relative to the
+    observer's horizon.
+    """
+
+    NEVER_VISIBLE = -1
+    RISES_AND_SETS = 0
+    CIRCUMPOLAR = 1
+
+
+# **************************************************************************************
+
+
+class RiseTransitSetTimes(NamedTuple):
+    """
+    The columnar visibility, and next rise, transit and set times of a catalog of
+    targets, where the times are Julian Dates (JD) and the azimuths are in degrees.
+
+    The rise and set times, and azimuths, are NaN for targets which do not rise and
+    set, i.e., which are either circumpolar or never visible.
+    """
+
+    visibility: MutableSequence[int]
+
+    rise: MutableSequence[float]
+
+    transit: MutableSequence[float]
+
+    set: MutableSequence[float]
+
+    R: MutableSequence[float]
+
+    S: MutableSequence[float]
+
+
+# **************************************************************************************
+
+
+class RiseTransitSetEvent(TypedDict):
+    """
+    :property event: The kind of event, i.e., "rise", "transit" or "set".
+    :property date: The date of the event.
+    :property JD: The Julian Date (JD) of the event.
+    :property az: The azimuthal angle (in degrees) of the object at the event.
+    """
+
+    event: Literal["rise", "transit", "set"]
+    date: datetime
+    JD: float
+    az: float
+
+
+# **************************************************************************************
+
+
+def _get_horizontal_at_hour_angle(
+    sinφ: float, cosφ: float, sinδ: float, cosδ: float, H: float
+) -> Tuple[float, float]:
+    ha = radians(H)
+
+    alt = asin(sinδ * sinφ + cosδ * cosφ * cos(ha))
+
+    # Clamp the cosine of the azimuth to [-1, 1] to guard against floating point
+    # rounding when the target is on (or very near to) the meridian:
+    az = degrees(
+        acos(max(-1.0, min(1.0, (sinδ - sin(alt) * sinφ) / (cos(alt) * cosφ))))
+    )
+
+    # Get the altitude and azimuth (in degrees):
+    return degrees(alt), 360 - az if sin(ha) > 0 else az
+
+
+# **************************************************************************************
+
+
+def _get_horizon_mask_crossings(
+    sinφ: float, cosφ: float, sinδ: float, cosδ: float, mask: HorizonMask
+) -> Tuple[bool, List[Tuple[float, bool]]]:
+    get_altitude = mask.get_altitude
+
+    def f(H: float) -> float:
+        alt, az = _get_horizontal_at_hour_angle(sinφ, cosφ, sinδ, cosδ, H)
+        return alt - get_altitude(az)
+
+    # Whether the object is above the mask at upper culmination, and so (if it never
+    # crosses the mask) whether it is always above or always below it:
+    above = f(0.0) >= 0
+
+    d = cosδ * cosφ
+
+    # At either pole (of the sky or of the Earth) the altitude is constant:
+    if d == 0:
+        return above, []
+
+    c = sinδ * sinφ
+
+    # Get the hour angles (in degrees) beyond which the object is below the highest
+    # point of the mask, and beyond which it is below the lowest point of the mask,
+    # such that it can only cross the mask at hour angles between the two:
+    H1 = degrees(acos(max(-1.0, min(1.0, (sin(radians(mask.maximum)) - c) / d))))
+
+    H2 = degrees(acos(max(-1.0, min(1.0, (sin(radians(mask.minimum)) - c) / d))))
+
+    # If the object is always above the highest point, or always below the lowest
+    # point, of the mask, it never crosses it:
+    if H1 >= 180 or H2 <= 0:
+        return above, []
+
+    # Widen the window by a degree either side, to bracket crossings at its limits,
+    # e.g., for a flat mask, where the limits coincide:
+    H1, H2 = max(0.0, H1 - 1), min(180.0, H2 + 1)
+
+    # The windows of hour angle either side of the meridian, which are joined when
+    # the object is never above the highest point, or never below the lowest point:
+    if H1 == 0 and H2 == 180:
+        windows = [(-180.0, 180.0)]
+    elif H1 == 0:
+        windows = [(-H2, H2)]
+    elif H2 == 180:
+        windows = [(H1, 360 - H1)]
+    else:
+        windows = [(-H2, -H1), (H1, H2)]
+
+    crossings: List[Tuple[float, bool]] = []
+
+    # Scan each window in steps of at most one degree (four minutes) of hour angle
+    # for crossings, where each is refined with a bracketed root solver:
+    for a, b in windows:
+        steps = max(1, ceil(b - a))
+
+        Ha, fa = a, f(a)
+
+        for k in range(1, steps + 1):
+            Hb = a + (b - a) * k / steps
+
+            fb = f(Hb)
+
+            if (fa < 0) != (fb < 0):
+                H = find_root(f, Ha, Hb, tolerance=1e-6, fa=fa, fb=fb)
+                crossings.append((H, fb >= 0))
+
+            Ha, fa = Hb, fb
+
+    return above, crossings
+
+
+# **************************************************************************************
+
+
+def _get_next_horizon_mask_hour_angle(
+    crossings: List[Tuple[float, bool]], H: float, rising: bool
+) -> Optional[float]:
+    # Get the hour angle (in degrees) through which the object advances from H to
+    # its next crossing of the mask in the given direction, if any:
+    ΔHs = [(Hc - H) % 360 for Hc, upward in crossings if upward == rising]
+
+    return min(ΔHs) if ΔHs else None
+
+
+# **************************************************************************************
+
+
+def _get_horizon_mask_visibility(
+    observer: GeographicCoordinate, target: EquatorialCoordinate, mask: HorizonMask
+) -> Visibility:
+    latitude, dec = radians(observer["latitude"]), radians(target["dec"])
+
+    above, crossings = _get_horizon_mask_crossings(
+        sin(latitude), cos(latitude), sin(dec), cos(dec), mask
+    )
+
+    if crossings:
+        return Visibility.RISES_AND_SETS
+
+    return Visibility.CIRCUMPOLAR if above else Visibility.NEVER_VISIBLE
+
+
+# **************************************************************************************
+
+
 def is_object_circumpolar(
-    observer: GeographicCoordinate, target: EquatorialCoordinate, horizon: float
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+    horizon: Union[float, HorizonMask],
 ) -> bool:
     """
     An object is considered circumpolar if it is always above the observer's
@@ -93,9 +304,16 @@ def is_object_circumpolar(
 
     :param target: The equatorial coordinate of the observed object.
     :param observer: The geographic coordinate of the observer.
-    :param horizon: The observer's horizon (in degrees).
+    :param horizon: The observer's horizon (in degrees), or a horizon mask, in which
+        case the object is circumpolar if it is always above the mask.
     :return: True if the object is circumpolar, False otherwise.
     """
+    if isinstance(horizon, HorizonMask):
+        return (
+            _get_horizon_mask_visibility(observer, target, horizon)
+            == Visibility.CIRCUMPOLAR
+        )
+
     # We only need the declination of the target object:
     dec = target["dec"]
 
@@ -111,7 +329,9 @@ def is_object_circumpolar(
 
 
 def is_object_never_visible(
-    observer: GeographicCoordinate, target: EquatorialCoordinate, horizon: float
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+    horizon: Union[float, HorizonMask],
 ) -> bool:
     """
     An object is never visible if it is always below the observer's horizon and never
@@ -122,9 +342,16 @@ def is_object_never_visible(
 
     :param target: The equatorial coordinate of the observed object.
     :param observer: The geographic coordinate of the observer.
-    :param horizon: The observer's horizon (in degrees).
+    :param horizon: The observer's horizon (in degrees), or a horizon mask, in which
+        case the object is never visible if it is always below the mask.
     :return: True if the object is never visible, False otherwise.
     """
+    if isinstance(horizon, HorizonMask):
+        return (
+            _get_horizon_mask_visibility(observer, target, horizon)
+            == Visibility.NEVER_VISIBLE
+        )
+
     # We only need the declination of the target object:
     dec = target["dec"]
 
@@ -144,7 +371,7 @@ def is_object_below_horizon(
     date: datetime,
     observer: GeographicCoordinate,
     target: EquatorialCoordinate | HorizontalCoordinate,
-    horizon: float,
+    horizon: Union[float, HorizonMask],
 ) -> bool:
     """
     An object is never visible if it is always below the observer's horizon
@@ -155,7 +382,7 @@ def is_object_below_horizon(
 
     :param target: The equatorial or horizontal coordinate of the observed object.
     :param observer: The geographic coordinate of the observer.
-    :param horizon: The observer's horizon (in degrees).
+    :param horizon: The observer's horizon (in degrees), or a horizon mask.
     :return: True if the object is never visible, False otherwise.
     """
     # Attempt to type narrow the target coordinate as an equatorial coordinate:
@@ -168,6 +395,9 @@ def is_object_below_horizon(
     hz = is_horizontal_coordinate(target)
     assert hz is not None
 
+    if isinstance(horizon, HorizonMask):
+        return not horizon.is_above(hz)
+
     # If the object's horizontal altitude local to some observer is less than the
     # observer's horizon, then the object is never visible (always below the
     # observer's horizon).
@@ -258,11 +488,73 @@ def get_transit(
 # **************************************************************************************
 
 
+def _get_next_horizon_mask_crossing(
+    date: datetime,
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+    mask: HorizonMask,
+    rising: bool,
+) -> Rise | bool:
+    """
+    Determines the next time an object crosses a horizon mask, upward when rising or
+    downward when setting, by scanning the hour angles at which the object lies
+    between the lowest and highest points of the mask for crossings, which are then
+    refined with a bracketed root solver.
+
+    :param date: The date to start searching for the next crossing.
+    :param observer: The geographic coordinate of the observer.
+    :param target: The equatorial coordinate of the observed object.
+    :param mask: The horizon mask of the observer.
+    :param rising: Whether to find the rising (True) or setting (False) crossing.
+    :return: The next crossing, or, if the object never crosses the mask, True when
+        rising (and False when setting) if the object is always above the mask, and
+        False when rising (and True when setting) if the object is always below it.
+    """
+    latitude = radians(observer["latitude"])
+
+    sinφ, cosφ = sin(latitude), cos(latitude)
+
+    dec = radians(target["dec"])
+
+    sinδ, cosδ = sin(dec), cos(dec)
+
+    above, crossings = _get_horizon_mask_crossings(sinφ, cosφ, sinδ, cosδ, mask)
+
+    # If the object never crosses the mask, it is either always above or always
+    # below it:
+    if not crossings:
+        return above == rising
+
+    # Get the local sidereal time (in hours), and the hour angle (in degrees), at the
+    # date, from which the hour angle then advances by ΔH:
+    LST = get_local_sidereal_time(date, observer["longitude"])
+
+    H = LST * 15 - target["ra"]
+
+    ΔH = _get_next_horizon_mask_hour_angle(crossings, H, rising)
+
+    if ΔH is None:
+        return above == rising
+
+    LST = (LST + ΔH / 15) % 24
+
+    return {
+        "date": date.astimezone(tz=timezone.utc)
+        + timedelta(days=ΔH / 360 * SIDEREAL_DAY),
+        "LST": LST,
+        "GST": convert_local_sidereal_time_to_greenwich_sidereal_time(LST, observer),
+        "az": _get_horizontal_at_hour_angle(sinφ, cosφ, sinδ, cosδ, H + ΔH)[1],
+    }
+
+
+# **************************************************************************************
+
+
 def get_next_rise(
     date: datetime,
     observer: GeographicCoordinate,
     target: EquatorialCoordinate,
-    horizon: float = 0,
+    horizon: Union[float, HorizonMask] = 0,
 ) -> Rise | bool:
     """
     Determines the next rise time for an object, if at all.
@@ -270,12 +562,16 @@ def get_next_rise(
     :param date: The date to start searching for the next rise.
     :param observer: The geographic coordinate of the observer.
     :param target: The equatorial coordinate of the observed object.
-    :param horizon: The observer's horizon (in degrees).
+    :param horizon: The observer's horizon (in degrees), or a horizon mask, in which
+        case the rise is the next time the object rises above the mask.
 
     :return: The next rise time or False if the object never rises,
     or True if the object is always above the horizon (circumpolar)
     for the observer.
     """
+    if isinstance(horizon, HorizonMask):
+        return _get_next_horizon_mask_crossing(date, observer, target, horizon, True)
+
     now = date
 
     # If the object is circumpolar, it never rises:
@@ -330,7 +626,7 @@ def get_next_set(
     date: datetime,
     observer: GeographicCoordinate,
     target: EquatorialCoordinate,
-    horizon: float = 0,
+    horizon: Union[float, HorizonMask] = 0,
 ) -> Rise | bool:
     """
     Determines the next set time for an object, if at all.
@@ -338,12 +634,16 @@ def get_next_set(
     :param date: The date to start searching for the next set.
     :param observer: The geographic coordinate of the observer.
     :param target: The equatorial coordinate of the observed object.
-    :param horizon: The observer's horizon (in degrees).
+    :param horizon: The observer's horizon (in degrees), or a horizon mask, in which
+        case the set is the next time the object sets below the mask.
 
     :return: The next set time or True if the object never sets,
     or False if the object is always above the horizon (circumpolar)
     for the observer.
     """
+    if isinstance(horizon, HorizonMask):
+        return _get_next_horizon_mask_crossing(date, observer, target, horizon, False)
+
     now = date
 
     # If the object is circumpolar, it never rises:
@@ -392,3 +692,299 @@ def get_next_set(
 
 
 # **************************************************************************************
+
+
+def _get_next_julian_date(JD: float, now: float) -> float:
+    # An event which does not occur (i.e., is NaN) never occurs:
+    if isnan(JD):
+        return JD
+
+    # Step the event on (or back) by a whole number of sidereal days, to its earliest
+    # occurrence at or after now:
+    JD += ceil((now - JD) / SIDEREAL_DAY) * SIDEREAL_DAY
+
+    # Guard against rounding placing the occurrence just before now:
+    return JD + SIDEREAL_DAY if JD < now else JD
+
+
+# **************************************************************************************
+
+
+def _get_next_julian_dates(
+    date: datetime, GSTs: MutableSequence[float]
+) -> MutableSequence[float]:
+    # Adjust the date to UTC:
+    date = date.astimezone(tz=timezone.utc)
+
+    now = get_julian_date(date)
+
+    JDs = convert_greenwich_sidereal_times_to_julian_dates(date, GSTs)
+
+    # Any event which has already occurred on the date next occurs one sidereal day
+    # later, which may still be on the same date (in its last ~4 minutes):
+    for i, JD in enumerate(JDs):
+        if JD < now:
+            JDs[i] = _get_next_julian_date(JD, now)
+
+    return JDs
+
+
+# **************************************************************************************
+
+
+def get_next_rise_transit_set_times(
+    date: datetime,
+    observer: GeographicCoordinate,
+    ra: EquatorialCatalog,
+    dec: Optional[Sequence[float]] = None,
+    horizon: Union[float, HorizonMask] = 0,
+) -> RiseTransitSetTimes:
+    """
+    Determines the visibility, and the next rise, transit and set times, of a catalog
+    of targets for an observer, e.g., for a nightly visibility precompute.
+
+    The observer's trigonometry and the date-dependent sidereal time constants are
+    computed once for the whole catalog, and the times are returned as Julian Dates
+    rather than datetime objects.
+
+    Targets are classified by whether they cross the horizon at all, such that for
+    a horizon of zero the times and azimuths are identical to those of get_next_rise
+    and get_next_set. The transit time is that of the next upper culmination, which
+    is given for every target.
+
+    For a horizon mask, the rise and set of each target are instead found by
+    scanning for, and refining, its next crossings of the mask, as per get_next_rise
+    and get_next_set, with targets which never cross it being either circumpolar or
+    never visible.
+
+    :param date: The date to start searching for the next rise, transit and set.
+    :param observer: The geographic coordinate of the observer.
+    :param ra: The right ascensions of the targets (in degrees), or the targets as
+        an EquatorialArray or a sequence of equatorial coordinates.
+    :param dec: The declinations of the targets (in degrees), if ra is a column of
+        right ascensions.
+    :param horizon: The observer's horizon (in degrees), or a horizon mask.
+    :return: The visibility, next rise, transit and set times (as Julian Dates), and
+        the azimuths of rise and set (in degrees), of the targets.
+    """
+    ras, decs = get_coordinate_columns(ra, dec, ("ra", "dec"))
+
+    n = len(ras)
+
+    if len(decs) != n:
+        raise ValueError("ra and dec must be of the same length")
+
+    latitude = radians(observer["latitude"])
+
+    sinφ, cosφ, tanφ = sin(latitude), cos(latitude), tan(latitude)
+
+    mask = horizon if isinstance(horizon, HorizonMask) else None
+
+    h = 0.0 if isinstance(horizon, HorizonMask) else radians(horizon)
+
+    sinh, cosh = sin(h), cos(h)
+
+    # The longitude of the observer, as an offset to the sidereal time (in hours):
+    λ = observer["longitude"] / 15.0
+
+    visibility = array("b", bytes(n))
+
+    GSTr, GSTt, GSTs = (
+        array("d", [nan]) * n,
+        array("d", [nan]) * n,
+        array("d", [nan]) * n,
+    )
+
+    R, S = array("d", [nan]) * n, array("d", [nan]) * n
+
+    # The next rise and set (as Julian Dates) of each target which crosses the mask:
+    crossings: List[Tuple[int, float, float]] = []
+
+    if mask is not None:
+        # Get the local sidereal time (in hours), and the Julian Date, at the date,
+        # which are shared by every target:
+        LST = get_local_sidereal_time(date, observer["longitude"])
+
+        now = get_julian_date(date.astimezone(tz=timezone.utc))
+
+    for i in range(n):
+        # Convert the right ascension to hours:
+        α = ras[i] / 15
+
+        δ = radians(decs[i])
+
+        # The target transits when the local sidereal time equals its right ascension:
+        GST = α - λ
+
+        if GST < 0:
+            GST += 24
+
+        if GST > 24:
+            GST -= 24
+
+        GSTt[i] = GST
+
+        if mask is not None:
+            sinδ, cosδ = sin(δ), cos(δ)
+
+            above, hour_angles = _get_horizon_mask_crossings(
+                sinφ, cosφ, sinδ, cosδ, mask
+            )
+
+            # If the target never crosses the mask, it is either always above it
+            # (circumpolar) or always below it (never visible):
+            if not hour_angles:
+                visibility[i] = (
+                    Visibility.CIRCUMPOLAR if above else Visibility.NEVER_VISIBLE
+                )
+                continue
+
+            # Get the hour angle of the target (in degrees) at the date:
+            H = LST * 15 - ras[i]
+
+            JDr, JDs = nan, nan
+
+            ΔH = _get_next_horizon_mask_hour_angle(hour_angles, H, True)
+
+            if ΔH is not None:
+                JDr = now + ΔH / 360 * SIDEREAL_DAY
+
+                _, R[i] = _get_horizontal_at_hour_angle(sinφ, cosφ, sinδ, cosδ, H + ΔH)
+
+            ΔH = _get_next_horizon_mask_hour_angle(hour_angles, H, False)
+
+            if ΔH is not None:
+                JDs = now + ΔH / 360 * SIDEREAL_DAY
+
+                _, S[i] = _get_horizontal_at_hour_angle(sinφ, cosφ, sinδ, cosδ, H + ΔH)
+
+            crossings.append((i, JDr, JDs))
+            continue
+
+        # Get the cosine of the hour angle at which the target crosses the horizon:
+        cosH = sinh / (cosφ * cos(δ)) - tanφ * tan(δ)
+
+        # If |cos(H)| > 1, the target never crosses the horizon, and so is either
+        # always above it (circumpolar) or always below it (never visible):
+        if cosH < -1:
+            visibility[i] = Visibility.CIRCUMPOLAR
+            continue
+
+        if cosH > 1:
+            visibility[i] = Visibility.NEVER_VISIBLE
+            continue
+
+        H = degrees(acos(cosH)) / 15
+
+        # Get the azimuthal angle of rise, and of set:
+        cosA = (sin(δ) - sinh * sinφ) / (cosh * cosφ)
+
+        R[i] = degrees(acos(max(-1.0, min(1.0, cosA))))
+
+        S[i] = 360 - R[i]
+
+        # The local sidereal time of rise:
+        LSTr = 24 + α - H
+
+        if LSTr > 24:
+            LSTr -= 24
+
+        # The local sidereal time of set:
+        LSTs = α + H
+
+        if LSTs > 24:
+            LSTs -= 24
+
+        # Convert the local sidereal times to Greenwich sidereal times:
+        for LST, GSTx in ((LSTr, GSTr), (LSTs, GSTs)):
+            GST = LST - λ
+
+            if GST < 0:
+                GST += 24
+
+            if GST > 24:
+                GST -= 24
+
+            GSTx[i] = GST
+
+    times = RiseTransitSetTimes(
+        visibility,
+        _get_next_julian_dates(date, GSTr),
+        _get_next_julian_dates(date, GSTt),
+        _get_next_julian_dates(date, GSTs),
+        R,
+        S,
+    )
+
+    for i, JDr, JDs in crossings:
+        times.rise[i], times.set[i] = JDr, JDs
+
+    return times
+
+
+# **************************************************************************************
+
+
+def get_rise_transit_set_events(
+    date: datetime,
+    observer: GeographicCoordinate,
+    target: EquatorialCoordinate,
+    horizon: Union[float, HorizonMask] = 0,
+) -> Iterator[RiseTransitSetEvent]:
+    """
+    Yields the rise, transit and set events of a target for an observer in time
+    order, starting from a date, without end, e.g., to be sliced with
+    itertools.islice or consumed until some date.
+
+    The first occurrence of each event is determined as per
+    get_next_rise_transit_set_times, after which each event recurs exactly one mean
+    sidereal day later, such that no further sidereal time inversions (nor any
+    recursion) are required. Targets which do not rise and set only yield transits.
+
+    :param date: The date to start yielding events from.
+    :param observer: The geographic coordinate of the observer.
+    :param target: The equatorial coordinate of the observed object.
+    :param horizon: The observer's horizon (in degrees), or a horizon mask.
+    :return: An iterator of the rise, transit and set events of the target.
+    """
+    times = get_next_rise_transit_set_times(
+        date, observer, [target["ra"]], [target["dec"]], horizon
+    )
+
+    # The target transits to the south of the zenith if its declination is less
+    # than the observer's latitude, and to the north otherwise:
+    A = 180.0 if target["dec"] < observer["latitude"] else 0.0
+
+    now = get_julian_date(date.astimezone(tz=timezone.utc))
+
+    # The first occurrence of each event at or after the date, in time order, where
+    # the events which do not occur (i.e., are NaN) are discarded. Normalising each
+    # to within one sidereal day of the date ensures that every subsequent cycle is
+    # also in time order, without any event being skipped:
+    events: List[Tuple[float, Literal["rise", "transit", "set"], float]] = [
+        (times.rise[0], "rise", times.R[0]),
+        (times.transit[0], "transit", A),
+        (times.set[0], "set", times.S[0]),
+    ]
+
+    events = sorted(
+        (_get_next_julian_date(JD, now), event, az)
+        for JD, event, az in events
+        if not isnan(JD)
+    )
+
+    for n in count():
+        for JD, event, az in events:
+            # Step on by a whole number of sidereal days, without accumulating any
+            # rounding error:
+            JD = JD + n * SIDEREAL_DAY
+
+            yield {
+                "event": event,
+                "date": convert_julian_date_to_universal_coordinate_time(JD),
+                "JD": JD,
+                "az": az,
+            }
+
+
+# **************************************************************************************
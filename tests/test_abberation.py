@@ -1,6 +1,10 @@
 from datetime import datetime
 
-from src.celerity.aberration import get_correction_to_equatorial_for_aberration
+from src.celerity.aberration import (
+    get_aberration_terms,
+    get_correction_for_aberration,
+    get_correction_to_equatorial_for_aberration,
+)
 from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
 
 # For testing we need to specify a date because most calculations are
@@ -24,3 +28,13 @@ def test_get_correction_to_equatorial_for_aberration():
     dec = t["dec"] + betelgeuse["dec"]
     assert ra == 88.78837512114575
     assert dec == 7.406109156062398
+
+
+def test_get_correction_for_aberration():
+    terms = get_aberration_terms(date)
+    Δra, Δdec = get_correction_for_aberration(
+        betelgeuse["ra"], betelgeuse["dec"], terms
+    )
+    # The terms may be shared by many targets, with results identical to the scalar:
+    assert betelgeuse["ra"] + Δra == 88.78837512114575
+    assert betelgeuse["dec"] + Δdec == 7.406109156062398
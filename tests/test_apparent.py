@@ -0,0 +1,90 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.celerity.apparent import (
+    get_apparent_place,
+    get_apparent_place_transform,
+    get_apparent_places,
+)
+from src.celerity.common import EquatorialCoordinate
+
+# **************************************************************************************
+
+# Meeus, Astronomical Algorithms (2nd ed.), Example 23.a is for θ Persei on
+# 2028 November 13.19 TD:
+date = datetime(2028, 11, 13, 4, 33, 36, 0, tzinfo=timezone.utc)
+
+# The J2000.0 coordinate of θ Persei, including its proper motion up to the date:
+target: EquatorialCoordinate = {"ra": 41.0540613, "dec": 49.2277489}
+
+# **************************************************************************************
+
+
+def test_get_apparent_place_transform():
+    transform = get_apparent_place_transform(date)
+    assert transform is get_apparent_place_transform(date)
+
+    # The combined precession-nutation matrix should be orthonormal:
+    for i, row in enumerate(transform.matrix):
+        for j, other in enumerate(transform.matrix):
+            dot = sum(a * b for a, b in zip(row, other))
+            assert dot == pytest.approx(1.0 if i == j else 0.0, abs=1e-12)
+
+    # The Earth's orbital velocity is ~1e-4 c:
+    assert sum(v * v for v in transform.velocity) ** 0.5 == pytest.approx(
+        9.9e-5, rel=0.02
+    )
+
+
+# **************************************************************************************
+
+
+def test_get_apparent_place():
+    eq = get_apparent_place(date, target)
+    # Meeus gives α = 41.5599646° and δ = 49.3520685°, which we should match to
+    # within the accuracy of the low-precision nutation (~1″):
+    assert eq["ra"] == pytest.approx(41.5599646, abs=1 / 3600)
+    assert eq["dec"] == pytest.approx(49.3520685, abs=1 / 3600)
+
+    # The target should not be mutated:
+    assert target == {"ra": 41.0540613, "dec": 49.2277489}
+
+
+# **************************************************************************************
+
+
+def test_get_apparent_places():
+    ra, dec = get_apparent_places(
+        date, [target["ra"], 0.0, 359.9], [target["dec"], 90.0, -89.99]
+    )
+
+    assert len(ra) == len(dec) == 3
+
+    for α, δ, (α0, δ0) in zip(
+        ra, dec, [(41.0540613, 49.2277489), (0, 90), (359.9, -89.99)]
+    ):
+        eq = get_apparent_place(date, {"ra": α0, "dec": δ0})
+        assert α == pytest.approx(eq["ra"], abs=1e-9)
+        assert δ == pytest.approx(eq["dec"], abs=1e-9)
+        assert 0 <= α < 360
+
+    # An apparent right ascension a hair below zero must wrap to 0, not to 360:
+    ra, _ = get_apparent_places(
+        datetime(2021, 5, 14, tzinfo=timezone.utc), [359.7338757772416], [1.0]
+    )
+    assert 0 <= ra[0] < 360
+
+    with pytest.raises(ValueError):
+        get_apparent_places(date, [0.0], [])
+
+
+# **************************************************************************************
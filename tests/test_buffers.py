@@ -0,0 +1,247 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+import ctypes
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.celerity.apparent import get_apparent_places
+from src.celerity.buffers import (
+    get_float64_column_pair,
+    get_float64_view,
+    get_writable_float64_view,
+)
+from src.celerity.common import EquatorialArray, get_coordinate_columns
+from src.celerity.coordinates import (
+    convert_equatorial_coordinates_to_galactic,
+    convert_equatorial_coordinates_to_horizontal,
+    get_corrections_to_equatorial,
+)
+from src.celerity.observers import (
+    ObserverArray,
+    convert_equatorial_to_horizontal_for_observers,
+)
+from src.celerity.temporal import convert_greenwich_sidereal_times_to_julian_dates
+from src.celerity.track import get_track_arrays, get_track_size
+
+# **************************************************************************************
+
+date = datetime(2021, 5, 14, 0, 0, 0, tzinfo=timezone.utc)
+
+observer = {"latitude": 19.820611, "longitude": -155.468094}
+
+ra = array("d", [88.7929583, 101.2871553, 279.2347348, 0.0, 359.9])
+
+dec = array("d", [7.4070639, -16.7161159, 38.7836889, 89.9, -45.0])
+
+# **************************************************************************************
+
+
+def test_get_float64_view():
+    # Columns which are already indexable as floats are returned as is:
+    assert get_float64_view(ra) is ra
+    assert get_float64_view([1.0, 2.0]) == [1.0, 2.0]
+
+    view = get_float64_view(memoryview(ra))
+    assert isinstance(view, memoryview)
+    assert view.obj is ra
+    assert list(view) == list(ra)
+
+    # A non-native struct format, e.g., as exported by NumPy, is viewed as native:
+    c = (ctypes.c_double * 3)(1.0, 2.0, 3.0)
+    assert memoryview(c).format == "<d"
+    assert list(get_float64_view(c)) == [1.0, 2.0, 3.0]
+
+    # A multidimensional buffer is flattened in row-major order:
+    m = (ctypes.c_double * 2 * 2)((1.0, 2.0), (3.0, 3.5))
+    assert list(get_float64_view(m)) == [1.0, 2.0, 3.0, 3.5]
+
+    # Buffers which are not of float64 are returned as is:
+    i = array("i", [1, 2, 3])
+    assert get_float64_view(i) is i
+    f = array("f", [1.0, 2.0])
+    assert get_float64_view(f) is f
+
+
+# **************************************************************************************
+
+
+def test_get_writable_float64_view():
+    buffer = bytearray(16)
+    view = get_writable_float64_view(memoryview(buffer).cast("d"))
+    view[1] = 1.5
+    assert memoryview(buffer).cast("d").tolist() == [0.0, 1.5]
+
+    c = (ctypes.c_double * 2)()
+    get_writable_float64_view(c)[0] = 2.5
+    assert c[0] == 2.5
+
+    # A read-only buffer cannot be written through, so is returned as is:
+    readonly = memoryview(bytes(16)).cast("d")
+    assert get_writable_float64_view(readonly) is readonly
+
+
+# **************************************************************************************
+
+
+def test_get_float64_column_pair():
+    m = (ctypes.c_double * 2 * 3)((1.0, 2.0), (3.0, 4.0), (5.0, 6.0))
+
+    columns = get_float64_column_pair(m)
+    assert columns is not None
+    x, y = columns
+    assert list(x) == [1.0, 3.0, 5.0]
+    assert list(y) == [2.0, 4.0, 6.0]
+
+    assert get_float64_column_pair([(1.0, 2.0)]) is None
+    assert get_float64_column_pair(ra) is None
+    assert get_float64_column_pair((ctypes.c_double * 3 * 2)()) is None
+
+    assert get_coordinate_columns(m, None, ("ra", "dec")) == columns
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_coordinates_to_horizontal_buffers():
+    expected = convert_equatorial_coordinates_to_horizontal(date, observer, ra, dec)
+
+    alt, az = (ctypes.c_double * len(ra))(), (ctypes.c_double * len(ra))()
+
+    result = convert_equatorial_coordinates_to_horizontal(
+        date, observer, memoryview(ra), memoryview(dec), alt=alt, az=az
+    )
+
+    # The caller's output buffers are written in place and returned:
+    assert result.alt is alt
+    assert result.az is az
+    assert list(alt) == list(expected.alt)
+    assert list(az) == list(expected.az)
+
+    with pytest.raises(ValueError):
+        convert_equatorial_coordinates_to_horizontal(
+            date, observer, ra, dec, alt=(ctypes.c_double * 2)()
+        )
+
+
+# **************************************************************************************
+
+
+def test_get_corrections_to_equatorial_buffers():
+    expected = get_corrections_to_equatorial(date, ra, dec)
+
+    # The corrections may be applied in place to the caller's columns:
+    ras, decs = array("d", ra), array("d", dec)
+
+    out = EquatorialArray(ras, decs)
+
+    assert get_corrections_to_equatorial(date, out, out=out) is out
+    assert ras == expected.ra
+    assert decs == expected.dec
+
+    with pytest.raises(ValueError):
+        get_corrections_to_equatorial(
+            date, ra, dec, out=EquatorialArray(array("d"), array("d"))
+        )
+
+
+# **************************************************************************************
+
+
+def test_get_apparent_places_buffers():
+    expected = get_apparent_places(date, ra, dec)
+
+    out = EquatorialArray((ctypes.c_double * len(ra))(), (ctypes.c_double * len(ra))())
+
+    assert get_apparent_places(date, memoryview(ra), memoryview(dec), out=out) is out
+    assert list(out.ra) == list(expected.ra)
+    assert list(out.dec) == list(expected.dec)
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_coordinates_to_galactic_buffers():
+    expected = convert_equatorial_coordinates_to_galactic(ra, dec)
+
+    pairs = (ctypes.c_double * 2 * len(ra))(*zip(ra, dec))
+
+    longitude = (ctypes.c_double * len(ra))()
+
+    result = convert_equatorial_coordinates_to_galactic(pairs, longitude=longitude)
+
+    assert result[0] is longitude
+    assert list(longitude) == list(expected[0])
+    assert list(result[1]) == list(expected[1])
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_to_horizontal_for_observers_buffers():
+    observers = ObserverArray([19.8, -30.2, 51.5], [-155.5, -70.7, 0.0])
+
+    target = {"ra": ra[0], "dec": dec[0]}
+
+    expected = convert_equatorial_to_horizontal_for_observers(date, observers, target)
+
+    alt = (ctypes.c_double * 3)()
+
+    result = convert_equatorial_to_horizontal_for_observers(
+        date, observers, target, alt=alt
+    )
+
+    assert result.alt is alt
+    assert list(alt) == list(expected.alt)
+
+
+# **************************************************************************************
+
+
+def test_get_track_arrays_buffers():
+    end, step = date + timedelta(hours=1), timedelta(minutes=10)
+
+    target = {"ra": ra[0], "dec": dec[0]}
+
+    expected = get_track_arrays(date, end, step, observer, target)
+
+    size = get_track_size(date, end, step)
+
+    alt = (ctypes.c_double * size)()
+
+    track = get_track_arrays(date, end, step, observer, target, alt=alt)
+
+    assert track.alt is alt
+    assert list(alt) == list(expected.alt)
+
+
+# **************************************************************************************
+
+
+def test_convert_greenwich_sidereal_times_to_julian_dates_buffers():
+    GSTs = array("d", [0.0, 6.5, 12.25, 23.9])
+
+    expected = convert_greenwich_sidereal_times_to_julian_dates(date, GSTs)
+
+    JDs = (ctypes.c_double * len(GSTs))()
+
+    assert (
+        convert_greenwich_sidereal_times_to_julian_dates(date, memoryview(GSTs), JDs)
+        is JDs
+    )
+    assert list(JDs) == list(expected)
+
+    with pytest.raises(ValueError):
+        convert_greenwich_sidereal_times_to_julian_dates(
+            date, GSTs, (ctypes.c_double * 2)()
+        )
+
+
+# **************************************************************************************
@@ -0,0 +1,153 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.celerity.catalog import DeclinationIndex
+from src.celerity.common import EquatorialCoordinate
+from src.celerity.coordinates import convert_equatorial_coordinates_to_horizontal
+from src.celerity.horizon import HorizonMask
+from src.celerity.transit import Visibility, get_next_rise_transit_set_times
+
+# **************************************************************************************
+
+date = datetime(2021, 5, 14, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+betelgeuse: EquatorialCoordinate = {"ra": 88.7929583, "dec": 7.4070639}
+
+polaris: EquatorialCoordinate = {"ra": 37.952659, "dec": 89.264108}
+
+LMC: EquatorialCoordinate = {"ra": 80.8941667, "dec": -69.7561111}
+
+sigma_octantis: EquatorialCoordinate = {"ra": 317.398, "dec": -88.956}
+
+targets = [betelgeuse, polaris, LMC, sigma_octantis]
+
+# A grid of targets across the whole sky:
+grid = [{"ra": (i * 37) % 360, "dec": -89.5 + i * 179 / 719} for i in range(720)]
+
+# **************************************************************************************
+
+
+def test_declination_index():
+    index = DeclinationIndex(targets)
+
+    assert len(index) == 4
+    assert list(index.dec) == sorted(t["dec"] for t in targets)
+    assert list(index.indices) == [3, 2, 0, 1]
+    assert list(index.ra) == [targets[i]["ra"] for i in index.indices]
+
+    with pytest.raises(ValueError):
+        DeclinationIndex([1.0, 2.0], [3.0])
+
+
+# **************************************************************************************
+
+
+def test_get_visibility_bands():
+    index = DeclinationIndex(targets)
+
+    # For Mauna Kea, Hawaii, US:
+    bands = index.get_visibility_bands({"latitude": 19.820611, "longitude": 0})
+
+    assert [index.indices[i] for i in bands.circumpolar[1]] == [1]
+    assert [index.indices[i] for i in bands.never_visible[0]] == [3]
+    assert [index.indices[i] for i in bands.rises_and_sets] == [2, 0]
+    assert len(bands.circumpolar[0]) == 0
+    assert len(bands.never_visible[1]) == 0
+
+    # For the South Pole, the bands are reversed:
+    bands = index.get_visibility_bands({"latitude": -89.9, "longitude": 0})
+
+    assert [index.indices[i] for i in bands.circumpolar[0]] == [3, 2]
+    assert [index.indices[i] for i in bands.never_visible[1]] == [0, 1]
+    assert len(bands.rises_and_sets) == 0
+
+
+# **************************************************************************************
+
+
+@pytest.mark.parametrize("latitude", [-60, -19.8, 0, 19.8, 51.5, 89.9])
+@pytest.mark.parametrize("horizon", [-1, 0, 10])
+def test_get_visibility_bands_partition(latitude, horizon):
+    index = DeclinationIndex(grid)
+
+    observer = {"latitude": latitude, "longitude": 0}
+
+    bands = index.get_visibility_bands(observer, horizon)
+
+    visibility = get_next_rise_transit_set_times(date, observer, grid, None, horizon)
+
+    positions = [
+        (bands.circumpolar, Visibility.CIRCUMPOLAR),
+        (bands.never_visible, Visibility.NEVER_VISIBLE),
+        ((bands.rises_and_sets,), Visibility.RISES_AND_SETS),
+    ]
+
+    classified = {}
+
+    # The bands should partition the index, and agree with the classification of
+    # each target by get_next_rise_transit_set_times:
+    for ranges, expected in positions:
+        for r in ranges:
+            for i in r:
+                assert index.indices[i] not in classified
+                classified[index.indices[i]] = expected
+                assert visibility.visibility[index.indices[i]] == expected
+
+    assert len(classified) == len(grid)
+
+
+# **************************************************************************************
+
+
+def test_get_visibility_bands_horizon_mask():
+    index = DeclinationIndex(grid)
+
+    observer = {"latitude": 19.820611, "longitude": 0}
+
+    mask = HorizonMask([0, 70, 80, 90, 100, 359], [2, 2, 15, 15, 2, 2])
+
+    bands = index.get_visibility_bands(observer, mask)
+
+    # The bands should be those of the highest and lowest points of the mask:
+    assert bands.circumpolar == index.get_visibility_bands(observer, 15).circumpolar
+    assert bands.never_visible == index.get_visibility_bands(observer, 2).never_visible
+
+
+# **************************************************************************************
+
+
+def test_get_targets():
+    index = DeclinationIndex(grid)
+
+    observer = {"latitude": 19.820611, "longitude": -155.468094}
+
+    bands = index.get_visibility_bands(observer)
+
+    candidates = index.get_targets(bands.rises_and_sets)
+
+    assert len(candidates.ra) == len(bands.rises_and_sets)
+    assert all(-70.2 < dec < 70.2 for dec in candidates.dec)
+
+    # The views can be passed straight to the batch transforms:
+    hz = convert_equatorial_coordinates_to_horizontal(date, observer, candidates)
+    assert len(hz.alt) == len(bands.rises_and_sets)
+
+    # Every circumpolar target should be above the horizon:
+    circumpolar = index.get_targets(bands.circumpolar[1])
+    hz = convert_equatorial_coordinates_to_horizontal(date, observer, circumpolar)
+    assert all(alt > 0 for alt in hz.alt)
+
+    with pytest.raises(ValueError):
+        index.get_targets(range(0, 10, 2))
+
+
+# **************************************************************************************
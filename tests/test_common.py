@@ -1,8 +1,20 @@
+from array import array
+from datetime import datetime, timezone
+
+import pytest
+
+from src.celerity.apparent import get_apparent_places
 from src.celerity.common import (
     CartesianCoordinate,
+    Equatorial,
+    EquatorialArray,
     EquatorialCoordinate,
+    Galactic,
+    Horizontal,
     PolarCoordinate,
     SphericalCoordinate,
+    get_coordinate_columns,
+    get_equatorial_array,
     get_F_orbital_parameter,
     is_equatorial_coordinate,
     is_horizontal_coordinate,
@@ -21,6 +33,11 @@ def test_is_equatorial_coordinate():
     target = is_equatorial_coordinate({"alt": 88.7929583, "az": 7.4070639})
     assert target is None
 
+    target = is_equatorial_coordinate(Equatorial(88.7929583, 7.4070639))
+    assert target == betelgeuse
+
+    assert is_equatorial_coordinate(Horizontal(88.7929583, 7.4070639)) is None
+
 
 def test_is_horizontal_coordinate():
     target = is_horizontal_coordinate(betelgeuse)
@@ -31,6 +48,9 @@ def test_is_horizontal_coordinate():
     assert target["alt"] == 88.7929583
     assert target["az"] == 7.4070639
 
+    target = is_horizontal_coordinate(Horizontal(alt=88.7929583, az=7.4070639))
+    assert target == {"alt": 88.7929583, "az": 7.4070639}
+
 
 def test_get_F_orbital_parameter():
     # Test for the Sun:
@@ -70,3 +90,55 @@ def test_polar_coordinate():
 
 
 # **************************************************************************************
+
+
+def test_get_equatorial_array():
+    catalog = get_equatorial_array(
+        [betelgeuse, Equatorial(ra=101.2871553, dec=-16.7161159)]
+    )
+
+    assert isinstance(catalog, EquatorialArray)
+    assert isinstance(catalog.ra, array)
+    assert list(catalog.ra) == [88.7929583, 101.2871553]
+    assert list(catalog.dec) == [7.4070639, -16.7161159]
+
+    # The rows of the catalog should be available as lightweight value types:
+    assert list(map(Equatorial, *catalog))[0] == Equatorial(88.7929583, 7.4070639)
+
+
+# **************************************************************************************
+
+
+def test_get_coordinate_columns():
+    ra, dec = [88.7929583], [7.4070639]
+
+    # Columns should be passed through without copying:
+    columns = get_coordinate_columns(ra, dec, ("ra", "dec"))
+    assert columns[0] is ra
+    assert columns[1] is dec
+
+    catalog = EquatorialArray(array("d", ra), array("d", dec))
+    columns = get_coordinate_columns(catalog, None, ("ra", "dec"))
+    assert columns[0] is catalog.ra
+
+    longitude, latitude = get_coordinate_columns(
+        [{"l": 1.0, "b": 2.0}, Galactic(l=3.0, b=4.0)], None, ("l", "b")
+    )
+    assert list(longitude) == [1.0, 3.0]
+    assert list(latitude) == [2.0, 4.0]
+
+    # A pair of columns without a second argument is ambiguous, so is rejected:
+    with pytest.raises(ValueError):
+        get_coordinate_columns(([10, 20, 30], [5, 6, 7]), None, ("ra", "dec"))
+
+    # A bare column where the second column has been omitted is also rejected:
+    with pytest.raises(ValueError):
+        get_coordinate_columns([10.0, 20.0, 30.0], None, ("ra", "dec"))
+
+    with pytest.raises(ValueError):
+        get_apparent_places(
+            datetime(2021, 5, 14, tzinfo=timezone.utc), ([10, 20, 30], [5, 6, 7])
+        )
+
+
+# **************************************************************************************
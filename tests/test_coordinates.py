@@ -7,20 +7,40 @@
 # **************************************************************************************
 
 
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from math import isclose
 
+import pytest
+
 from src.celerity.common import (
+    Equatorial,
+    EquatorialArray,
     EquatorialCoordinate,
+    GalacticArray,
+    HorizontalArray,
     GeographicCoordinate,
     HeliocentricSphericalCoordinate,
 )
 from src.celerity.coordinates import (
+    convert_ecliptic_coordinates_to_equatorial,
+    convert_ecliptic_to_equatorial,
+    convert_equatorial_coordinates_to_ecliptic,
+    convert_equatorial_coordinates_to_galactic,
+    convert_equatorial_coordinates_to_horizontal,
+    convert_equatorial_to_ecliptic,
+    convert_equatorial_to_galactic,
     convert_equatorial_to_horizontal,
+    convert_galactic_coordinates_to_equatorial,
+    convert_galactic_to_equatorial,
     convert_heliocentric_to_equatorial,
     convert_horizontal_to_equatorial,
     get_correction_to_equatorial,
+    get_corrections_to_equatorial,
+    get_corrections_to_equatorial_for_targets,
 )
+from src.celerity.refraction import get_correction_to_horizontal_for_refraction
 
 # **************************************************************************************
 
@@ -64,6 +84,62 @@ def test_convert_equatorial_to_horizontal():
 # **************************************************************************************
 
 
+def test_convert_equatorial_coordinates_to_horizontal():
+    ra = [88.7929583, 0.0, 101.2871553, 279.2347344, 37.95456067]
+    dec = [7.4070639, 45.0, -16.7161159, 38.7836889, 89.26410897]
+
+    alt, az = convert_equatorial_coordinates_to_horizontal(date, observer, ra, dec)
+
+    assert isclose(alt[0], 72.78539444063765, abs_tol=1e-9)
+    assert isclose(az[0], 134.44877920325158, abs_tol=1e-9)
+
+    # The results should agree with the scalar conversion to within rounding:
+    for n in range(len(ra)):
+        horizontal = convert_equatorial_to_horizontal(
+            date, observer, {"ra": ra[n], "dec": dec[n]}
+        )
+        assert isclose(alt[n], horizontal["alt"], abs_tol=1e-9)
+        assert isclose(az[n], horizontal["az"], abs_tol=1e-9)
+
+    with pytest.raises(ValueError):
+        convert_equatorial_coordinates_to_horizontal(date, observer, ra, dec[:-1])
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_coordinates_to_horizontal_with_buffers():
+    ra = [88.7929583, 0.0, 101.2871553]
+    dec = [7.4070639, 45.0, -16.7161159]
+
+    alt, az = array("d", [0.0] * 3), array("d", [0.0] * 3)
+
+    result = convert_equatorial_coordinates_to_horizontal(
+        date, observer, ra, dec, alt=alt, az=az, refraction=True
+    )
+
+    # The results should be written into the caller's buffers:
+    assert result[0] is alt
+    assert result[1] is az
+
+    for n in range(len(ra)):
+        horizontal = get_correction_to_horizontal_for_refraction(
+            convert_equatorial_to_horizontal(
+                date, observer, {"ra": ra[n], "dec": dec[n]}
+            )
+        )
+        assert isclose(alt[n], horizontal["alt"], abs_tol=1e-9)
+        assert isclose(az[n], horizontal["az"], abs_tol=1e-9)
+
+    with pytest.raises(ValueError):
+        convert_equatorial_coordinates_to_horizontal(
+            date, observer, ra, dec, alt=array("d", [0.0])
+        )
+
+
+# **************************************************************************************
+
+
 def test_convert_horizontal_to_equatorial():
     horizontal = convert_equatorial_to_horizontal(date, observer, betelgeuse)
     equatorial = convert_horizontal_to_equatorial(date, observer, horizontal)
@@ -83,6 +159,60 @@ def test_get_correction_to_equatorial():
 # **************************************************************************************
 
 
+def test_get_corrections_to_equatorial():
+    ra = [88.7929583, 0.0, 101.2871553, 279.2347344]
+    dec = [7.4070639, 45.0, -16.7161159, 38.7836889]
+
+    ras, decs = get_corrections_to_equatorial(date, ra, dec)
+
+    # The inputs should not be mutated:
+    assert ra[0] == 88.7929583
+    assert dec[0] == 7.4070639
+
+    # The batch corrections should be identical to the scalar corrections:
+    assert ras[0] == 88.53030813147811
+    assert decs[0] == 7.447242478781279
+
+    for n in range(len(ra)):
+        target = get_correction_to_equatorial(date, {"ra": ra[n], "dec": dec[n]})
+        assert ras[n] == target["ra"]
+        assert decs[n] == target["dec"]
+
+    with pytest.raises(ValueError):
+        get_corrections_to_equatorial(date, ra, dec[:-1])
+
+
+# **************************************************************************************
+
+
+def test_get_corrections_to_equatorial_for_targets():
+    targets = [
+        {"ra": 88.7929583, "dec": 7.4070639},
+        {"ra": 101.2871553, "dec": -16.7161159},
+    ]
+
+    corrected = get_corrections_to_equatorial_for_targets(date, targets)
+
+    assert targets[0] == {"ra": 88.7929583, "dec": 7.4070639}
+    assert corrected[0] == {"ra": 88.53030813147811, "dec": 7.447242478781279}
+    assert len(corrected) == 2
+
+    # Concurrent corrections of the same catalog should all agree:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: get_corrections_to_equatorial_for_targets(date, targets),
+                range(8),
+            )
+        )
+
+    assert all(result == corrected for result in results)
+    assert targets[1] == {"ra": 101.2871553, "dec": -16.7161159}
+
+
+# **************************************************************************************
+
+
 def test_convert_heliocentric_to_equatorial() -> None:
     venus: HeliocentricSphericalCoordinate = {
         "λ": 245.79403406596947,
@@ -97,3 +227,131 @@ def test_convert_heliocentric_to_equatorial() -> None:
 
 
 # **************************************************************************************
+
+
+def test_convert_equatorial_to_galactic():
+    # The galactic centre (Reid & Brunthaler 2004, Sgr A*):
+    galactic = convert_equatorial_to_galactic({"ra": 266.41683, "dec": -29.00781})
+    assert isclose(galactic["l"], 359.944, abs_tol=1e-3)
+    assert isclose(galactic["b"], -0.046, abs_tol=1e-3)
+
+    # The north galactic pole:
+    galactic = convert_equatorial_to_galactic({"ra": 192.85948, "dec": 27.12825})
+    assert isclose(galactic["b"], 90, abs_tol=1e-6)
+
+    equatorial = convert_galactic_to_equatorial(
+        convert_equatorial_to_galactic({"ra": 88.7929583, "dec": 7.4070639})
+    )
+    assert isclose(equatorial["ra"], 88.7929583, abs_tol=1e-10)
+    assert isclose(equatorial["dec"], 7.4070639, abs_tol=1e-10)
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_to_ecliptic():
+    # Meeus, Astronomical Algorithms (2nd ed.), Example 13.a for Pollux, referred to
+    # the J2000.0 obliquity of 23.4392911°:
+    J2000 = datetime(2000, 1, 1, 12, 0, 0, 0, tzinfo=timezone.utc)
+
+    ecliptic = convert_equatorial_to_ecliptic(
+        J2000, {"ra": 116.328942, "dec": 28.026183}
+    )
+    assert isclose(ecliptic["λ"], 113.215630, abs_tol=1e-5)
+    assert isclose(ecliptic["β"], 6.684170, abs_tol=1e-5)
+
+    equatorial = convert_ecliptic_to_equatorial(J2000, ecliptic)
+    assert isclose(equatorial["ra"], 116.328942, abs_tol=1e-10)
+    assert isclose(equatorial["dec"], 28.026183, abs_tol=1e-10)
+
+    # The ecliptic to equatorial conversion should agree with that for heliocentric
+    # ecliptic coordinates:
+    heliocentric = convert_heliocentric_to_equatorial(
+        date, {"λ": 245.79403406596947, "β": 1.8937944394473665, "r": 0.720040}
+    )
+    equatorial = convert_ecliptic_to_equatorial(
+        date, {"λ": 245.79403406596947, "β": 1.8937944394473665}
+    )
+    assert isclose(equatorial["ra"], heliocentric["ra"], abs_tol=1e-10)
+    assert isclose(equatorial["dec"], heliocentric["dec"], abs_tol=1e-10)
+
+
+# **************************************************************************************
+
+
+def test_convert_coordinates_to_galactic_and_ecliptic():
+    ra = array("d", [88.7929583, 0.0, 101.2871553, 279.2347344, 37.95456067])
+    dec = array("d", [7.4070639, 45.0, -16.7161159, 38.7836889, 89.26410897])
+
+    longitude, latitude = convert_equatorial_coordinates_to_galactic(ra, dec)
+    λ, β = convert_equatorial_coordinates_to_ecliptic(date, ra, dec)
+
+    for n in range(len(ra)):
+        target: EquatorialCoordinate = {"ra": ra[n], "dec": dec[n]}
+
+        galactic = convert_equatorial_to_galactic(target)
+        assert isclose(longitude[n], galactic["l"], abs_tol=1e-10)
+        assert isclose(latitude[n], galactic["b"], abs_tol=1e-10)
+
+        ecliptic = convert_equatorial_to_ecliptic(date, target)
+        assert isclose(λ[n], ecliptic["λ"], abs_tol=1e-10)
+        assert isclose(β[n], ecliptic["β"], abs_tol=1e-10)
+
+    # The inverse conversions should round trip, writing into the given buffers:
+    α, δ = array("d", [0.0] * 5), array("d", [0.0] * 5)
+
+    assert convert_galactic_coordinates_to_equatorial(longitude, latitude, α, δ) == (
+        α,
+        δ,
+    )
+
+    for n in range(len(ra)):
+        assert isclose(α[n], ra[n], abs_tol=1e-9)
+        assert isclose(δ[n], dec[n], abs_tol=1e-9)
+
+    convert_ecliptic_coordinates_to_equatorial(date, λ, β, α, δ)
+
+    for n in range(len(ra)):
+        assert isclose(α[n], ra[n], abs_tol=1e-9)
+        assert isclose(δ[n], dec[n], abs_tol=1e-9)
+
+    with pytest.raises(ValueError):
+        convert_equatorial_coordinates_to_galactic(ra, dec[:-1])
+
+
+# **************************************************************************************
+
+
+def test_batch_conversions_accept_coordinate_arrays():
+    targets = [
+        {"ra": 88.7929583, "dec": 7.4070639},
+        {"ra": 101.2871553, "dec": -16.7161159},
+    ]
+
+    catalog = EquatorialArray(
+        array("d", [88.7929583, 101.2871553]), array("d", [7.4070639, -16.7161159])
+    )
+
+    corrected = get_corrections_to_equatorial(date, catalog)
+    assert isinstance(corrected, EquatorialArray)
+    assert corrected == get_corrections_to_equatorial(date, catalog.ra, catalog.dec)
+    assert corrected == get_corrections_to_equatorial(date, targets)
+    assert corrected == get_corrections_to_equatorial(
+        date, [Equatorial(**target) for target in targets]
+    )
+
+    horizontal = convert_equatorial_coordinates_to_horizontal(date, observer, catalog)
+    assert isinstance(horizontal, HorizontalArray)
+    assert isclose(horizontal.alt[0], 72.78539444063765, abs_tol=1e-9)
+    assert horizontal == convert_equatorial_coordinates_to_horizontal(
+        date, observer, targets
+    )
+
+    galactic = convert_equatorial_coordinates_to_galactic(catalog)
+    assert isinstance(galactic, GalacticArray)
+    assert isinstance(
+        convert_galactic_coordinates_to_equatorial(galactic), EquatorialArray
+    )
+
+
+# **************************************************************************************
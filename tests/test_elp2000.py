@@ -0,0 +1,106 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timedelta, timezone
+
+from src.celerity.elp2000 import (
+    ELP2000_LATITUDE_TERMS,
+    ELP2000_LONGITUDE_DISTANCE_TERMS,
+    get_elp2000_distance,
+    get_elp2000_ecliptic_coordinate,
+    get_elp2000_equatorial_coordinate,
+    get_elp2000_horizontal_parallax,
+    get_elp2000_series,
+)
+from src.celerity.moon import get_equatorial_coordinate
+from src.celerity.tai import get_tt_utc_offset
+
+# **************************************************************************************
+
+# Meeus, Astronomical Algorithms (2nd ed.), Example 47.a is for 1992 April 12 at 0h TD,
+# so we specify the equivalent UTC epoch:
+TD = datetime(1992, 4, 12, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+date = TD - timedelta(seconds=get_tt_utc_offset(TD))
+
+# **************************************************************************************
+
+
+def test_get_elp2000_series():
+    lr, b = get_elp2000_series()
+    assert len(lr.sines) == len(ELP2000_LONGITUDE_DISTANCE_TERMS)
+    assert len(lr.cosines) == len(ELP2000_LONGITUDE_DISTANCE_TERMS)
+    assert len(lr.arguments) == 4 * len(ELP2000_LONGITUDE_DISTANCE_TERMS)
+    assert len(b.sines) == len(ELP2000_LATITUDE_TERMS)
+    assert len(b.arguments) == 4 * len(ELP2000_LATITUDE_TERMS)
+
+    # Truncated series should be cached, and contain fewer terms:
+    assert get_elp2000_series(0.001) is get_elp2000_series(0.001)
+    lr, b = get_elp2000_series(0.001)
+    assert len(lr.sines) < len(ELP2000_LONGITUDE_DISTANCE_TERMS)
+    assert len(b.sines) < len(ELP2000_LATITUDE_TERMS)
+    assert all(abs(Σb) >= 1000 for Σb in b.sines)
+
+
+# **************************************************************************************
+
+
+def test_get_elp2000_ecliptic_coordinate():
+    ecliptic = get_elp2000_ecliptic_coordinate(date)
+    assert abs(ecliptic["λ"] - 133.162655) < 1e-5
+    # The truncated series is accurate to ~4″ in latitude:
+    assert abs(ecliptic["β"] - -3.229126) < 1e-3
+    assert abs(ecliptic["r"] - 368409700) < 100
+
+
+# **************************************************************************************
+
+
+def test_get_elp2000_ecliptic_coordinate_with_precision():
+    ecliptic = get_elp2000_ecliptic_coordinate(date)
+
+    for precision in (0.001, 0.01):
+        truncated = get_elp2000_ecliptic_coordinate(date, precision)
+        # The error should be bounded by the sum of the discarded amplitudes:
+        assert abs(truncated["λ"] - ecliptic["λ"]) < 50 * precision
+        assert abs(truncated["β"] - ecliptic["β"]) < 50 * precision
+
+
+# **************************************************************************************
+
+
+def test_get_elp2000_equatorial_coordinate():
+    eq = get_elp2000_equatorial_coordinate(date)
+    # Meeus gives the apparent α = 134.688470 and δ = 13.768368, which includes the
+    # nutation of -0.004610° in longitude and +0.002° in obliquity:
+    assert abs(eq["ra"] - 134.688470) < 0.01
+    assert abs(eq["dec"] - 13.768368) < 0.01
+
+    # The low-order model should agree to within a degree:
+    moon = get_equatorial_coordinate(date)
+    assert abs(eq["ra"] - moon["ra"]) < 1
+    assert abs(eq["dec"] - moon["dec"]) < 1
+
+
+# **************************************************************************************
+
+
+def test_get_elp2000_distance():
+    d = get_elp2000_distance(date)
+    assert d == get_elp2000_ecliptic_coordinate(date)["r"]
+
+
+# **************************************************************************************
+
+
+def test_get_elp2000_horizontal_parallax():
+    π = get_elp2000_horizontal_parallax(date)
+    assert abs(π - 0.991990) < 1e-5
+
+
+# **************************************************************************************
@@ -0,0 +1,183 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timezone
+from math import isclose
+
+import pytest
+
+from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
+from src.celerity.coordinates import convert_equatorial_to_horizontal
+from src.celerity.frames import (
+    GALACTIC_MATRIX,
+    Frame,
+    convert_horizontal_to_unit_vector,
+    convert_vector_to_horizontal,
+    get_equatorial_to_ecliptic_matrix,
+    get_equatorial_to_horizontal_matrix,
+    get_frame_matrix,
+    get_greenwich_sidereal_matrix,
+    get_greenwich_to_horizontal_matrix,
+)
+from src.celerity.matrix import (
+    IDENTITY_MATRIX,
+    apply_matrix,
+    convert_spherical_to_unit_vector,
+    convert_vector_to_spherical,
+    multiply_matrices,
+    transpose_matrix,
+)
+
+# **************************************************************************************
+
+date = datetime(2021, 5, 14, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+# **************************************************************************************
+
+observer: GeographicCoordinate = {"latitude": 19.820611, "longitude": -155.468094}
+
+# **************************************************************************************
+
+betelgeuse: EquatorialCoordinate = {"ra": 88.7929583, "dec": 7.4070639}
+
+# **************************************************************************************
+
+
+def test_galactic_matrix():
+    product = multiply_matrices(GALACTIC_MATRIX, transpose_matrix(GALACTIC_MATRIX))
+
+    for i in range(3):
+        for j in range(3):
+            assert isclose(product[i][j], IDENTITY_MATRIX[i][j], abs_tol=1e-15)
+
+    # The north celestial pole should be at a galactic longitude of 122.93192°:
+    λ, β = convert_vector_to_spherical(apply_matrix(GALACTIC_MATRIX, (0.0, 0.0, 1.0)))
+    assert isclose(λ, 122.93192, abs_tol=1e-9)
+    assert isclose(β, 27.12825, abs_tol=1e-9)
+
+
+# **************************************************************************************
+
+
+def test_convert_horizontal_to_unit_vector():
+    # Due north on the horizon:
+    x, y, z = convert_horizontal_to_unit_vector(0, 0)
+    assert isclose(x, 1.0)
+
+    # Due east on the horizon, where y is toward the west point:
+    x, y, z = convert_horizontal_to_unit_vector(90, 0)
+    assert isclose(y, -1.0)
+
+    az, alt = convert_vector_to_horizontal(convert_horizontal_to_unit_vector(123, 45))
+    assert isclose(az, 123)
+    assert isclose(alt, 45)
+
+
+# **************************************************************************************
+
+
+def test_get_equatorial_to_ecliptic_matrix():
+    assert get_equatorial_to_ecliptic_matrix(date) is get_equatorial_to_ecliptic_matrix(
+        date
+    )
+
+    # The north ecliptic pole is at RA 270°, and a declination of 90° - ε:
+    λ, β = convert_vector_to_spherical(
+        apply_matrix(
+            get_equatorial_to_ecliptic_matrix(date),
+            convert_spherical_to_unit_vector(270, 90 - 23.436),
+        )
+    )
+    assert isclose(β, 90, abs_tol=1e-3)
+
+
+# **************************************************************************************
+
+
+def test_get_equatorial_to_horizontal_matrix():
+    matrix = get_equatorial_to_horizontal_matrix(date, observer)
+
+    assert matrix is get_equatorial_to_horizontal_matrix(date, dict(observer))
+
+    az, alt = convert_vector_to_horizontal(
+        apply_matrix(
+            matrix,
+            convert_spherical_to_unit_vector(betelgeuse["ra"], betelgeuse["dec"]),
+        )
+    )
+
+    horizontal = convert_equatorial_to_horizontal(date, observer, betelgeuse)
+    assert isclose(alt, horizontal["alt"], abs_tol=1e-9)
+    assert isclose(az, horizontal["az"], abs_tol=1e-9)
+
+    # The north celestial pole should be due north, at an altitude of the latitude:
+    az, alt = convert_vector_to_horizontal(apply_matrix(matrix, (0.0, 0.0, 1.0)))
+    assert isclose(az, 0, abs_tol=1e-9) or isclose(az, 360, abs_tol=1e-9)
+    assert isclose(alt, observer["latitude"], abs_tol=1e-9)
+
+
+# **************************************************************************************
+
+
+def test_get_greenwich_to_horizontal_matrix():
+    # The horizontal matrix should factor into an epoch-independent site rotation and
+    # a rotation by the Greenwich sidereal time:
+    composed = multiply_matrices(
+        get_greenwich_to_horizontal_matrix(observer),
+        get_greenwich_sidereal_matrix(date),
+    )
+
+    for row, expected in zip(
+        composed, get_equatorial_to_horizontal_matrix(date, observer)
+    ):
+        for a, b in zip(row, expected):
+            assert isclose(a, b, abs_tol=1e-15)
+
+    # The Greenwich meridian on the equator should be due south of, and at a zenith
+    # distance of the latitude from, an observer on the Greenwich meridian:
+    az, alt = convert_vector_to_horizontal(
+        apply_matrix(
+            get_greenwich_to_horizontal_matrix({"latitude": 51.5, "longitude": 0}),
+            (1.0, 0.0, 0.0),
+        )
+    )
+    assert isclose(az, 180, abs_tol=1e-9)
+    assert isclose(alt, 90 - 51.5, abs_tol=1e-9)
+
+
+# **************************************************************************************
+
+
+def test_get_frame_matrix():
+    assert get_frame_matrix(Frame.EQUATORIAL, Frame.GALACTIC) == GALACTIC_MATRIX
+
+    assert get_frame_matrix(Frame.GALACTIC, Frame.ECLIPTIC, date) is get_frame_matrix(
+        "galactic", "ecliptic", date
+    )
+
+    # Chained transforms should compose into a single matrix:
+    v = convert_spherical_to_unit_vector(betelgeuse["ra"], betelgeuse["dec"])
+
+    chained = apply_matrix(
+        get_frame_matrix(Frame.GALACTIC, Frame.HORIZONTAL, date, observer),
+        apply_matrix(get_frame_matrix(Frame.EQUATORIAL, Frame.GALACTIC), v),
+    )
+
+    direct = apply_matrix(get_equatorial_to_horizontal_matrix(date, observer), v)
+
+    for a, b in zip(chained, direct):
+        assert isclose(a, b, abs_tol=1e-14)
+
+    with pytest.raises(ValueError):
+        get_frame_matrix(Frame.EQUATORIAL, Frame.ECLIPTIC)
+
+    with pytest.raises(ValueError):
+        get_frame_matrix(Frame.EQUATORIAL, Frame.HORIZONTAL, date)
+
+
+# **************************************************************************************
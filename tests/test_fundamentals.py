@@ -0,0 +1,55 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timezone
+
+from src.celerity.astrometry import get_obliquity_of_the_ecliptic
+from src.celerity.fundamentals import FundamentalArguments, get_fundamental_arguments
+from src.celerity.moon import (
+    get_mean_anomaly as get_lunar_mean_anomaly,
+    get_mean_ecliptic_longitude_of_the_ascending_node,
+    get_mean_geometric_longitude as get_lunar_mean_geometric_longitude,
+)
+from src.celerity.nutation import get_nutation_in_longitude, get_nutation_in_obliquity
+from src.celerity.sun import (
+    get_mean_anomaly as get_solar_mean_anomaly,
+    get_mean_geometric_longitude as get_solar_mean_geometric_longitude,
+)
+
+# **************************************************************************************
+
+# For testing we need to specify a date because most calculations are
+# differential w.r.t a time component. We set it to the author's birthday:
+date = datetime(2021, 5, 14, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+# **************************************************************************************
+
+
+def test_fundamental_arguments():
+    arguments = FundamentalArguments(date)
+    assert arguments.JD == 2459348.5
+    assert arguments.d == 2459348.5 - 2451545.0
+    assert arguments.T == (2459348.5 - 2451545.0) / 36525
+    assert arguments.M == get_solar_mean_anomaly(date)
+    assert arguments.L == get_solar_mean_geometric_longitude(date)
+    assert arguments.Mm == get_lunar_mean_anomaly(date)
+    assert arguments.Lm == get_lunar_mean_geometric_longitude(date)
+    assert arguments.Ω == get_mean_ecliptic_longitude_of_the_ascending_node(date)
+    assert arguments.ε == get_obliquity_of_the_ecliptic(date)
+    assert arguments.Δψ / 3600.0 == get_nutation_in_longitude(date)
+    assert arguments.Δε / 3600.0 == get_nutation_in_obliquity(date)
+
+
+# **************************************************************************************
+
+
+def test_get_fundamental_arguments():
+    assert get_fundamental_arguments(date) is get_fundamental_arguments(date)
+
+
+# **************************************************************************************
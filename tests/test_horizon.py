@@ -0,0 +1,99 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+import pytest
+
+from src.celerity.horizon import HorizonMask
+
+# **************************************************************************************
+
+# A horizon with a mountain to the east, between azimuths of 70 and 100 degrees:
+mask = HorizonMask([0, 70, 80, 90, 100, 359], [2, 2, 15, 15, 2, 2])
+
+# **************************************************************************************
+
+
+def test_horizon_mask():
+    assert len(mask) == 6
+    assert mask.minimum == 2
+    assert mask.maximum == 15
+
+    with pytest.raises(ValueError):
+        HorizonMask([0, 90], [0])
+
+    with pytest.raises(ValueError):
+        HorizonMask([], [])
+
+    with pytest.raises(ValueError):
+        HorizonMask([0], [0], buckets=0)
+
+
+# **************************************************************************************
+
+
+def test_horizon_mask_get_altitude():
+    # The altitude should be exact at each sample:
+    for az, alt in zip(mask.azimuths, mask.altitudes):
+        assert mask.get_altitude(az) == alt
+
+    # The altitude should be linearly interpolated between samples:
+    assert mask.get_altitude(75) == 8.5
+    assert mask.get_altitude(95) == 8.5
+    assert mask.get_altitude(180) == 2
+
+    # The azimuth should wrap around through north:
+    assert mask.get_altitude(-270) == mask.get_altitude(90)
+    assert mask.get_altitude(435) == mask.get_altitude(75)
+    assert mask.get_altitude(-1e-20) == mask.get_altitude(0)
+
+
+# **************************************************************************************
+
+
+def test_horizon_mask_wraps_through_north():
+    # A mask whose samples do not include north should interpolate across it:
+    m = HorizonMask([350, 10, 180], [10, 20, 0])
+
+    assert list(m.azimuths) == [10, 180, 350]
+    assert m.get_altitude(0) == pytest.approx(15)
+    assert m.get_altitude(355) == pytest.approx(12.5)
+    assert m.get_altitude(5) == pytest.approx(17.5)
+
+
+# **************************************************************************************
+
+
+def test_horizon_mask_buckets():
+    azimuths = [i * 0.1 for i in range(3600)]
+
+    altitudes = [(i * 7) % 13 for i in range(3600)]
+
+    # The lookup should not depend upon the number of buckets:
+    coarse = HorizonMask(azimuths, altitudes, buckets=1)
+
+    fine = HorizonMask(azimuths, altitudes)
+
+    for i in range(0, 36000, 7):
+        az = i * 0.01
+        assert coarse.get_altitude(az) == fine.get_altitude(az)
+
+
+# **************************************************************************************
+
+
+def test_horizon_mask_from_coordinates():
+    m = HorizonMask.from_coordinates([{"alt": 5, "az": 0}, {"alt": 25, "az": 180}])
+
+    assert m.get_altitude(90) == 15
+    assert m.get_altitude(270) == 15
+
+    assert m.is_above({"alt": 16, "az": 90})
+    assert not m.is_above({"alt": 14, "az": 90})
+
+
+# **************************************************************************************
@@ -0,0 +1,82 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from math import isclose, radians
+
+from src.celerity.matrix import (
+    IDENTITY_MATRIX,
+    apply_matrix,
+    convert_spherical_to_unit_vector,
+    convert_vector_to_spherical,
+    get_rotation_matrix_x,
+    get_rotation_matrix_y,
+    get_rotation_matrix_z,
+    multiply_matrices,
+    transpose_matrix,
+)
+
+# **************************************************************************************
+
+
+def test_rotation_matrices():
+    # Rotating the axes by +90° about z moves the x-axis onto the -y direction:
+    x, y, z = apply_matrix(get_rotation_matrix_z(radians(90)), (1.0, 0.0, 0.0))
+    assert isclose(x, 0.0, abs_tol=1e-15)
+    assert isclose(y, -1.0)
+    assert z == 0.0
+
+    x, y, z = apply_matrix(get_rotation_matrix_x(radians(90)), (0.0, 1.0, 0.0))
+    assert isclose(y, 0.0, abs_tol=1e-15)
+    assert isclose(z, -1.0)
+
+    x, y, z = apply_matrix(get_rotation_matrix_y(radians(90)), (0.0, 0.0, 1.0))
+    assert isclose(x, -1.0)
+    assert isclose(z, 0.0, abs_tol=1e-15)
+
+
+# **************************************************************************************
+
+
+def test_multiply_matrices():
+    R = get_rotation_matrix_z(0.3)
+    assert multiply_matrices() == IDENTITY_MATRIX
+    assert multiply_matrices(R) == R
+
+    # The transpose of a rotation matrix is its inverse:
+    for row, expected in zip(
+        multiply_matrices(R, transpose_matrix(R)), IDENTITY_MATRIX
+    ):
+        for a, b in zip(row, expected):
+            assert isclose(a, b, abs_tol=1e-15)
+
+    # Successive rotations about the same axis compose additively:
+    for row, expected in zip(
+        multiply_matrices(get_rotation_matrix_z(0.1), get_rotation_matrix_z(0.2)), R
+    ):
+        for a, b in zip(row, expected):
+            assert isclose(a, b, abs_tol=1e-15)
+
+
+# **************************************************************************************
+
+
+def test_convert_spherical_to_unit_vector():
+    v = convert_spherical_to_unit_vector(88.7929583, 7.4070639)
+    assert isclose(sum(c * c for c in v), 1.0)
+
+    ra, dec = convert_vector_to_spherical(v)
+    assert isclose(ra, 88.7929583)
+    assert isclose(dec, 7.4070639)
+
+    # The vector need not be normalised, and the longitude should be in [0, 360):
+    ra, dec = convert_vector_to_spherical((1.0, -1.0, 0.0))
+    assert isclose(ra, 315.0)
+    assert dec == 0.0
+
+
+# **************************************************************************************
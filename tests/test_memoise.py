@@ -0,0 +1,238 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from datetime import datetime, timedelta, timezone
+from importlib import import_module
+
+import pytest
+
+from src.celerity import (
+    apparent,
+    astrometry,
+    coordinates,
+    earth,
+    fundamentals,
+    nutation,
+    sun,
+)
+from src.celerity.earth import get_eccentricity_of_orbit
+from src.celerity.memoise import (
+    EPOCH_DEPENDENT_CACHES,
+    EPOCH_MEMOISABLE_FUNCTIONS,
+    EpochMemoisedFunction,
+    disable_epoch_memoisation,
+    enable_epoch_memoisation,
+    get_epoch_memoisation_error,
+    get_epoch_memoisation_info,
+    get_quantised_epoch,
+    memoise_by_epoch,
+)
+
+# **************************************************************************************
+
+date = datetime(2021, 5, 14, 0, 0, 0, 400000, tzinfo=timezone.utc)
+
+# **************************************************************************************
+
+
+def test_get_quantised_epoch():
+    assert get_quantised_epoch(date, 1) == datetime(2021, 5, 14, tzinfo=timezone.utc)
+    assert get_quantised_epoch(date + timedelta(seconds=29), 60) == datetime(
+        2021, 5, 14, tzinfo=timezone.utc
+    )
+    assert get_quantised_epoch(date + timedelta(seconds=31), 60) == datetime(
+        2021, 5, 14, 0, 1, tzinfo=timezone.utc
+    )
+
+    with pytest.raises(ValueError):
+        get_quantised_epoch(date, 0)
+
+
+# **************************************************************************************
+
+
+def test_memoise_by_epoch():
+    calls = []
+
+    @memoise_by_epoch(quantum=60, maxsize=2)
+    def f(date: datetime) -> datetime:
+        calls.append(date)
+        return date
+
+    assert isinstance(f, EpochMemoisedFunction)
+    assert f.__name__ == "f"
+
+    # Every epoch within the same bucket is served from the cache:
+    assert f(date) == datetime(2021, 5, 14, tzinfo=timezone.utc)
+    assert f(date + timedelta(seconds=20)) == datetime(2021, 5, 14, tzinfo=timezone.utc)
+    assert len(calls) == 1
+
+    f(date + timedelta(minutes=1))
+    f(date + timedelta(minutes=2))
+
+    info = f.cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+    assert info.maxsize == 2
+    assert info.currsize == 2
+    assert info.quantum == 60
+
+    # The least recently used epoch should have been evicted:
+    f(date)
+    assert len(calls) == 4
+
+    f.cache_clear()
+    assert f.cache_info().currsize == 0
+    assert f.cache_info().hits == 0
+
+    with pytest.raises(ValueError):
+        EpochMemoisedFunction(f, quantum=-1)
+
+    with pytest.raises(ValueError):
+        EpochMemoisedFunction(f, maxsize=0)
+
+
+# **************************************************************************************
+
+
+def test_get_epoch_memoisation_error():
+    # The nutation in longitude should be good to ~1 μas at a quantum of 1 second:
+    assert get_epoch_memoisation_error("get_nutation_in_longitude", 1) * 3600 < 1e-6
+    assert get_epoch_memoisation_error(
+        "get_obliquity_of_the_ecliptic", 60
+    ) == 30 * get_epoch_memoisation_error("get_obliquity_of_the_ecliptic", 2)
+
+    with pytest.raises(ValueError):
+        get_epoch_memoisation_error("get_julian_date", 1)
+
+
+# **************************************************************************************
+
+
+def test_epoch_memoisation_error_budget():
+    quantum = 60
+
+    for name, (module, _) in EPOCH_MEMOISABLE_FUNCTIONS.items():
+        if name in ("get_fundamental_arguments", "get_apparent_place_transform"):
+            continue
+
+        f = getattr(import_module(f"src.celerity.{module}"), name)
+
+        error = get_epoch_memoisation_error(name, quantum)
+
+        for days in range(0, 3650, 73):
+            when = date + timedelta(days=days, seconds=quantum / 2)
+            assert abs(f(when) - f(get_quantised_epoch(when, quantum))) <= error
+
+
+# **************************************************************************************
+
+
+def test_enable_epoch_memoisation():
+    # Every reference to the function, however it was imported, is the same wrapper:
+    assert isinstance(astrometry.get_obliquity_of_the_ecliptic, EpochMemoisedFunction)
+    assert coordinates.get_obliquity_of_the_ecliptic is (
+        astrometry.get_obliquity_of_the_ecliptic
+    )
+    assert fundamentals.get_obliquity_of_the_ecliptic is (
+        astrometry.get_obliquity_of_the_ecliptic
+    )
+    assert get_eccentricity_of_orbit is earth.get_eccentricity_of_orbit
+
+    original = astrometry.get_obliquity_of_the_ecliptic.__wrapped__
+
+    # Whilst disabled, every call should be evaluated at its exact epoch:
+    assert astrometry.get_obliquity_of_the_ecliptic(date) == original(date)
+
+    try:
+        enable_epoch_memoisation(
+            "get_obliquity_of_the_ecliptic", "get_eccentricity_of_orbit", quantum=60
+        )
+
+        # Nothing should be rebound in the defining module, nor wherever the function
+        # has been imported by name:
+        assert coordinates.get_obliquity_of_the_ecliptic is (
+            astrometry.get_obliquity_of_the_ecliptic
+        )
+        assert get_eccentricity_of_orbit is earth.get_eccentricity_of_orbit
+        assert get_eccentricity_of_orbit.enabled
+        assert not nutation.get_nutation_in_longitude.enabled
+
+        for seconds in range(0, 30):
+            ε = coordinates.get_obliquity_of_the_ecliptic(
+                date + timedelta(seconds=seconds)
+            )
+            assert abs(ε - original(date)) < get_epoch_memoisation_error(
+                "get_obliquity_of_the_ecliptic", 60
+            )
+
+        get_eccentricity_of_orbit(date)
+        get_eccentricity_of_orbit(date + timedelta(seconds=20))
+
+        info = get_epoch_memoisation_info()
+        assert set(info) == {
+            "get_obliquity_of_the_ecliptic",
+            "get_eccentricity_of_orbit",
+        }
+        assert info["get_obliquity_of_the_ecliptic"].misses == 1
+        assert info["get_obliquity_of_the_ecliptic"].hits == 29
+        assert info["get_obliquity_of_the_ecliptic"].quantum == 60
+        assert info["get_eccentricity_of_orbit"].misses == 1
+        assert info["get_eccentricity_of_orbit"].hits == 1
+
+        with pytest.raises(ValueError):
+            enable_epoch_memoisation("get_julian_date")
+    finally:
+        disable_epoch_memoisation()
+
+    assert not astrometry.get_obliquity_of_the_ecliptic.enabled
+    assert not get_eccentricity_of_orbit.enabled
+    assert coordinates.get_obliquity_of_the_ecliptic(
+        date + timedelta(seconds=20)
+    ) == original(date + timedelta(seconds=20))
+    assert get_epoch_memoisation_info() == {}
+
+
+# **************************************************************************************
+
+
+def test_epoch_dependent_caches():
+    for module, name in EPOCH_DEPENDENT_CACHES:
+        assert hasattr(
+            getattr(import_module(f"src.celerity.{module}"), name), "cache_clear"
+        )
+
+
+# **************************************************************************************
+
+
+def test_epoch_memoisation_clears_dependent_caches():
+    when = datetime(2021, 3, 14, 17, 0, 0, tzinfo=timezone.utc)
+
+    target = {"ra": 88.7929583, "dec": 7.4070639}
+
+    # Populate the exact-epoch caches before opting in:
+    ra = sun.get_solar_state(when).ra
+
+    place = apparent.get_apparent_place(when, target)
+
+    try:
+        enable_epoch_memoisation(quantum=86400)
+
+        # The exact results cached before opting in should not be served:
+        assert sun.get_solar_state(when).ra != ra
+        assert apparent.get_apparent_place(when, target) != place
+    finally:
+        disable_epoch_memoisation()
+
+    # The quantised results cached whilst opted in should not outlive the opt-out:
+    assert sun.get_solar_state(when).ra == ra
+    assert apparent.get_apparent_place(when, target) == place
+
+
+# **************************************************************************************
@@ -1,7 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
 from src.celerity.moon import (
+    Apsis,
+    LunarState,
     Phase,
     get_age,
     get_angular_diameter,
@@ -13,7 +15,11 @@ from src.celerity.moon import (
     get_elongation,
     get_equatorial_coordinate,
     get_evection_correction,
+    get_horizontal_parallax,
     get_illumination,
+    get_lunar_events,
+    get_lunar_state,
+    get_lunar_transits,
     get_mean_anomaly,
     get_mean_anomaly_correction,
     get_mean_ecliptic_longitude,
@@ -24,6 +30,7 @@ from src.celerity.moon import (
     get_true_anomaly,
     get_true_ecliptic_longitude,
 )
+from src.celerity.temporal import get_local_sidereal_time
 
 # For testing we need to specify a date because most calculations are
 # differential w.r.t a time component. We set it to the author's birthday:
@@ -160,3 +167,123 @@ def test_get_phase():
     date = datetime(2015, 2, 12, 17, 0, 0, 0, tzinfo=timezone.utc)
     phase = get_phase(date)
     assert phase == Phase.LastQuarter
+
+
+def test_lunar_state():
+    state = LunarState(date)
+    assert state.M == 207.63633585681964
+    assert state.Ca == 206.64428333417192
+    assert state.ν == 357.3514315617634
+    assert state.λt == 77.01224128076132
+    assert state.λ == 76.99043727540315
+    assert state.β == 0.4874504338736112
+    assert get_lunar_state(date) is get_lunar_state(date)
+
+    state = LunarState(datetime(2015, 1, 2, 3, 0, 0, 0, tzinfo=timezone.utc))
+    assert state.equatorial_coordinate == {
+        "ra": 63.854089783072595,
+        "dec": 17.246094608898062,
+    }
+    assert state.elongation == 143.73394864456367
+    assert state.angular_diameter == 0.5480234986129843
+
+    state = LunarState(datetime(2015, 1, 1, 0, 0, 0, 0, tzinfo=timezone.utc))
+    assert state.age == {"A": 130.40251122256336, "a": 10.696845549747305}
+    assert state.phase_angle == 49.66441438659977
+    assert state.illumination == 82.36316687224799
+
+
+def test_get_lunar_events():
+    start = datetime(2021, 5, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    end = datetime(2021, 7, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    events = list(get_lunar_events(start, end))
+
+    assert [event["event"] for event in events] == [
+        Phase.LastQuarter,
+        Phase.New,
+        Phase.FirstQuarter,
+        Phase.Full,
+        Phase.LastQuarter,
+        Phase.New,
+        Phase.FirstQuarter,
+        Phase.Full,
+    ]
+
+    # The full moon of 26th May 2021 (a total lunar eclipse) was at 11:14 UTC:
+    full = events[3]["date"]
+    assert abs(
+        full - datetime(2021, 5, 26, 11, 14, 0, 0, tzinfo=timezone.utc)
+    ) < timedelta(minutes=30)
+
+    # At full moon, the Moon should be fully illuminated:
+    assert get_illumination(full) > 99.9
+
+    # Successive events should be separated by approximately a quarter of a month:
+    for a, b in zip(events, events[1:]):
+        assert timedelta(days=6) < b["date"] - a["date"] < timedelta(days=9)
+
+
+def test_get_lunar_events_with_apsides():
+    start = datetime(2021, 5, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    end = datetime(2021, 7, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    events = list(get_lunar_events(start, end, apsides=True))
+
+    apsides = [event["event"] for event in events if isinstance(event["event"], Apsis)]
+
+    assert apsides == [Apsis.Apogee, Apsis.Perigee, Apsis.Apogee, Apsis.Perigee]
+
+    # The events should be yielded in time order:
+    assert [event["date"] for event in events] == sorted(
+        event["date"] for event in events
+    )
+
+
+def test_get_horizontal_parallax():
+    π = get_horizontal_parallax(date)
+    # The Moon's horizontal parallax is always between ~0.9 and ~1.02 degrees:
+    assert 0.9 < π < 1.02
+
+
+def test_get_lunar_transits():
+    greenwich: GeographicCoordinate = {"latitude": 51.4769, "longitude": -0.0005}
+
+    start = datetime(2021, 5, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    end = datetime(2021, 5, 8, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    transits = list(get_lunar_transits(start, end, greenwich))
+
+    # The Moon transits once per lunar day (~24h 50m), so seven times in a week:
+    assert len(transits) == 7
+
+    for transit in transits:
+        assert start <= transit["transit"] <= end
+        assert transit["rise"] < transit["transit"] < transit["set"]
+
+        # The Moon's hour angle should be zero at transit:
+        eq = get_equatorial_coordinate(transit["transit"])
+        LST = get_local_sidereal_time(transit["transit"], greenwich["longitude"])
+        ha = (LST * 15 - eq["ra"] + 180) % 360 - 180
+        assert abs(ha) < 0.01
+
+    for a, b in zip(transits, transits[1:]):
+        Δ = b["transit"] - a["transit"]
+        assert timedelta(hours=24, minutes=30) < Δ < timedelta(hours=25, minutes=30)
+
+
+def test_get_lunar_transits_circumpolar():
+    # In the high Arctic, the Moon can remain above (or below) the horizon all day:
+    svalbard: GeographicCoordinate = {"latitude": 78.2232, "longitude": 15.6267}
+
+    start = datetime(2021, 5, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    end = datetime(2021, 5, 29, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    transits = list(get_lunar_transits(start, end, svalbard))
+
+    assert any(transit["rise"] is None for transit in transits)
+    assert any(transit["set"] is None for transit in transits)
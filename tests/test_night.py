@@ -1,11 +1,18 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from json import loads
 
 from src.celerity.common import GeographicCoordinate
 from src.celerity.night import (
     NightPhase,
+    clear_almanac_cache,
+    get_almanac,
+    get_almanacs,
     get_night,
     get_night_phase,
+    get_night_phases,
     get_solar_altitude,
+    get_solar_events,
+    get_solar_noon,
     get_solar_transit,
     is_night,
 )
@@ -125,3 +132,149 @@ def test_get_night_phase():
     # If the Sun's altitude is greater than 0 degrees, then it is day:
     altitude = 1
     n = get_night_phase(altitude)
+
+
+def test_get_solar_noon():
+    noon = get_solar_noon(date, observer)
+    # Solar noon should be at 12:20 UTC, to within one second:
+    assert abs(
+        noon - datetime(2021, 5, 14, 12, 20, 8, 0, tzinfo=timezone.utc)
+    ) < timedelta(seconds=1)
+
+    # The Sun should be higher at noon than one minute either side:
+    alt = get_solar_altitude(noon, observer)
+    assert alt > get_solar_altitude(noon - timedelta(minutes=1), observer)
+    assert alt > get_solar_altitude(noon + timedelta(minutes=1), observer)
+
+
+def test_get_solar_events():
+    d = get_solar_events(date, observer)
+
+    # Sunrise and sunset should agree with the minute resolution solar transit:
+    assert d["rise"] == datetime(2021, 5, 14, 4, 45, 56, 7283, tzinfo=timezone.utc)
+    assert d["set"] == datetime(2021, 5, 14, 19, 55, 13, 517065, tzinfo=timezone.utc)
+
+    # The Sun should cross the horizon within one second of the solved times:
+    for event, sign in ((d["rise"], 1), (d["set"], -1)):
+        assert get_solar_altitude(event - timedelta(seconds=1) * sign, observer) < 0
+        assert get_solar_altitude(event + timedelta(seconds=1) * sign, observer) > 0
+
+    # The twilight boundaries should be the Sun at -6, -12 and -18 degrees:
+    for twilight, altitude in (
+        (d["civil"], -6),
+        (d["nautical"], -12),
+        (d["astronomical"], -18),
+    ):
+        assert abs(get_solar_altitude(twilight["dawn"], observer) - altitude) < 0.01
+        assert abs(get_solar_altitude(twilight["dusk"], observer) - altitude) < 0.01
+
+    assert d["astronomical"]["dawn"] < d["nautical"]["dawn"] < d["civil"]["dawn"]
+    assert d["civil"]["dusk"] < d["nautical"]["dusk"] < d["astronomical"]["dusk"]
+
+
+def test_get_solar_events_polar_day():
+    # In the Arctic summer, the Sun neither rises nor sets:
+    d = get_solar_events(date, {"latitude": 78.0, "longitude": 15.0})
+    assert d["rise"] is None
+    assert d["set"] is None
+    assert d["astronomical"]["dawn"] is None
+    assert d["astronomical"]["dusk"] is None
+
+
+def test_get_almanac(tmp_path):
+    clear_almanac_cache()
+
+    almanac = get_almanac(2021, observer, directory=tmp_path)
+
+    assert len(almanac) == 365
+
+    # The 14th May is the 133rd (zero-based) day of 2021:
+    rise = almanac.get_event("rise", 133)
+    assert abs(rise - get_solar_events(date, observer)["rise"]) < timedelta(seconds=1)
+
+    night = almanac.get_night(133)
+    assert night is not None
+    assert night["start"] == almanac.get_event("set", 133)
+    assert night["end"] == almanac.get_event("rise", 134)
+
+    # Subsequent requests for a (nearby) observer should be served from the cache:
+    assert (
+        get_almanac(2021, {"latitude": latitude + 1e-6, "longitude": longitude})
+        is almanac
+    )
+
+    # The solar events do not depend upon elevation, so neither does the almanac:
+    assert get_almanac(2021, {**observer, "elevation": 4205.0}) is almanac
+
+    # The almanac should have been persisted to disk, and be read back identically:
+    clear_almanac_cache()
+    assert len(list(tmp_path.iterdir())) == 1
+    persisted = get_almanac(2021, observer, directory=tmp_path)
+    assert persisted is not almanac
+    for name, column in almanac.columns.items():
+        # N.B. Compare the raw bytes, as events that do not occur are stored as NaN:
+        assert persisted.get_column(name).tobytes() == column.tobytes()
+
+    # A corrupted almanac on disk should be treated as a cache miss, and rewritten:
+    (path,) = tmp_path.iterdir()
+    path.write_text(path.read_text(encoding="utf-8")[:100], encoding="utf-8")
+    clear_almanac_cache()
+    regenerated = get_almanac(2021, observer, directory=tmp_path)
+    assert regenerated.get_column("rise").tobytes() == almanac.columns["rise"].tobytes()
+    assert list(tmp_path.iterdir()) == [path]
+    assert len(loads(path.read_text(encoding="utf-8"))["columns"]["rise"]) == 365
+
+
+def test_get_almanacs():
+    clear_almanac_cache()
+
+    observers: list[GeographicCoordinate] = [
+        observer,
+        {"latitude": 78.0, "longitude": 15.0},
+        observer,
+    ]
+
+    almanacs = get_almanacs(2021, observers, workers=2)
+
+    assert len(almanacs) == 3
+    assert almanacs[0] is almanacs[2]
+    assert almanacs[1].latitude == 78.0
+
+    # The Sun does not set in the Arctic summer, so there is no night:
+    assert almanacs[1].get_event("set", 172) is None
+    assert almanacs[1].get_night(172) is None
+
+
+def test_is_night_cached():
+    for hour in range(24):
+        when = datetime(2021, 5, 14, hour, 30, 0, 0, tzinfo=timezone.utc)
+        assert is_night(when, observer, cache=True) == is_night(when, observer)
+
+    # Mauna Kea, Hawaii, US, where the local night spans the UTC day boundary:
+    hawaii: GeographicCoordinate = {"latitude": 19.820611, "longitude": -155.468094}
+
+    for hour in range(24):
+        when = datetime(2021, 5, 14, hour, 30, 0, 0, tzinfo=timezone.utc)
+        assert is_night(when, hawaii, cache=True) == is_night(when, hawaii)
+
+    # In the Antarctic winter, the Sun does not rise so it is always night:
+    when = datetime(2021, 6, 21, 12, 0, 0, 0, tzinfo=timezone.utc)
+    assert is_night(when, {"latitude": -78.0, "longitude": 0.0}, cache=True) is True
+
+
+def test_get_night_phases():
+    timestamps = [
+        datetime(2021, 5, 14, hour, 0, 0, 0, tzinfo=timezone.utc).timestamp()
+        for hour in (0, 3, 4, 12, 21, 22)
+    ]
+
+    phases = get_night_phases(timestamps, observer)
+
+    assert phases == [
+        NightPhase.NIGHT,
+        NightPhase.ASTRONOMICAL_TWILIGHT,
+        NightPhase.NAUTICAL_TWILIGHT,
+        NightPhase.DAY,
+        NightPhase.NAUTICAL_TWILIGHT,
+        NightPhase.ASTRONOMICAL_TWILIGHT,
+    ]
@@ -7,12 +7,16 @@
 # **************************************************************************************
 
 from datetime import datetime, timezone
+from math import radians
 
 from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
 from src.celerity.nutation import (
+    get_correction_for_nutation,
     get_correction_to_equatorial_for_nutation,
+    get_iau2000b_nutation,
     get_nutation_in_longitude,
     get_nutation_in_obliquity,
+    get_nutation_terms,
 )
 
 # **************************************************************************************
@@ -60,4 +64,28 @@ def test_get_correction_to_equatorial_for_nutation():
     assert ra == 88.52194751991885
     assert dec == 7.448166948222143
 
+# **************************************************************************************
+
+def test_get_correction_for_nutation():
+    terms = get_nutation_terms(date)
+    Δra, Δdec = get_correction_for_nutation(betelgeuse["ra"], betelgeuse["dec"], terms)
+    # The terms may be shared by many targets, with results identical to the scalar:
+    assert betelgeuse["ra"] + Δra == 88.52194751991885
+    assert betelgeuse["dec"] + Δdec == 7.448166948222143
+
+# **************************************************************************************
+
+def test_get_iau2000b_nutation():
+    # The reference values are from the IAU SOFA test suite (t_nut00b) for 2006
+    # January 1 at 0h TT:
+    T = (2400000.5 + 53736.0 - 2451545.0) / 36525
+    Δψ, Δε = get_iau2000b_nutation(T)
+    assert abs(radians(Δψ) - -0.9632552291148362783e-5) < 1e-13
+    assert abs(radians(Δε) - 0.4063197106621159367e-4) < 1e-13
+
+    # The low-precision nutation should agree to within ~1″:
+    Δψ, Δε = get_iau2000b_nutation((2459348.5 - 2451545.0) / 36525)
+    assert abs(Δψ - get_nutation_in_longitude(date)) < 1 / 3600
+    assert abs(Δε - get_nutation_in_obliquity(date)) < 1 / 3600
+
 # **************************************************************************************
\ No newline at end of file
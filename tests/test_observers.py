@@ -0,0 +1,105 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from datetime import datetime, timezone
+from math import cos, isclose, radians, sin
+from typing import List
+
+import pytest
+
+from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
+from src.celerity.coordinates import convert_equatorial_to_horizontal
+from src.celerity.observers import (
+    ObserverArray,
+    convert_equatorial_to_horizontal_for_observers,
+)
+
+# **************************************************************************************
+
+date = datetime(2021, 5, 14, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+# **************************************************************************************
+
+observers: List[GeographicCoordinate] = [
+    {"latitude": 19.820611, "longitude": -155.468094},
+    {"latitude": -30.240741, "longitude": -70.736593},
+    {"latitude": 28.760722, "longitude": -17.879185},
+    {"latitude": 51.477928, "longitude": -0.001545},
+    {"latitude": -31.273333, "longitude": 149.064444},
+    {"latitude": 90.0, "longitude": 0.0},
+]
+
+# **************************************************************************************
+
+betelgeuse: EquatorialCoordinate = {"ra": 88.7929583, "dec": 7.4070639}
+
+# **************************************************************************************
+
+
+def test_observer_array():
+    sites = ObserverArray.from_coordinates(observers)
+
+    assert len(sites) == 6
+    assert sites[1] == observers[1]
+    assert sites.sinφ[1] == sin(radians(observers[1]["latitude"]))
+    assert sites.cosφ[1] == cos(radians(observers[1]["latitude"]))
+
+    with pytest.raises(ValueError):
+        ObserverArray([0.0, 1.0], [0.0])
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_to_horizontal_for_observers():
+    sites = ObserverArray.from_coordinates(observers)
+
+    alt, az = convert_equatorial_to_horizontal_for_observers(date, sites, betelgeuse)
+
+    assert isclose(alt[0], 72.78539444063765, abs_tol=1e-9)
+    assert isclose(az[0], 134.44877920325158, abs_tol=1e-9)
+
+    # The results should agree with the scalar conversion for each observer to within
+    # rounding:
+    for n, observer in enumerate(observers):
+        horizontal = convert_equatorial_to_horizontal(date, observer, betelgeuse)
+        assert isclose(alt[n], horizontal["alt"], abs_tol=1e-9)
+
+        # The azimuth is undefined for an observer at the pole:
+        if abs(observer["latitude"]) < 90:
+            assert isclose(az[n], horizontal["az"], abs_tol=1e-9)
+
+    # An observer at the north pole should see the target at an altitude of its
+    # declination:
+    assert isclose(alt[5], betelgeuse["dec"], abs_tol=1e-9)
+
+
+# **************************************************************************************
+
+
+def test_convert_equatorial_to_horizontal_for_observers_with_buffers():
+    sites = ObserverArray.from_coordinates(observers)
+
+    alt, az = array("d", [0.0] * 6), array("d", [0.0] * 6)
+
+    result = convert_equatorial_to_horizontal_for_observers(
+        date, sites, betelgeuse, alt=alt, az=az
+    )
+
+    # The results should be written into the caller's buffers:
+    assert result[0] is alt
+    assert result[1] is az
+
+    with pytest.raises(ValueError):
+        convert_equatorial_to_horizontal_for_observers(
+            date, sites, betelgeuse, alt=array("d", [0.0])
+        )
+
+
+# **************************************************************************************
@@ -1,8 +1,16 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from math import radians
+
+import pytest
 
 from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
 from src.celerity.precession import (
+    get_correction_for_precession_of_equinoxes,
     get_correction_to_equatorial_for_precession_of_equinoxes,
+    get_iau2006_fukushima_williams_angles,
+    get_iau2006_mean_obliquity,
+    get_precession_nutation_matrix,
+    get_precession_terms,
 )
 
 # For testing we need to specify a date because most calculations are
@@ -26,3 +34,52 @@ def test_get_correction_to_equatorial_for_precession_of_equinoxes():
     dec = t["dec"] + betelgeuse["dec"]
     assert ra == 88.8059159898502
     assert dec == 7.40708895935797
+
+
+def test_get_correction_for_precession_of_equinoxes():
+    terms = get_precession_terms(date)
+    Δra, Δdec = get_correction_for_precession_of_equinoxes(
+        betelgeuse["ra"], betelgeuse["dec"], terms
+    )
+    # The terms may be shared by many targets, with results identical to the scalar:
+    assert betelgeuse["ra"] + Δra == 88.8059159898502
+    assert betelgeuse["dec"] + Δdec == 7.40708895935797
+
+
+def test_get_iau2006_fukushima_williams_angles():
+    # The reference values are from the IAU SOFA test suite (t_pfw06):
+    T = (2400000.5 + 50123.9999 - 2451545.0) / 36525
+    γ, φ, ψ, ε = get_iau2006_fukushima_williams_angles(T)
+    assert radians(γ) == pytest.approx(-0.2243387670997995690e-5, abs=1e-16)
+    assert radians(φ) == pytest.approx(0.4091014602391312808, abs=1e-12)
+    assert radians(ψ) == pytest.approx(-0.9501954178013031895e-3, abs=1e-14)
+    assert radians(ε) == pytest.approx(0.4091014316587367491, abs=1e-12)
+    assert ε == get_iau2006_mean_obliquity(T)
+
+
+def test_get_precession_nutation_matrix():
+    date = datetime(2021, 5, 14, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    matrix = get_precession_nutation_matrix(date)
+
+    # The matrix should be orthonormal:
+    for i, row in enumerate(matrix):
+        for j, other in enumerate(matrix):
+            dot = sum(a * b for a, b in zip(row, other))
+            assert dot == pytest.approx(1.0 if i == j else 0.0, abs=1e-12)
+
+    # Requests within the same quantum should share the cached matrix:
+    assert get_precession_nutation_matrix(date + timedelta(seconds=0.2)) is matrix
+    assert get_precession_nutation_matrix(date + timedelta(seconds=1)) is not matrix
+    assert get_precession_nutation_matrix(
+        date + timedelta(seconds=20), quantum=60
+    ) is get_precession_nutation_matrix(date, quantum=60)
+
+    # Without nutation, the matrix differs by no more than ~20″:
+    mean = get_precession_nutation_matrix(date, nutation=False)
+    for row, other in zip(matrix, mean):
+        for a, b in zip(row, other):
+            assert abs(a - b) < radians(20 / 3600)
+
+    with pytest.raises(ValueError):
+        get_precession_nutation_matrix(date, quantum=0)
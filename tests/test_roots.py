@@ -0,0 +1,53 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+import math
+import unittest
+
+from celerity.roots import find_root
+
+# **************************************************************************************
+
+
+class TestFindRoot(unittest.TestCase):
+    def test_linear(self):
+        root = find_root(lambda x: 2 * x - 1, 0.0, 1.0)
+        self.assertAlmostEqual(root, 0.5, places=9)
+
+    def test_cosine(self):
+        root = find_root(math.cos, 0.0, 3.0, tolerance=1e-12)
+        self.assertAlmostEqual(root, math.pi / 2, places=9)
+
+    def test_cubic(self):
+        root = find_root(lambda x: x**3 - 2 * x - 5, 2.0, 3.0, tolerance=1e-12)
+        self.assertAlmostEqual(root, 2.0945514815423265, places=9)
+
+    def test_discontinuous(self):
+        # A step discontinuity at x = 0.25 should still be located:
+        root = find_root(lambda x: -1.0 if x < 0.25 else 1.0, 0.0, 1.0, 1e-6)
+        self.assertAlmostEqual(root, 0.25, places=5)
+
+    def test_root_at_limit(self):
+        self.assertEqual(find_root(lambda x: x, 0.0, 1.0), 0.0)
+        self.assertEqual(find_root(lambda x: x - 1, 0.0, 1.0), 1.0)
+
+    def test_known_limits(self):
+        root = find_root(lambda x: x - 0.75, 0.0, 1.0, fa=-0.75, fb=0.25)
+        self.assertAlmostEqual(root, 0.75, places=9)
+
+    def test_invalid_bracket(self):
+        with self.assertRaises(ValueError):
+            find_root(lambda x: x * x + 1, -1.0, 1.0)
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
 from src.celerity.coordinates import convert_equatorial_to_horizontal
 from src.celerity.sun import (
+    SolarState,
     get_angular_diameter,
     get_distance,
     get_ecliptic_longitude,
@@ -10,6 +11,7 @@ from src.celerity.sun import (
     get_equatorial_coordinate,
     get_mean_anomaly,
     get_mean_geometric_longitude,
+    get_solar_state,
     get_true_anomaly,
     get_true_geometric_longitude,
 )
@@ -95,3 +97,15 @@ def test_get_distance():
     date = datetime(2015, 2, 15, 0, 0, 0, 0, tzinfo=timezone.utc)
     d = get_distance(date)
     assert d == 147744945752.45538
+
+
+def test_solar_state():
+    state = SolarState(date)
+    assert state.M == 128.66090142411576
+    assert state.L == 51.96564888161811
+    assert state.C == 1.4754839423594455
+    assert state.ν == 130.1363853664752
+    assert state.equatorial_coordinate == get_equatorial_coordinate(date)
+    assert state.distance == get_distance(date)
+    assert state.angular_diameter == get_angular_diameter(date)
+    assert get_solar_state(date) is get_solar_state(date)
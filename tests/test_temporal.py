@@ -11,7 +11,10 @@ from datetime import datetime, timezone
 from src.celerity.common import GeographicCoordinate
 from src.celerity.constants import J2000
 from src.celerity.temporal import (
+    convert_greenwich_sidereal_time_to_julian_date,
     convert_greenwich_sidereal_time_to_universal_coordinate_time,
+    convert_greenwich_sidereal_times_to_julian_dates,
+    convert_julian_date_to_universal_coordinate_time,
     convert_local_sidereal_time_to_greenwich_sidereal_time,
     get_greenwich_sidereal_time,
     get_julian_centuries,
@@ -141,3 +144,49 @@ def test_convert_greenwich_sidereal_time_to_universal_time():
 
 
 # **************************************************************************************
+
+
+def test_convert_greenwich_sidereal_time_to_julian_date():
+    d = datetime(2021, 5, 14, 23, 30, 0, 0, tzinfo=timezone.utc)
+    GST = get_greenwich_sidereal_time(d)
+    JD = convert_greenwich_sidereal_time_to_julian_date(d, GST)
+    assert abs(JD - get_julian_date(d)) < 1 / 86400
+
+    UTC = convert_greenwich_sidereal_time_to_universal_coordinate_time(d, GST)
+    assert abs(JD - get_julian_date(UTC)) < 1e-3 / 86400
+
+
+# **************************************************************************************
+
+
+def test_convert_greenwich_sidereal_times_to_julian_dates():
+    d = datetime(2021, 5, 14, 0, 0, 0, 0, tzinfo=timezone.utc)
+
+    GSTs = [
+        get_greenwich_sidereal_time(d.replace(hour=hour, minute=15))
+        for hour in range(0, 24, 3)
+    ]
+
+    JDs = convert_greenwich_sidereal_times_to_julian_dates(d, GSTs)
+
+    assert len(JDs) == len(GSTs)
+
+    for GST, JD in zip(GSTs, JDs):
+        assert JD == convert_greenwich_sidereal_time_to_julian_date(d, GST)
+
+
+# **************************************************************************************
+
+
+def test_convert_julian_date_to_universal_coordinate_time():
+    d = datetime(2021, 5, 14, 18, 31, 28, 716000, tzinfo=timezone.utc)
+
+    UTC = convert_julian_date_to_universal_coordinate_time(get_julian_date(d))
+    assert abs((UTC - d).total_seconds()) < 1e-4
+
+    assert convert_julian_date_to_universal_coordinate_time(2451545.0) == datetime(
+        2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc
+    )
+
+
+# **************************************************************************************
@@ -0,0 +1,106 @@
+# **************************************************************************************
+
+# @author         Michael Roberts <michael@observerly.com>
+# @package        @observerly/celerity
+# @license        Copyright © 2021-2026 observerly
+
+# **************************************************************************************
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from math import isnan
+
+import pytest
+
+from src.celerity.astrometry import get_parallactic_angle
+from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
+from src.celerity.coordinates import convert_equatorial_to_horizontal
+from src.celerity.seeing import get_airmass
+from src.celerity.track import get_track, get_track_arrays, get_track_size
+
+# **************************************************************************************
+
+start = datetime(2021, 5, 14, 4, 0, 0, 0, tzinfo=timezone.utc)
+
+end = start + timedelta(hours=26)
+
+step = timedelta(minutes=10)
+
+# **************************************************************************************
+
+observer: GeographicCoordinate = {"latitude": 19.820611, "longitude": -155.468094}
+
+# **************************************************************************************
+
+betelgeuse: EquatorialCoordinate = {"ra": 88.7929583, "dec": 7.4070639}
+
+# **************************************************************************************
+
+
+def test_get_track_size():
+    assert get_track_size(start, end, step) == 157
+    assert get_track_size(start, end - timedelta(seconds=1), step) == 156
+    assert get_track_size(start, start, step) == 1
+    assert get_track_size(end, start, step) == 0
+
+    with pytest.raises(ValueError):
+        get_track_size(start, end, timedelta(0))
+
+
+# **************************************************************************************
+
+
+def test_get_track():
+    track = list(get_track(start, end, step, observer, betelgeuse))
+
+    assert len(track) == 157
+    assert track[0]["date"] == start
+    assert track[-1]["date"] == end
+
+    for point in track:
+        horizontal = convert_equatorial_to_horizontal(
+            point["date"], observer, betelgeuse
+        )
+        assert abs(point["alt"] - horizontal["alt"]) < 1e-5
+        assert abs((point["az"] - horizontal["az"] + 180) % 360 - 180) < 1e-5
+
+        q = get_parallactic_angle(point["date"], observer, betelgeuse)
+        assert abs((point["parallactic_angle"] - q + 180) % 360 - 180) < 1e-5
+
+        if point["alt"] >= 0:
+            assert point["airmass"] == get_airmass(point["alt"])
+        else:
+            assert isnan(point["airmass"])
+
+
+# **************************************************************************************
+
+
+def test_get_track_arrays():
+    track = get_track_arrays(start, end, step, observer, betelgeuse)
+
+    assert len(track.alt) == 157
+
+    for n, point in enumerate(get_track(start, end, step, observer, betelgeuse)):
+        assert track.alt[n] == point["alt"]
+        assert track.az[n] == point["az"]
+        assert track.parallactic_angle[n] == point["parallactic_angle"]
+
+
+# **************************************************************************************
+
+
+def test_get_track_arrays_with_buffers():
+    alt = array("d", [0.0] * 200)
+
+    track = get_track_arrays(start, end, step, observer, betelgeuse, alt=alt)
+
+    # The results should be written into the caller's buffer:
+    assert track.alt is alt
+    assert len(track.az) == 157
+
+    with pytest.raises(ValueError):
+        get_track_arrays(start, end, step, observer, betelgeuse, az=array("d"))
+
+
+# **************************************************************************************
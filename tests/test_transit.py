@@ -1,10 +1,26 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from math import isnan
+from random import Random
 
-from src.celerity.common import EquatorialCoordinate, GeographicCoordinate
+import pytest
+
+from src.celerity.common import (
+    EquatorialArray,
+    EquatorialCoordinate,
+    GeographicCoordinate,
+)
+from src.celerity.coordinates import convert_equatorial_to_horizontal
+from src.celerity.horizon import HorizonMask
+from src.celerity.temporal import get_julian_date
 from src.celerity.transit import (
+    SIDEREAL_DAY,
+    Visibility,
     get_does_object_rise_or_set,
     get_next_rise,
+    get_next_rise_transit_set_times,
     get_next_set,
+    get_rise_transit_set_events,
     get_transit,
     is_object_below_horizon,
     is_object_circumpolar,
@@ -137,3 +153,252 @@ def test_get_next_set():
     assert s["LST"] == 5.410159095756511
     assert s["GST"] == 15.774698695756513
     assert s["az"] == 180.08934814935486
+
+
+def test_get_next_rise_transit_set_times():
+    date = datetime(2021, 5, 14, 21, 0, 0, 0, tzinfo=timezone.utc)
+
+    targets = [betelgeuse, polaris, LMC, {"ra": 317.398, "dec": -88.956}]
+
+    times = get_next_rise_transit_set_times(date, observer, targets)
+
+    assert list(times.visibility) == [
+        Visibility.RISES_AND_SETS,
+        Visibility.CIRCUMPOLAR,
+        Visibility.RISES_AND_SETS,
+        Visibility.NEVER_VISIBLE,
+    ]
+
+    # The rise and set times and azimuths should agree with those of get_next_rise
+    # and get_next_set (to within the millisecond precision of get_julian_date):
+    for i in (0, 2):
+        r = get_next_rise(date, observer, targets[i], 0)
+        assert abs(times.rise[i] - get_julian_date(r["date"])) < 1e-7
+        assert times.R[i] == r["az"]
+
+        s = get_next_set(date, observer, targets[i], 0)
+        assert abs(times.set[i] - get_julian_date(s["date"])) < 1e-7
+        assert times.S[i] == s["az"]
+
+    # The rise and set times are NaN for targets which do not rise and set:
+    for i in (1, 3):
+        assert times.rise[i] != times.rise[i]
+        assert times.set[i] != times.set[i]
+        assert times.R[i] != times.R[i]
+
+    # Every target transits, within a sidereal day of the date:
+    JD = get_julian_date(date)
+
+    for t in times.transit:
+        assert JD <= t < JD + 0.9973
+
+    # By 9pm on May 14, 2021, Betelgeuse has already risen, so it next transits and
+    # sets before it next rises:
+    assert times.transit[0] < times.set[0] < times.rise[0]
+
+    # In the last minutes of a date, an event which has already passed may recur
+    # before the end of the same date, one sidereal day later:
+    date = datetime(2021, 5, 14, 23, 57, 0, 0, tzinfo=timezone.utc)
+
+    ras, decs = [i * 0.36 for i in range(1000)], [i % 120 - 60.0 for i in range(1000)]
+
+    times = get_next_rise_transit_set_times(date, observer, ras, decs)
+
+    JD = get_julian_date(date)
+
+    for column in (times.rise, times.transit, times.set):
+        assert all(JD <= t < JD + SIDEREAL_DAY for t in column if not isnan(t))
+
+
+def test_get_next_rise_transit_set_times_horizon():
+    date = datetime(2021, 5, 14, 21, 0, 0, 0, tzinfo=timezone.utc)
+
+    targets = EquatorialArray([betelgeuse["ra"]], [betelgeuse["dec"]])
+
+    times = get_next_rise_transit_set_times(date, observer, targets)
+
+    raised = get_next_rise_transit_set_times(date, observer, targets, horizon=10)
+
+    # Above a raised horizon, the target rises later and sets earlier, but its
+    # transit is unchanged:
+    assert raised.rise[0] > times.rise[0]
+    assert raised.set[0] < times.set[0]
+    assert raised.transit[0] == times.transit[0]
+
+    # Polaris never rises above a horizon higher than its altitude at transit:
+    times = get_next_rise_transit_set_times(
+        date, observer, [polaris], horizon=90 + latitude - polaris["dec"] + 1
+    )
+    assert times.visibility[0] == Visibility.NEVER_VISIBLE
+
+    with pytest.raises(ValueError):
+        get_next_rise_transit_set_times(date, observer, [1.0, 2.0], [3.0])
+
+
+def test_get_rise_transit_set_events():
+    date = datetime(2021, 5, 14, 21, 0, 0, 0, tzinfo=timezone.utc)
+
+    # A month of events, i.e., ~30 of each of rise, transit and set:
+    events = list(islice(get_rise_transit_set_events(date, observer, betelgeuse), 90))
+
+    # By 9pm on May 14, 2021, Betelgeuse has already risen:
+    assert [e["event"] for e in events[:6]] == [
+        "transit",
+        "set",
+        "rise",
+        "transit",
+        "set",
+        "rise",
+    ]
+
+    assert all(a["JD"] < b["JD"] for a, b in zip(events, events[1:]))
+    assert all(e["date"] >= date for e in events)
+
+    # Each rise and set should agree with that of get_next_rise and get_next_set:
+    for e in events:
+        if e["event"] == "transit":
+            assert e["az"] == 180
+            continue
+
+        get_next = get_next_rise if e["event"] == "rise" else get_next_set
+
+        r = get_next(e["date"] - timedelta(minutes=5), observer, betelgeuse, 0)
+        assert abs((r["date"] - e["date"]).total_seconds()) < 0.01
+        assert r["az"] == e["az"]
+
+    # Circumpolar targets only transit, once per sidereal day:
+    events = list(islice(get_rise_transit_set_events(date, observer, polaris), 3))
+    assert [e["event"] for e in events] == ["transit", "transit", "transit"]
+    assert events[0]["az"] == 0
+    assert abs(events[1]["JD"] - events[0]["JD"] - 0.99726957) < 1e-8
+
+
+def test_get_rise_transit_set_events_order():
+    generator = Random(2021)
+
+    for k in range(200):
+        target = {"ra": generator.uniform(0, 360), "dec": generator.uniform(-60, 60)}
+
+        # Start at random times, as well as in the minutes just before 0h UTC:
+        date = datetime(2021, 5, 14, tzinfo=timezone.utc) + timedelta(
+            minutes=generator.uniform(-8, 0) if k % 2 else generator.uniform(0, 1440)
+        )
+
+        events = list(islice(get_rise_transit_set_events(date, observer, target), 12))
+
+        # The events should be in time order, with the first within a sidereal day:
+        JD = get_julian_date(date)
+        assert JD <= events[0]["JD"] < JD + SIDEREAL_DAY
+        assert all(a["JD"] < b["JD"] for a, b in zip(events, events[1:]))
+
+        # Each kind of event should recur every sidereal day, with none skipped:
+        assert {e["event"] for e in events[:3]} == {"rise", "transit", "set"}
+        for a, b in zip(events, events[3:]):
+            assert a["event"] == b["event"]
+            assert abs(b["JD"] - a["JD"] - SIDEREAL_DAY) < 1e-8
+
+
+def test_is_object_below_horizon_mask():
+    mask = HorizonMask([0, 70, 80, 90, 100, 359], [2, 2, 15, 15, 2, 2])
+
+    assert is_object_below_horizon(date, observer, {"alt": 10, "az": 85}, mask)
+    assert not is_object_below_horizon(date, observer, {"alt": 10, "az": 180}, mask)
+    assert is_object_below_horizon(date, observer, {"alt": 1, "az": 180}, mask)
+
+    # Polaris should be above the mask on May 14, 2021:
+    assert not is_object_below_horizon(date, observer, polaris, mask)
+
+
+def test_get_next_rise_and_set_horizon_mask():
+    date = datetime(2021, 5, 14, 21, 0, 0, 0, tzinfo=timezone.utc)
+
+    # A flat mask should agree with the scalar horizon:
+    flat = HorizonMask([0], [0])
+
+    r, r0 = (
+        get_next_rise(date, observer, betelgeuse, flat),
+        get_next_rise(date, observer, betelgeuse, 0),
+    )
+    assert abs((r["date"] - r0["date"]).total_seconds()) < 1
+    assert abs(r["az"] - r0["az"]) < 1e-6
+    assert abs(r["GST"] - r0["GST"]) < 1e-6
+
+    s, s0 = (
+        get_next_set(date, observer, betelgeuse, flat),
+        get_next_set(date, observer, betelgeuse, 0),
+    )
+    assert abs((s["date"] - s0["date"]).total_seconds()) < 1
+    assert abs(s["az"] - s0["az"]) < 1e-6
+
+    # Betelgeuse rises in the east behind the mountain, and so clears it later:
+    mask = HorizonMask([0, 70, 80, 90, 100, 359], [2, 2, 15, 15, 2, 2])
+
+    r = get_next_rise(date, observer, betelgeuse, mask)
+    assert r["date"] > r0["date"]
+    assert 80 <= r["az"] <= 90
+
+    # At the time of rise, the altitude of Betelgeuse should be that of the mask:
+    hz = convert_equatorial_to_horizontal(r["date"], observer, betelgeuse)
+    assert abs(hz["alt"] - mask.get_altitude(hz["az"])) < 1e-5
+
+    # Betelgeuse sets in the west, where the mask is 2 degrees high, and so sets
+    # earlier than it does below the flat horizon:
+    s = get_next_set(date, observer, betelgeuse, mask)
+    assert s["date"] < s0["date"]
+    hz = convert_equatorial_to_horizontal(s["date"], observer, betelgeuse)
+    assert abs(hz["alt"] - 2) < 1e-5
+
+    # Polaris is always above the mask, and the LMC always below it:
+    assert get_next_rise(date, observer, polaris, mask) is True
+    assert get_next_set(date, observer, polaris, mask) is False
+    assert get_next_rise(date, observer, LMC, mask) is False
+    assert get_next_set(date, observer, LMC, mask) is True
+
+
+def test_get_next_rise_transit_set_times_horizon_mask():
+    date = datetime(2021, 5, 14, 21, 0, 0, 0, tzinfo=timezone.utc)
+
+    mask = HorizonMask([0, 70, 80, 90, 100, 359], [2, 2, 15, 15, 2, 2])
+
+    targets = [betelgeuse, polaris, LMC]
+
+    times = get_next_rise_transit_set_times(date, observer, targets, horizon=mask)
+
+    assert list(times.visibility) == [
+        Visibility.RISES_AND_SETS,
+        Visibility.CIRCUMPOLAR,
+        Visibility.NEVER_VISIBLE,
+    ]
+
+    # The rise and set times and azimuths should agree with those of get_next_rise
+    # and get_next_set for the same mask:
+    r = get_next_rise(date, observer, betelgeuse, mask)
+    assert abs(times.rise[0] - get_julian_date(r["date"])) < 1e-7
+    assert times.R[0] == r["az"]
+
+    s = get_next_set(date, observer, betelgeuse, mask)
+    assert abs(times.set[0] - get_julian_date(s["date"])) < 1e-7
+    assert times.S[0] == s["az"]
+
+    # The transit is unaffected by the mask:
+    assert (
+        times.transit
+        == get_next_rise_transit_set_times(date, observer, targets).transit
+    )
+
+    events = list(
+        islice(get_rise_transit_set_events(date, observer, betelgeuse, mask), 3)
+    )
+    assert [e["event"] for e in events] == ["transit", "set", "rise"]
+    assert events[2]["JD"] == times.rise[0]
+
+    # Polaris lies between the lowest and highest points of a mask which is walled
+    # off to the north, but never rises above the wall:
+    wall = HorizonMask([0, 30, 60, 300, 330], [30, 30, 2, 2, 30])
+    assert is_object_never_visible(observer, polaris, wall)
+    assert not is_object_circumpolar(observer, polaris, wall)
+    assert is_object_circumpolar(observer, polaris, mask)
+    assert not is_object_never_visible(observer, betelgeuse, mask)
+
+    times = get_next_rise_transit_set_times(date, observer, [polaris], horizon=wall)
+    assert times.visibility[0] == Visibility.NEVER_VISIBLE